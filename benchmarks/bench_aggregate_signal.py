@@ -0,0 +1,80 @@
+"""
+Benchmark the per-callback cost of AggregateSignal.
+
+A single constituent signal is updated repeatedly while the total number of
+aggregated signals grows.  The readback calculation is constant-time, so the
+reported cost should stay flat as the signal count increases.
+
+Usage::
+
+    python benchmarks/bench_aggregate_signal.py
+"""
+import argparse
+import timeit
+
+from ophyd import Component as Cpt
+from ophyd import Device
+from ophyd.signal import Signal
+
+from pcdsdevices.signal import AggregateSignal
+
+
+class LastValueSignal(AggregateSignal):
+    """AggregateSignal with a constant-time readback calculation."""
+    _update_only_on_change = False
+
+    def __init__(self, *args, attrs, **kwargs):
+        super().__init__(*args, **kwargs)
+        for attr in attrs:
+            self.add_signal_by_attr_name(attr)
+        self._last = None
+
+    def _insert_value(self, signal, value):
+        self._last = value
+        return super()._insert_value(signal, value)
+
+    def _calc_readback(self):
+        return self._last
+
+
+def make_device(num_signals: int) -> Device:
+    attrs = [f'sig{idx}' for idx in range(num_signals)]
+    components = {attr: Cpt(Signal, value=0) for attr in attrs}
+    components['agg'] = Cpt(LastValueSignal, attrs=attrs)
+    cls = type(f'Aggregate{num_signals}', (Device,), components)
+    return cls(name=f'agg{num_signals}')
+
+
+def bench(num_signals: int, number: int) -> float:
+    """Return the mean callback cost in microseconds."""
+    dev = make_device(num_signals)
+    dev.agg.subscribe(lambda **kwargs: None)
+    for idx in range(num_signals):
+        dev.agg._signal_meta_callback(
+            obj=getattr(dev, f'sig{idx}'), connected=True
+        )
+    # Populate the value cache
+    dev.agg.get()
+    assert dev.agg.connected
+    values = iter(range(number * 10))
+    sig = dev.sig0
+    elapsed = timeit.timeit(lambda: sig.put(next(values)), number=number)
+    return elapsed / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--number', type=int, default=20000,
+                        help='Number of updates per signal count')
+    parser.add_argument('--counts', type=int, nargs='+',
+                        default=[2, 10, 50, 100, 250, 500],
+                        help='Numbers of constituent signals to try')
+    args = parser.parse_args()
+
+    print(f'{"signals":>8} {"us/callback":>12}')
+    for count in args.counts:
+        print(f'{count:>8} {bench(count, args.number):>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
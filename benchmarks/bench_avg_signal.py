@@ -0,0 +1,82 @@
+"""
+Benchmark AvgSignal updates against the size of the averaging window.
+
+For each window size the buffer is filled, then the time per update of the
+source signal is measured for:
+
+* ``nanmean``: the previous implementation, a ring buffer averaged with
+  ``np.nanmean`` on every update.
+* ``mean``: ``AvgSignal`` with only the running mean.
+* ``stats``: ``AvgSignal`` also tracking std, min, max and ema.
+* ``median``: ``AvgSignal`` also tracking the median.
+
+Usage::
+
+    python benchmarks/bench_avg_signal.py --sizes 10 1000 100000
+"""
+import argparse
+import logging
+import time
+
+import numpy as np
+from ophyd.signal import Signal
+
+from pcdsdevices.signal import AvgSignal
+
+
+class NanmeanSignal(Signal):
+    """The previous AvgSignal update, for comparison."""
+
+    def __init__(self, signal, averages, *, name, **kwargs):
+        super().__init__(name=name, **kwargs)
+        self.index = 0
+        self.values = np.full(averages, np.nan)
+        signal.subscribe(self._update_avg)
+
+    def _update_avg(self, *args, value, **kwargs):
+        self.values[self.index] = value
+        self.index = (self.index + 1) % len(self.values)
+        self.put(np.nanmean(self.values))
+
+
+def bench(size: int, repeat: int, kind: str) -> float:
+    """Mean time per update in µs."""
+    raw = Signal(name='raw', value=0.)
+    if kind == 'nanmean':
+        NanmeanSignal(raw, size, name='avg')
+    else:
+        statistics = {
+            'mean': [],
+            'stats': ['std', 'min', 'max', 'ema'],
+            'median': ['median'],
+        }[kind]
+        AvgSignal(raw, size, statistics=statistics, name='avg')
+    values = np.random.default_rng(0).normal(size=size + repeat)
+    for value in values[:size]:
+        raw.put(value)
+    start = time.perf_counter()
+    for value in values[size:]:
+        raw.put(value)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[10, 1000, 100000],
+                        help='Window sizes to try')
+    parser.add_argument('--repeat', type=int, default=2000,
+                        help='Updates to average over per case')
+    args = parser.parse_args()
+    logging.getLogger('pcdsdevices').setLevel(logging.CRITICAL)
+
+    kinds = ('nanmean', 'mean', 'stats', 'median')
+    print(f'{"window":>8} ' + ' '.join(f'{kind:>9}' for kind in kinds)
+          + '   (µs/update)')
+    for size in args.sizes:
+        times = [bench(size, args.repeat, kind) for kind in kinds]
+        print(f'{size:>8} ' + ' '.join(f'{value:>9.1f}' for value in times))
+
+
+if __name__ == '__main__':
+    main()
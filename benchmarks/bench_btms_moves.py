@@ -0,0 +1,77 @@
+"""
+Benchmark checking every BTMS source move against every destination.
+
+A state with every installed source at its own destination, half of them
+with beam, is checked for all (source, destination) pairs two ways:
+
+* ``check_move_all``: one ``BtmsState.check_move_all`` call per pair.
+* ``move_table``: a single ``BtmsState.get_move_table`` call.
+
+Usage::
+
+    python benchmarks/bench_btms_moves.py --repeat 100
+"""
+import argparse
+import logging
+import time
+
+from pcdsdevices.lasers.btms_config import (ALL_DESTINATIONS, BtmsSourceState,
+                                            BtmsState, valid_destinations,
+                                            valid_sources)
+
+
+def make_state() -> BtmsState:
+    return BtmsState(
+        sources={
+            source: BtmsSourceState(
+                source=source,
+                destination=dest,
+                beam_status=bool(idx % 2),
+            )
+            for idx, (source, dest) in enumerate(
+                zip(valid_sources, valid_destinations)
+            )
+        }
+    )
+
+
+def check_all_pairs(state: BtmsState) -> int:
+    return sum(
+        not state.check_move_all(source, None, dest)
+        for source in state.sources
+        for dest in ALL_DESTINATIONS
+    )
+
+
+def check_table(state: BtmsState) -> int:
+    return int(state.get_move_table().allowed.sum())
+
+
+def bench(func, state: BtmsState, repeat: int) -> tuple[float, int]:
+    """Mean time in ms, and number of allowed moves."""
+    allowed = func(state)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(state)
+    return (time.perf_counter() - start) / repeat * 1e3, allowed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=100,
+                        help='Full matrix checks to average over')
+    args = parser.parse_args()
+    logging.getLogger('pcdsdevices').setLevel(logging.CRITICAL)
+
+    state = make_state()
+    pairs = len(state.sources) * len(ALL_DESTINATIONS)
+    print(f'{pairs} (source, destination) pairs')
+    print(f'{"method":>15} {"ms":>8} {"allowed":>8}')
+    for name, func in (('check_move_all', check_all_pairs),
+                       ('move_table', check_table)):
+        elapsed, allowed = bench(func, state, args.repeat)
+        print(f'{name:>15} {elapsed:>8.3f} {allowed:>8}')
+
+
+if __name__ == '__main__':
+    main()
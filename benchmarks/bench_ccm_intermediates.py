@@ -0,0 +1,88 @@
+"""
+Benchmark the CCMEnergy alio callback and its resolution calculation.
+
+Two costs are measured per alio update:
+
+* ``math``: the resolution from the closed-form ``alio_to_intermediates``
+  against the previous finite differences, two extra ``alio_to_energy``
+  calls on top of the theta and wavelength chain.
+* ``callback``: the whole ``CCMEnergy._update_intermediates`` on a fake
+  device, including the puts to the intermediate signals.
+
+Usage::
+
+    python benchmarks/bench_ccm_intermediates.py --updates 10000
+"""
+import argparse
+import logging
+import time
+
+import numpy as np
+from ophyd.sim import fake_device_cache, make_fake_device
+
+from pcdsdevices import ccm
+from pcdsdevices.sim import FastMotor
+
+
+def finite_difference(alio: float, constants: ccm.CCMConstants) -> tuple:
+    """The calculation done by the callback before the closed form."""
+    theta = ccm.alio_to_theta(alio, constants.theta0, constants.gr,
+                              constants.gd)
+    wavelength = ccm.theta_to_wavelength(theta, constants.dspacing)
+    res_delta = 1e-4
+    ref1 = ccm.alio_to_energy(alio - res_delta/2, *constants)
+    ref2 = ccm.alio_to_energy(alio + res_delta/2, *constants)
+    return theta, wavelength, abs((ref1 - ref2) / res_delta)
+
+
+def closed_form(alio: float, constants: ccm.CCMConstants) -> tuple:
+    theta, wavelength, _, resolution = ccm.alio_to_intermediates(
+        alio, *constants)
+    return theta, wavelength, resolution
+
+
+def time_per_call(func, values) -> float:
+    """Mean time per call in us."""
+    start = time.perf_counter()
+    for value in values:
+        func(value)
+    return (time.perf_counter() - start) / len(values) * 1e6
+
+
+def make_energy() -> ccm.CCMEnergy:
+    fake_device_cache[ccm.CCMAlio] = FastMotor
+    energy = make_fake_device(ccm.CCMEnergy)('BENCH:ALIO', name='bench')
+    # Past the start-up grace period of the constant warnings
+    energy._init_time -= 100
+    return energy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--updates', type=int, default=10000,
+                        help='Number of alio updates to time')
+    args = parser.parse_args()
+    logging.getLogger('pcdsdevices').setLevel(logging.CRITICAL)
+
+    alios = list(np.linspace(0, 10, args.updates))
+    energy = make_energy()
+    constants = energy.constants
+
+    old = time_per_call(lambda alio: finite_difference(alio, constants),
+                        alios)
+    new = time_per_call(lambda alio: closed_form(alio, constants), alios)
+    callback = time_per_call(energy._update_intermediates, alios)
+    error = max(
+        abs(finite_difference(alio, constants)[2]
+            - closed_form(alio, constants)[2])
+        for alio in alios[::max(1, len(alios) // 100)]
+    )
+
+    print(f'{"finite differences":>20} {old:>8.2f} us')
+    print(f'{"closed form":>20} {new:>8.2f} us  ({old / new:.1f}x, '
+          f'max resolution difference {error:.2e} eV/um)')
+    print(f'{"whole callback":>20} {callback:>8.2f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark pcdsdevices.utils.convert_unit against the symbolic implementation.
+
+The original implementation ran ``sympy.physics.units.convert_to`` on every
+call.  The current one resolves each unit pair to a cached factor.
+
+Usage::
+
+    python benchmarks/bench_convert_unit.py
+"""
+import argparse
+import timeit
+
+import numpy as np
+import sympy.physics.units as units
+
+from pcdsdevices.utils import convert_unit
+
+PAIRS = [('s', 'ns'), ('ns', 's'), ('seconds', 'ps'), ('meters', 'mm'),
+         ('mm', 'meters')]
+
+
+def sympy_convert_unit(value, unit, new_unit):
+    """The original, fully symbolic convert_unit implementation."""
+    unit = getattr(units, unit)
+    new_unit = getattr(units, new_unit)
+    if unit == new_unit:
+        return value
+    new_value = value * units.convert_to(unit, new_unit)
+    return float(new_value.as_coeff_Mul()[0])
+
+
+def bench(func, unit, new_unit, number):
+    """Return the mean cost of one conversion in microseconds."""
+    elapsed = timeit.timeit(lambda: func(1.2345, unit, new_unit),
+                            number=number)
+    return elapsed / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--number', type=int, default=2000,
+                        help='Number of conversions per unit pair')
+    parser.add_argument('--array-size', type=int, default=100_000,
+                        help='Size of the array for the vectorized case')
+    args = parser.parse_args()
+
+    print(f'{"pair":>16} {"sympy us":>10} {"cached us":>10} {"speedup":>8}')
+    for unit, new_unit in PAIRS:
+        assert (sympy_convert_unit(1.2345, unit, new_unit)
+                == convert_unit(1.2345, unit, new_unit))
+        old = bench(sympy_convert_unit, unit, new_unit, args.number)
+        new = bench(convert_unit, unit, new_unit, args.number)
+        pair = f'{unit}->{new_unit}'
+        print(f'{pair:>16} {old:>10.2f} {new:>10.2f} {old / new:>7.0f}x')
+
+    values = np.random.default_rng(0).uniform(size=args.array_size)
+    elapsed = timeit.timeit(lambda: convert_unit(values, 's', 'ns'),
+                            number=100) / 100
+    print(f'\n{args.array_size} element array s->ns: '
+          f'{elapsed * 1e3:.3f} ms ({elapsed / values.size * 1e9:.2f} '
+          f'ns/element)')
+
+
+if __name__ == '__main__':
+    main()
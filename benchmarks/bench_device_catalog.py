@@ -0,0 +1,232 @@
+"""
+Benchmark import, class construction and instantiation of pcdsdevices.
+
+Classes are gathered from every module under ``pcdsdevices`` and from the
+``device_class`` defaults of the ``happi.containers`` entry point.  For each
+module the standalone import time is measured in a fresh interpreter with
+``python -X importtime``.  For each device class three times are measured:
+
+* ``subclass_s``: defining a trivial subclass, which runs the component
+  machinery and ``__init_subclass__`` hooks such as those of
+  ``BaseInterface`` and ``LightpathMixin``.
+* ``fake_class_s``: ``ophyd.sim.make_fake_device`` on the class.
+* ``instantiate_s``: instantiating the fake class with best-effort
+  arguments, as done in the test suite.
+
+A JSON report is written and the slowest classes are printed.
+
+Usage::
+
+    python benchmarks/bench_device_catalog.py --output catalog.json
+"""
+import argparse
+import concurrent.futures
+import importlib
+import importlib.metadata
+import inspect
+import json
+import logging
+import pkgutil
+import platform
+import subprocess
+import sys
+import time
+
+import ophyd
+from ophyd.sim import make_fake_device
+
+import pcdsdevices
+from pcdsdevices.tests.conftest import best_effort_instantiation
+
+HAPPI_ENTRY_POINT = 'pcdsdevices.happi.containers'
+
+
+def find_modules() -> list[str]:
+    """All pcdsdevices submodule names, excluding the test suite."""
+    return sorted(
+        item.name
+        for item in pkgutil.walk_packages(path=pcdsdevices.__path__,
+                                          prefix='pcdsdevices.')
+        if not item.name.startswith('pcdsdevices.tests')
+        and item.name != 'pcdsdevices._version'
+    )
+
+
+def measure_import(module: str) -> dict:
+    """Import ``module`` in a fresh interpreter and time it."""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True,
+    )
+    result = {'import_s': None}
+    for line in proc.stderr.splitlines():
+        if line.startswith('import time:') and line.split('|')[-1].strip() == module:
+            result['import_s'] = int(line.split('|')[1]) / 1e6
+    if proc.returncode != 0:
+        result['error'] = proc.stderr.strip().splitlines()[-1]
+    return result
+
+
+def happi_device_classes() -> set[str]:
+    """Device class names referenced by the happi container entry point."""
+    containers = None
+    for entry in importlib.metadata.entry_points(group='happi.containers'):
+        if entry.value == HAPPI_ENTRY_POINT:
+            containers = entry.load()
+    if containers is None:
+        # Not installed as a package; use the module directly
+        containers = importlib.import_module(HAPPI_ENTRY_POINT)
+
+    names = set()
+    for _, item in inspect.getmembers(containers, inspect.isclass):
+        device_class = getattr(item, 'device_class', None)
+        default = getattr(device_class, 'default', None)
+        if isinstance(default, str) and default.startswith('pcdsdevices.'):
+            names.add(default)
+    return names
+
+
+def resolve_class(dotted_name: str) -> type:
+    module, _, name = dotted_name.rpartition('.')
+    return getattr(importlib.import_module(module), name)
+
+
+def find_device_classes(modules: list[str],
+                        match: str = '') -> dict[str, type]:
+    """
+    Map of dotted name to device class, from modules and happi.
+
+    Only happi classes defined in a module containing ``match`` are kept,
+    the same filter that selects ``modules``.
+    """
+    classes = {}
+    for module_name in modules:
+        try:
+            module = importlib.import_module(module_name)
+        except Exception:
+            continue
+        for _, obj in inspect.getmembers(module, inspect.isclass):
+            if (issubclass(obj, ophyd.Device)
+                    and obj.__module__.startswith('pcdsdevices')):
+                classes[f'{obj.__module__}.{obj.__name__}'] = obj
+
+    for dotted_name in happi_device_classes():
+        try:
+            cls = resolve_class(dotted_name)
+        except Exception:
+            continue
+        if match not in cls.__module__:
+            continue
+        classes.setdefault(f'{cls.__module__}.{cls.__name__}', cls)
+    return dict(sorted(classes.items()))
+
+
+def measure_class(cls: type) -> dict:
+    """Time subclassing, faking and instantiating one device class."""
+    result = {
+        'subclass_s': None,
+        'fake_class_s': None,
+        'instantiate_s': None,
+    }
+    try:
+        start = time.perf_counter()
+        type(f'Bench{cls.__name__}', (cls,), {'__module__': __name__})
+        result['subclass_s'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        make_fake_device(cls)
+        result['fake_class_s'] = time.perf_counter() - start
+
+        # The fake class is cached now, so this times instantiation
+        start = time.perf_counter()
+        device = best_effort_instantiation(cls, skip_on_failure=False)
+        result['instantiate_s'] = time.perf_counter() - start
+        device.destroy()
+    except BaseException as ex:
+        # pytest's Skipped/Failed derive from BaseException
+        if isinstance(ex, (KeyboardInterrupt, SystemExit)):
+            raise
+        result['error'] = f'{type(ex).__name__}: {ex}'
+    return result
+
+
+def total_time(result: dict) -> float:
+    return sum(result.get(key) or 0.0
+               for key in ('subclass_s', 'fake_class_s', 'instantiate_s'))
+
+
+def print_ranking(title: str, rows: list[tuple[str, float]], top: int):
+    print(f'\n{title}')
+    width = max([len(name) for name, _ in rows[:top]] + [4])
+    for name, seconds in rows[:top]:
+        print(f'  {name:<{width}} {seconds * 1e3:>10.2f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--output', default='device_catalog_benchmark.json',
+                        help='Path of the JSON report')
+    parser.add_argument('--top', type=int, default=25,
+                        help='Number of entries in the ranked tables')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Parallel interpreters for import timing. '
+                        'Values above 1 are faster but inflate the times.')
+    parser.add_argument('--skip-imports', action='store_true',
+                        help='Do not measure per-module import times')
+    parser.add_argument('--match', default='',
+                        help='Only include modules, and classes from '
+                        'modules, containing this text')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Show errors logged by the fake devices')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        # Fake devices with unset signals log plenty of callback errors
+        for logger_name in ('ophyd', 'pcdsdevices'):
+            logging.getLogger(logger_name).setLevel(logging.CRITICAL)
+
+    modules = [name for name in find_modules() if args.match in name]
+
+    module_results = {}
+    if not args.skip_imports:
+        with concurrent.futures.ThreadPoolExecutor(args.jobs) as pool:
+            for name, result in zip(modules,
+                                    pool.map(measure_import, modules)):
+                module_results[name] = result
+
+    class_results = {}
+    for name, cls in find_device_classes(modules, args.match).items():
+        class_results[name] = measure_class(cls)
+
+    report = {
+        'python': platform.python_version(),
+        'pcdsdevices': str(pcdsdevices.__version__),
+        'ophyd': str(ophyd.__version__),
+        'modules': module_results,
+        'classes': class_results,
+    }
+    with open(args.output, 'w') as fd:
+        json.dump(report, fd, indent=2, sort_keys=True)
+
+    if module_results:
+        imports = sorted(
+            ((name, res['import_s']) for name, res in module_results.items()
+             if res['import_s'] is not None),
+            key=lambda row: row[1], reverse=True,
+        )
+        print_ranking('Slowest module imports', imports, args.top)
+
+    totals = sorted(
+        ((name, total_time(res)) for name, res in class_results.items()),
+        key=lambda row: row[1], reverse=True,
+    )
+    print_ranking('Slowest classes (subclass + fake class + instantiate)',
+                  totals, args.top)
+
+    errors = sum('error' in res for res in class_results.values())
+    print(f'\n{len(class_results)} classes, {errors} with errors; '
+          f'report written to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark preset updates against the length of the preset history.
+
+For each history length a preset file is written with one preset whose
+history has that many entries, in both the yaml and the journal formats.
+Two latencies are measured per format:
+
+* ``update``: ``Presets._update``, the part that saves one change.
+* ``add``: ``presets.add_hutch``, which also re-reads the presets.
+
+Usage::
+
+    python benchmarks/bench_presets.py --lengths 10 1000 10000
+"""
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from pcdsdevices.interface import Presets, setup_preset_paths
+from pcdsdevices.sim import FastMotor
+
+
+def make_data(length: int) -> dict:
+    history = {
+        f'{idx:08d}': f'{float(idx):10.4f} comment {idx}'
+        for idx in range(length)
+    }
+    return {'pos': {'value': 1.0, 'active': True, 'history': history}}
+
+
+def write_presets(directory: Path, name: str, length: int, journal: bool):
+    data = make_data(length)
+    if journal:
+        path = directory / (name + Presets._journal_suffix)
+        with open(path, 'w') as fd:
+            Presets._write_journal_snapshot(fd, data)
+    else:
+        path = directory / (name + Presets._yaml_suffix)
+        with open(path, 'w') as fd:
+            yaml.dump(data, fd, default_flow_style=False)
+
+
+def bench(length: int, journal: bool, repeat: int) -> tuple[float, float]:
+    """Mean update and add latencies in ms."""
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        write_presets(directory, 'bench_motor', length, journal)
+        setup_preset_paths(hutch=directory)
+        motor = FastMotor(name='bench_motor')
+
+        start = time.perf_counter()
+        for idx in range(repeat):
+            motor.presets._update('hutch', 'pos', value=float(idx))
+        update = (time.perf_counter() - start) / repeat
+
+        start = time.perf_counter()
+        for idx in range(repeat):
+            motor.presets.add_hutch('pos', float(idx))
+        add = (time.perf_counter() - start) / repeat
+        setup_preset_paths()
+    return update * 1e3, add * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--lengths', type=int, nargs='+',
+                        default=[10, 100, 1000, 10000],
+                        help='History lengths to try')
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='Updates to average over per case')
+    args = parser.parse_args()
+    logging.getLogger('pcdsdevices').setLevel(logging.CRITICAL)
+
+    print(f'{"history":>8} {"yaml update":>12} {"journal update":>15} '
+          f'{"yaml add":>9} {"journal add":>12}   (ms)')
+    for length in args.lengths:
+        yaml_update, yaml_add = bench(length, False, args.repeat)
+        journal_update, journal_add = bench(length, True, args.repeat)
+        print(f'{length:>8} {yaml_update:>12.2f} {journal_update:>15.2f} '
+              f'{yaml_add:>9.2f} {journal_add:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
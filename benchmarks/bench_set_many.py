@@ -0,0 +1,76 @@
+"""
+Benchmark the aggregate status returned by pcdsdevices.utils.set_many.
+
+Compares the flat ``AllStatus`` used by ``set_many`` against the previous
+approach of folding the statuses into a chain of ``ophyd.status.AndStatus``.
+Each case times creating the aggregate over N pending statuses and then
+finishing all of the children.
+
+Usage::
+
+    python benchmarks/bench_set_many.py
+"""
+import argparse
+import sys
+import time
+from functools import reduce
+
+from ophyd.signal import Signal
+from ophyd.status import AndStatus, Status
+
+from pcdsdevices.utils import AllStatus, set_many
+
+
+def and_chain(statuses):
+    return reduce(AndStatus, statuses)
+
+
+def bench_aggregate(factory, num: int, repeat: int) -> float:
+    """Best time in ms to aggregate and finish ``num`` statuses."""
+    best = float('inf')
+    for _ in range(repeat):
+        children = [Status() for _ in range(num)]
+        start = time.perf_counter()
+        status = factory(children)
+        for child in children:
+            child.set_finished()
+        status.wait(timeout=60)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def bench_set_many(num: int, repeat: int) -> float:
+    """Best time in ms for set_many on ``num`` soft signals."""
+    signals = [Signal(name=f'sig{idx}') for idx in range(num)]
+    best = float('inf')
+    for value in range(repeat):
+        start = time.perf_counter()
+        set_many({sig: value for sig in signals}).wait(timeout=60)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--counts', type=int, nargs='+',
+                        default=[1, 100, 1000],
+                        help='Numbers of signals to try')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Repetitions per case; the best is reported')
+    args = parser.parse_args()
+
+    # Deep AndStatus chains recurse through every level
+    sys.setrecursionlimit(max(sys.getrecursionlimit(),
+                              10 * max(args.counts)))
+
+    print(f'{"signals":>8} {"AndStatus ms":>13} {"AllStatus ms":>13} '
+          f'{"set_many ms":>12}')
+    for num in args.counts:
+        chain = bench_aggregate(and_chain, num, args.repeat)
+        flat = bench_aggregate(AllStatus, num, args.repeat)
+        full = bench_set_many(num, args.repeat)
+        print(f'{num:>8} {chain:>13.3f} {flat:>13.3f} {full:>12.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark serial and concurrent status_info collection.
+
+Builds a device with N signals whose reads take a fixed latency, with a
+few of them hanging for much longer, and times ``status_info`` with the
+default serial walk against the concurrent mode enabled by
+``BaseInterface.status_info_workers``.
+
+Usage::
+
+    python benchmarks/bench_status_info.py --signals 50 --latency 0.02
+"""
+import argparse
+import time
+
+import ophyd
+from ophyd import Component as Cpt
+
+from pcdsdevices.interface import STATUS_TIMEOUT, BaseInterface
+
+
+class LatencySignal(ophyd.Signal):
+    """Soft signal whose get takes ``latency`` seconds."""
+    latency = 0.0
+
+    def get(self, **kwargs):
+        time.sleep(self.latency)
+        return super().get(**kwargs)
+
+
+def make_device(num: int, latency: float, hung: int, hang: float):
+    components = {
+        f'sig{idx}': Cpt(LatencySignal, value=idx) for idx in range(num)
+    }
+    cls = type('BenchStatusDevice', (BaseInterface, ophyd.Device),
+               components)
+    device = cls(name='bench')
+    for idx in range(num):
+        sig = getattr(device, f'sig{idx}')
+        sig.latency = hang if idx < hung else latency
+    return device
+
+
+def run(device, workers, timeout: float) -> tuple[float, int]:
+    """Wall time in seconds and number of TIMEOUT values."""
+    device.status_info_workers = workers
+    device.status_info_timeout = timeout
+    start = time.perf_counter()
+    info = device.status_info()
+    elapsed = time.perf_counter() - start
+    timeouts = sum(
+        value.get('value') == STATUS_TIMEOUT
+        for value in info.values() if isinstance(value, dict)
+    )
+    return elapsed, timeouts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--signals', type=int, default=50,
+                        help='Number of signals on the device')
+    parser.add_argument('--latency', type=float, default=0.02,
+                        help='Seconds taken by each normal read')
+    parser.add_argument('--hung', type=int, default=2,
+                        help='Number of signals that hang')
+    parser.add_argument('--hang', type=float, default=1.0,
+                        help='Seconds taken by each hung read')
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=[4, 8, 16],
+                        help='Pool sizes to try in concurrent mode')
+    parser.add_argument('--timeout', type=float, default=0.2,
+                        help='Per-signal timeout in concurrent mode')
+    args = parser.parse_args()
+
+    device = make_device(args.signals, args.latency, args.hung, args.hang)
+    print(f'{"mode":>12} {"wall s":>8} {"speedup":>8} {"timeouts":>9}')
+    serial, _ = run(device, None, args.timeout)
+    print(f'{"serial":>12} {serial:>8.3f} {1:>8.1f} {0:>9}')
+    for workers in args.workers:
+        elapsed, timeouts = run(device, workers, args.timeout)
+        print(f'{f"{workers} workers":>12} {elapsed:>8.3f} '
+              f'{serial / elapsed:>8.1f} {timeouts:>9}')
+
+
+if __name__ == '__main__':
+    main()
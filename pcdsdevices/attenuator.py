@@ -8,7 +8,6 @@ import time
 from typing import Generator
 
 import numpy as np
-import prettytable
 from lightpath import LightpathState
 from ophyd.device import Component as Cpt
 from ophyd.device import Device
@@ -30,11 +29,12 @@ from .pmps import TwinCATStatePMPS
 from .pv_positioner import PVPositionerNoInterrupt
 from .signal import InternalSignal, MultiDerivedSignal, MultiDerivedSignalRO
 from .type_hints import OphydDataType, SignalToValue
-from .utils import get_status_float, get_status_value
+from .utils import LazyModule, get_status_float, get_status_value
 from .valve import VCN, VVC
 from .variety import set_metadata
 
 logger = logging.getLogger(__name__)
+prettytable = LazyModule('prettytable')
 MAX_FILTERS = 12
 
 
@@ -1049,24 +1049,15 @@ class AttenuatorSXR_Ladder(FltMvInterface, PVPositionerPC,
         self.calculator.run_calculation.put(1, wait=True)
         return super()._setup_move(position)
 
-    def get_lightpath_state(self, use_cache=True) -> LightpathState:
+    def _lightpath_kwarg_name(self, sig: Signal) -> str:
         """
-        Grab slightly different PV values for use in same inout calc fn
+        Grab slightly different names for use in same inout calc fn
         The state is nested one device deeper than LightpathInOutCptMixin
         expects.
         """
-        if (not use_cache) or (self._cached_state is None):
-            lightpath_kwargs = {}
-            lp_sigs = self.lightpath_summary._signals.keys()
-            for sig in lp_sigs:
-                # want to get name of blade_0x from dev_blade_0x_state_state
-                cpt_name = sig.name.removeprefix(self.name + '_')
-                cpt_name = cpt_name.removesuffix('_state_state')
-                lightpath_kwargs[cpt_name] = sig.get()
-
-            self._cached_state = self.calc_lightpath_state(**lightpath_kwargs)
-
-        return self._cached_state
+        # want to get name of blade_0x from dev_blade_0x_state_state
+        cpt_name = sig.name.removeprefix(self.name + '_')
+        return cpt_name.removesuffix('_state_state')
 
     def calc_lightpath_state(self, **lightpath_kwargs) -> LightpathState:
         # Repeat lightpath logic to extract num_in, num_out
@@ -1220,24 +1211,15 @@ class AttenuatorSXR_LadderTwoBladeLBD(FltMvInterface, PVPositionerPC,
         self.calculator.run_calculation.put(1, wait=True)
         return super()._setup_move(position)
 
-    def get_lightpath_state(self, use_cache=True) -> LightpathState:
+    def _lightpath_kwarg_name(self, sig: Signal) -> str:
         """
-        Grab slightly different PV values for use in same inout calc fn
+        Grab slightly different names for use in same inout calc fn
         The state is nested one device deeper than LightpathInOutCptMixin
         expects.
         """
-        if (not use_cache) or (self._cached_state is None):
-            lightpath_kwargs = {}
-            lp_sigs = self.lightpath_summary._signals.keys()
-            for sig in lp_sigs:
-                # want to get name of blade_0x from dev_blade_0x_state_state
-                cpt_name = sig.name.removeprefix(self.name + '_')
-                cpt_name = cpt_name.removesuffix('_state_state')
-                lightpath_kwargs[cpt_name] = sig.get()
-
-            self._cached_state = self.calc_lightpath_state(**lightpath_kwargs)
-
-        return self._cached_state
+        # want to get name of blade_0x from dev_blade_0x_state_state
+        cpt_name = sig.name.removeprefix(self.name + '_')
+        return cpt_name.removesuffix('_state_state')
 
     def calc_lightpath_state(self, **lightpath_kwargs) -> LightpathState:
         # Repeat lightpath logic to extract num_in, num_out
@@ -1573,24 +1555,15 @@ class AT2L0(FltMvInterface, PVPositionerPC, LightpathMixin):
         limits = limits or (0.0, 1.0)
         super().__init__(*args, limits=limits, **kwargs)
 
-    def get_lightpath_state(self, use_cache: bool = True) -> LightpathState:
+    def _lightpath_kwarg_name(self, sig: Signal) -> str:
         """
-        Grab slightly different PV values for use in same inout calc fn
+        Grab slightly different names for use in same inout calc fn
         The state is nested one device deeper than LightpathInOutCptMixin
         expects.
         """
-        if (not use_cache) or (self._cached_state is None):
-            lightpath_kwargs = {}
-            lp_sigs = self.lightpath_summary._signals.keys()
-            for sig in lp_sigs:
-                # want to get name of blade_0x from dev_blade_0x_state_state
-                cpt_name = sig.name.removeprefix(self.name + '_')
-                cpt_name = cpt_name.removesuffix('_state_state')
-                lightpath_kwargs[cpt_name] = sig.get()
-
-            self._cached_state = self.calc_lightpath_state(**lightpath_kwargs)
-
-        return self._cached_state
+        # want to get name of blade_0x from dev_blade_0x_state_state
+        cpt_name = sig.name.removeprefix(self.name + '_')
+        return cpt_name.removesuffix('_state_state')
 
     def calc_lightpath_state(self, **lightpath_kwargs) -> LightpathState:
         # Repeat lightpath logic to extract num_in, num_out
@@ -25,6 +25,8 @@ from .utils import doc_format_decorator, get_status_float
 
 logger = logging.getLogger(__name__)
 
+ArrayOrFloat = typing.Union[float, np.ndarray]
+
 # Constants
 si_111_dspacing = 3.1356011499587773
 si_511_dspacing = 1.0452003833195924
@@ -36,6 +38,14 @@ default_dspacing = si_111_dspacing
 default_gr = 3.175
 default_gd = 231.303
 
+CCMConstants = namedtuple('CCMConstants', ['theta0', 'dspacing', 'gr', 'gd'])
+CCMConstants.__doc__ = """
+Snapshot of the CCM calculation constants.
+
+theta0 is in rad, dspacing in A, gr and gd in mm. See
+`CCMConstantsMixin.constants`.
+"""
+
 
 class CCMMotor(PVPositionerIsClose):
     """
@@ -183,6 +193,8 @@ class CCMConstantsMixin(Device):
     _initialized_signal_names: set
     _prev_warnings: list[CCMConstantWarning]
     _init_time: float
+    _constants: typing.Optional[CCMConstants]
+    _constants_checked: bool
 
     def __init__(self, prefix: str, *args, **kwargs):
         if 'XPP' in prefix:
@@ -198,6 +210,8 @@ class CCMConstantsMixin(Device):
         self._initialized_signal_names = set()
         self._prev_warnings = [CCMConstantWarning.NO_WARNING] * 4
         self._init_time = time.monotonic()
+        self._constants = None
+        self._constants_checked = False
         super().__init__(prefix, *args, **kwargs)
 
     @theta0_deg.sub_value
@@ -225,6 +239,50 @@ class CCMConstantsMixin(Device):
         elif obj is self.gd:
             self._gd = value
         self._initialized_signal_names.add(obj.name)
+        self._constants = None
+        self._constants_checked = False
+
+    @theta0_deg.sub_meta
+    @dspacing.sub_meta
+    @gr.sub_meta
+    @gd.sub_meta
+    def _update_constant_meta(self, **kwargs) -> None:
+        """
+        Check the constants again when a constant PV (dis)connects.
+        """
+        self._constants_checked = False
+
+    @property
+    def constants(self) -> CCMConstants:
+        """
+        Snapshot of the constants currently used in calculations.
+
+        This bundles theta0_rad_val, dspacing_val, gr_val and gd_val. It is
+        computed once and reused until one of the constant PVs updates.
+        """
+        if self._constants is None:
+            self._constants = CCMConstants(
+                theta0=self.theta0_rad_val,
+                dspacing=self.dspacing_val,
+                gr=self.gr_val,
+                gd=self.gd_val,
+            )
+        return self._constants
+
+    def _check_constants(self) -> None:
+        """
+        Call warn_invalid_constants(only_new=True) if it could say anything.
+
+        Its warnings only change when a constant PV updates or
+        (dis)connects, so the check is skipped until then.
+        """
+        if self._constants_checked:
+            return
+        self.warn_invalid_constants(only_new=True)
+        self._constants_checked = (
+            self._enable_warn_constants
+            and time.monotonic() - self._init_time >= 10
+        )
 
     @property
     def theta0_deg_val(self) -> float:
@@ -573,21 +631,14 @@ class CCMEnergy(FltMvInterface, PseudoPositioner, CCMConstantsMixin):
         """
         if value is None:
             return
-        self.warn_invalid_constants(only_new=True)
-        theta = alio_to_theta(
+        self._check_constants()
+        theta, wavelength, _, resolution = alio_to_intermediates(
             value,
-            self.theta0_rad_val,
-            self.gr_val,
-            self.gd_val,
+            *self.constants,
         )
-        wavelength = theta_to_wavelength(theta, self.dspacing_val)
         self.theta_deg.put(theta * 180/np.pi, force=True)
         self.wavelength.put(wavelength, force=True)
-
-        res_delta = 1e-4
-        ref1 = self.alio_to_energy(value - res_delta/2)
-        ref2 = self.alio_to_energy(value + res_delta/2)
-        self.resolution.put(abs((ref1 - ref2) / res_delta), force=True)
+        self.resolution.put(resolution, force=True)
 
     def forward(self, pseudo_pos: namedtuple) -> namedtuple:
         """
@@ -611,55 +662,41 @@ class CCMEnergy(FltMvInterface, PseudoPositioner, CCMConstantsMixin):
         energy = self.alio_to_energy(alio)
         return self.PseudoPosition(energy=energy)
 
-    def energy_to_alio(self, energy: float) -> float:
+    def energy_to_alio(self, energy: ArrayOrFloat) -> ArrayOrFloat:
         """
         Converts energy to alio.
 
         Parameters
         ----------
-        energy : float
-            The photon energy (color) in keV.
+        energy : float or array
+            The photon energy (color) in keV, or an array of them to
+            convert in one go.
 
         Returns
         -------
-        alio : float
+        alio : float or array
             The alio position in mm
         """
-        self.warn_invalid_constants(only_new=True)
-        wavelength = energy_to_wavelength(energy)
-        theta = wavelength_to_theta(wavelength, self.dspacing_val)
-        alio = theta_to_alio(
-            theta,
-            self.theta0_rad_val,
-            self.gr_val,
-            self.gd_val,
-        )
-        return alio
+        self._check_constants()
+        return energy_to_alio(energy, *self.constants)
 
-    def alio_to_energy(self, alio: float) -> float:
+    def alio_to_energy(self, alio: ArrayOrFloat) -> ArrayOrFloat:
         """
         Converts alio to energy.
 
         Parameters
         ----------
-        alio : float
-            The alio position in mm
+        alio : float or array
+            The alio position in mm, or an array of them to convert in one
+            go.
 
         Returns
         -------
-        energy : float
+        energy : float or array
             The photon energy (color) in keV.
         """
-        self.warn_invalid_constants(only_new=True)
-        theta = alio_to_theta(
-            alio,
-            self.theta0_rad_val,
-            self.gr_val,
-            self.gd_val,
-        )
-        wavelength = theta_to_wavelength(theta, self.dspacing_val)
-        energy = wavelength_to_energy(wavelength)
-        return energy
+        self._check_constants()
+        return alio_to_energy(alio, *self.constants)
 
     def set_current_position(self, energy: float) -> None:
         """
@@ -667,14 +704,15 @@ class CCMEnergy(FltMvInterface, PseudoPositioner, CCMConstantsMixin):
 
         This changes the value of the theta0 PV.
         """
-        self.warn_invalid_constants(only_new=True)
+        self._check_constants()
+        constants = self.constants
         wavelength = energy_to_wavelength(energy)
-        theta_rad_calc = wavelength_to_theta(wavelength, self.dspacing_val)
+        theta_rad_calc = wavelength_to_theta(wavelength, constants.dspacing)
         theta_rad_no_offset = alio_to_theta(
             self.alio.position,
             theta0=0,
-            gr=self.gr_val,
-            gd=self.gd_val,
+            gr=constants.gr,
+            gd=constants.gd,
         )
         new_theta0_rad = theta_rad_calc - theta_rad_no_offset
         new_theta0_deg = new_theta0_rad * 180 / np.pi
@@ -1140,7 +1178,13 @@ class CCM(BaseInterface, GroupDevice, LightpathMixin, CCMConstantsMixin):
 
 
 # Calculations between alio position and energy, with all intermediates.
-def theta_to_alio(theta: float, theta0: float, gr: float, gd: float) -> float:
+# These all work on numpy arrays as well as on floats.
+def theta_to_alio(
+    theta: ArrayOrFloat,
+    theta0: float,
+    gr: float,
+    gd: float,
+) -> ArrayOrFloat:
     """
     Converts theta angle (rad) to alio position (mm).
 
@@ -1159,11 +1203,16 @@ def theta_to_alio(theta: float, theta0: float, gr: float, gd: float) -> float:
     x = f(Delta_Theta) = D * tan(Delta_Theta)+(R/cos(Delta_Theda))-R
     Note that for ∆θ = 0, x = R
     """
-    t_rad = theta - theta0
+    t_rad = np.asarray(theta) - theta0
     return gr * (1 / np.cos(t_rad) - 1) + gd * np.tan(t_rad)
 
 
-def alio_to_theta(alio: float, theta0: float, gr: float, gd: float) -> float:
+def alio_to_theta(
+    alio: ArrayOrFloat,
+    theta0: float,
+    gr: float,
+    gd: float,
+) -> ArrayOrFloat:
     """
     Converts alio position (mm) to theta angle (rad).
 
@@ -1171,26 +1220,96 @@ def alio_to_theta(alio: float, theta0: float, gr: float, gd: float) -> float:
     theta_angle = f(x) = 2arctan * [(sqrt(x^2 + D^2 + 2Rx) - D)/(2R + x)]
     Note that for x = −R, θ = 2 arctan(−R/D)
     """
+    alio = np.asarray(alio)
     return theta0 + 2 * np.arctan(
         (np.sqrt(alio ** 2 + gd ** 2 + 2 * gr * alio) - gd) / (2 * gr + alio)
     )
 
 
-def wavelength_to_theta(wavelength: float, dspacing: float) -> float:
+def wavelength_to_theta(
+    wavelength: ArrayOrFloat,
+    dspacing: float,
+) -> ArrayOrFloat:
     """Converts wavelength (A) to theta angle (rad)."""
     return np.arcsin(wavelength/2/dspacing)
 
 
-def theta_to_wavelength(theta: float, dspacing: float) -> float:
+def theta_to_wavelength(theta: ArrayOrFloat, dspacing: float) -> ArrayOrFloat:
     """Converts theta angle (rad) to wavelength (A)."""
     return 2*dspacing*np.sin(theta)
 
 
-def energy_to_wavelength(energy: float) -> float:
+def energy_to_wavelength(energy: ArrayOrFloat) -> ArrayOrFloat:
     """Converts photon energy (keV) to wavelength (A)."""
-    return 12.39842/energy
+    return 12.39842/np.asarray(energy)
 
 
-def wavelength_to_energy(wavelength: float) -> float:
+def wavelength_to_energy(wavelength: ArrayOrFloat) -> ArrayOrFloat:
     """Converts wavelength (A) to photon energy (keV)."""
-    return 12.39842/wavelength
+    return 12.39842/np.asarray(wavelength)
+
+
+def energy_to_alio(
+    energy: ArrayOrFloat,
+    theta0: float,
+    dspacing: float,
+    gr: float,
+    gd: float,
+) -> ArrayOrFloat:
+    """
+    Converts photon energy (keV) to alio position (mm).
+
+    The constants are in the order of `CCMConstants`, so a snapshot can be
+    passed as ``energy_to_alio(energy, *ccm.constants)``.
+    """
+    theta = wavelength_to_theta(energy_to_wavelength(energy), dspacing)
+    return theta_to_alio(theta, theta0, gr, gd)
+
+
+def alio_to_energy(
+    alio: ArrayOrFloat,
+    theta0: float,
+    dspacing: float,
+    gr: float,
+    gd: float,
+) -> ArrayOrFloat:
+    """
+    Converts alio position (mm) to photon energy (keV).
+
+    The constants are in the order of `CCMConstants`, so a snapshot can be
+    passed as ``alio_to_energy(alio, *ccm.constants)``.
+    """
+    theta = alio_to_theta(alio, theta0, gr, gd)
+    return wavelength_to_energy(theta_to_wavelength(theta, dspacing))
+
+
+def alio_to_intermediates(
+    alio: ArrayOrFloat,
+    theta0: float,
+    dspacing: float,
+    gr: float,
+    gd: float,
+) -> tuple[ArrayOrFloat, ArrayOrFloat, ArrayOrFloat, ArrayOrFloat]:
+    """
+    Converts alio position (mm) to theta, wavelength, energy and resolution.
+
+    This is `alio_to_energy` keeping the intermediates, plus the
+    resolution abs(dE/dalio) in keV/mm, or eV/um, from the derivative of
+    `theta_to_alio`:
+
+    dalio/dTheta_B = (D + R sin(Delta_Theta)) / cos(Delta_Theta)^2
+    dE/dTheta_B = -E / tan(Theta_B)
+
+    Returns
+    -------
+    theta, wavelength, energy, resolution : tuple
+        The angle in rad, the wavelength in A, the energy in keV and the
+        resolution in eV/um.
+    """
+    theta = alio_to_theta(alio, theta0, gr, gd)
+    wavelength = theta_to_wavelength(theta, dspacing)
+    energy = wavelength_to_energy(wavelength)
+    t_rad = theta - theta0
+    dtheta_dalio = np.cos(t_rad) ** 2 / (gd + gr * np.sin(t_rad))
+    resolution = np.abs(energy / np.tan(theta) * dtheta_dalio)
+    return theta, wavelength, energy, resolution
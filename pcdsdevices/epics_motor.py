@@ -21,7 +21,6 @@ from ophyd.status import wait as status_wait
 from ophyd.utils import LimitError
 from ophyd.utils.epics_pvs import raise_if_disconnected
 from pcdsutils.ext_scripts import get_hutch_name
-from prettytable import PrettyTable
 
 from pcdsdevices.pv_positioner import (PVPositionerComparator,
                                        PVPositionerIsClose)
@@ -33,10 +32,11 @@ from .interface import FltMvInterface
 from .pseudopos import OffsetMotorBase, delay_class_factory
 from .registry import device_registry
 from .signal import EpicsSignalEditMD, EpicsSignalROEditMD, PytmcSignal
-from .utils import get_status_float, get_status_value
+from .utils import LazyModule, get_status_float, get_status_value
 from .variety import set_metadata
 
 logger = logging.getLogger(__name__)
+prettytable = LazyModule('prettytable')
 
 
 class MstaEnum(Enum):
@@ -1037,7 +1037,7 @@ class IMS(PCDSMotorBase):
 
         Returns
         -------
-        diff : PrettyTable
+        diff : prettytable.PrettyTable
             A table with headers "Parameter", "Actual", and "Configuration",
             showing the differences between the live values and the configured
             values.
@@ -1047,7 +1047,7 @@ class IMS(PCDSMotorBase):
         IMS._setup_and_check_pmgr()
 
         d = self._pm.diff_config(self.prefix, cfgname)
-        table = PrettyTable()
+        table = prettytable.PrettyTable()
         table.field_names = ["Parameter", "Actual", "Configuration"]
         for key, value in d.items():
             actual = value[0]
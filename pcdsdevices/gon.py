@@ -7,7 +7,6 @@ import numpy as np
 from ophyd import FormattedComponent as FCpt
 from ophyd.device import Component as Cpt
 from ophyd.status import DeviceStatus
-from prettytable import PrettyTable
 
 from .device import GroupDevice
 from .epics_motor import IMS
@@ -15,9 +14,10 @@ from .interface import BaseInterface
 from .pseudopos import (PseudoPositioner, PseudoSingleInterface,
                         pseudo_position_argument, real_position_argument)
 from .sim import FastMotor
-from .utils import get_status_float, get_status_value
+from .utils import LazyModule, get_status_float, get_status_value
 
 logger = logging.getLogger(__name__)
+prettytable = LazyModule('prettytable')
 
 
 class BaseGon(BaseInterface, GroupDevice):
@@ -288,6 +288,106 @@ class KappaMoveAbort(ValueError):
     pass
 
 
+def kappa_to_spherical(eta, kappa, phi, kappa_ang=50, flipped=False):
+    """
+    Convert from native kappa coordinates to spherical coordinates.
+
+    This is the calculation behind `Kappa.k_to_e`, without any live values.
+    All angles are in degrees, and arrays of positions are converted
+    element-wise.
+
+    Parameters
+    ----------
+    eta : number or np.ndarray
+        Eta motor position.
+    kappa : number or np.ndarray
+        Kappa motor position.
+    phi : number or np.ndarray
+        Phi motor position.
+    kappa_ang : number, optional
+        The angle of the kappa motor relative to the eta motor.
+    flipped : bool, optional
+        True if the kappa motor is flipped, i.e. above 180 degrees.
+
+    Returns
+    -------
+    coordinates : tuple
+        Spherical coordinates (e_eta, e_chi, e_phi).
+    """
+    eta = np.asarray(eta, dtype=float)
+    kappa = np.asarray(kappa, dtype=float)
+    phi = np.asarray(phi, dtype=float)
+
+    kappa_ang = kappa_ang * np.pi / 180
+    delta = np.arctan(np.tan(kappa * np.pi / 180 / 2)
+                      * np.cos(kappa_ang))
+
+    e_eta = -eta * np.pi / 180 - delta
+    e_chi = 2 * np.arcsin(np.sin(kappa * np.pi / 180 / 2)
+                          * np.sin(kappa_ang))
+    e_phi = -phi * np.pi / 180 - delta
+
+    # Phase shift for flipped kappa
+    if flipped:
+        e_eta = np.pi - e_eta
+        e_phi = phi * np.pi / 180 - delta
+
+    e_eta = e_eta * 180 / np.pi
+    e_chi = e_chi * 180 / np.pi
+    e_phi = e_phi * 180 / np.pi
+    return e_eta[()], e_chi[()], e_phi[()]
+
+
+def spherical_to_kappa(e_eta, e_chi, e_phi, kappa_ang=50, flipped=False):
+    """
+    Convert from spherical coordinates to the native kappa coordinates.
+
+    This is the calculation behind `Kappa.e_to_k`, without any live values.
+    All angles are in degrees, and arrays of positions are converted
+    element-wise.
+
+    Parameters
+    ----------
+    e_eta : number or np.ndarray
+        e_eta pseudo motor's spherical coordinate
+    e_chi : number or np.ndarray
+        e_chi pseudo motor's spherical coordinate
+    e_phi : number or np.ndarray
+        e_phi pseudo motor's spherical coordinate
+    kappa_ang : number, optional
+        The angle of the kappa motor relative to the eta motor.
+    flipped : bool, optional
+        True if the kappa motor is flipped, i.e. above 180 degrees.
+
+    Returns
+    -------
+    coordinates : tuple
+        Native kappa coordinates (eta, kappa, phi).
+    """
+    e_eta = np.asarray(e_eta, dtype=float)
+    e_chi = np.asarray(e_chi, dtype=float)
+    e_phi = np.asarray(e_phi, dtype=float)
+
+    kappa_ang = kappa_ang * np.pi / 180
+    delta = np.arcsin(-np.tan(e_chi * np.pi / 180 / 2)
+                      / np.tan(kappa_ang))
+    k_eta = -(e_eta * np.pi / 180 - delta)
+    k_kap = 2 * np.arcsin(np.sin(e_chi * np.pi / 180 / 2)
+                          / np.sin(kappa_ang))
+    k_phi = e_phi * np.pi / 180 - delta
+
+    # Phase shift for flipped kappa
+    if flipped:
+        k_eta = -k_eta - np.pi
+        k_kap = 2 * np.pi - k_kap
+        k_phi = -e_phi * np.pi / 180 - delta
+
+    k_eta = k_eta * 180 / np.pi
+    k_kap = k_kap * 180 / np.pi
+    k_phi = -k_phi * 180 / np.pi
+    return k_eta[()], k_kap[()], k_phi[()]
+
+
 class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
     """
     Kappa stage, control the Kappa diffractometer in spherical coordinates.
@@ -375,7 +475,8 @@ class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
     # Only stage the motors involved in the coordinate transform
     stage_group = [eta, kappa, phi]
     tab_component_names = True
-    tab_whitelist = ['stop', 'wait', 'k_to_e', 'e_to_k', 'check_motor_step']
+    tab_whitelist = ['stop', 'wait', 'k_to_e', 'e_to_k', 'e_to_k_path',
+                     'check_motor_step']
 
     def __init__(self, *, name, prefix_x, prefix_y, prefix_z,
                  prefix_eta, prefix_kappa, prefix_phi, eta_max_step=2,
@@ -423,15 +524,16 @@ class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
         """
         Convert from native kappa coordinates to spherical coordinates.
 
-        If a parameter is left as None, use the live value.
+        If a parameter is left as None, use the live value. Arrays of
+        positions are converted element-wise, see `kappa_to_spherical`.
 
         Parameters
         ----------
-        eta : number
+        eta : number or np.ndarray
             Eta motor position.
-        kappa : number
+        kappa : number or np.ndarray
             Kappa motor position.
-        phi : number
+        phi : number or np.ndarray
             Phi motor position.
 
         Returns
@@ -439,46 +541,30 @@ class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
         coordinates : tuple
             Spherical coordinates.
         """
+        current = self.real_position
         if eta is None:
-            eta = self.eta.position
+            eta = current.eta
         if kappa is None:
-            kappa = self.kappa.position
+            kappa = current.kappa
         if phi is None:
-            phi = self.phi.position
-
-        kappa_ang = self.kappa_ang * np.pi / 180
-        delta = np.arctan(np.tan(kappa * np.pi / 180 / 2)
-                          * np.cos(kappa_ang))
-
-        e_eta = -eta * np.pi / 180 - delta
-        e_chi = 2 * np.arcsin(np.sin(kappa * np.pi / 180 / 2)
-                              * np.sin(kappa_ang))
-        e_phi = -phi * np.pi / 180 - delta
-
-        # Phase shift for flipped kappa
-        if self.kappa.position > 180:
-            e_eta = np.pi - e_eta
-            e_chi = e_chi
-            e_phi = phi * np.pi / 180 - delta
-
-        e_eta = e_eta * 180 / np.pi
-        e_chi = e_chi * 180 / np.pi
-        e_phi = e_phi * 180 / np.pi
-        return e_eta, e_chi, e_phi
+            phi = current.phi
+        return kappa_to_spherical(eta, kappa, phi, kappa_ang=self.kappa_ang,
+                                  flipped=current.kappa > 180)
 
     def e_to_k(self, e_eta=None, e_chi=None, e_phi=None):
         """
         Convert from spherical coordinates to the native kappa coordinates.
 
-        If a parameter is left as None, use the live value.
+        If a parameter is left as None, use the live value. Arrays of
+        positions are converted element-wise, see `spherical_to_kappa`.
 
         Parameters
         ----------
-        e_eta : number
+        e_eta : number or np.ndarray
             e_eta pseudo motor's spherical coordinate
-        e_chi : number
+        e_chi : number or np.ndarray
             e_chi pseudo motor's spherical coordinate
-        e_phi : number
+        e_phi : number or np.ndarray
             e_phi pseudo motor's spherical coordinate
 
         Returns
@@ -486,31 +572,56 @@ class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
         coordinates : tuple
             Native kappa coordinates.
         """
-        if e_eta is None:
-            e_eta = self.e_eta_coord
-        if e_chi is None:
-            e_chi = self.e_chi_coord
-        if e_phi is None:
-            e_phi = self.e_phi_coord
-
-        kappa_ang = self.kappa_ang * np.pi / 180
-        delta = np.arcsin(-np.tan(e_chi * np.pi / 180 / 2)
-                          / np.tan(kappa_ang))
-        k_eta = -(e_eta * np.pi / 180 - delta)
-        k_kap = 2 * np.arcsin(np.sin(e_chi * np.pi / 180 / 2)
-                              / np.sin(kappa_ang))
-        k_phi = e_phi * np.pi / 180 - delta
-
-        # Phase shift for flipped kappa
-        if self.kappa.position > 180:
-            k_eta = -k_eta - np.pi
-            k_kap = 2 * np.pi - k_kap
-            k_phi = -e_phi * np.pi / 180 - delta
-
-        k_eta = k_eta * 180 / np.pi
-        k_kap = k_kap * 180 / np.pi
-        k_phi = -k_phi * 180 / np.pi
-        return k_eta, k_kap, k_phi
+        current = self.real_position
+        flipped = current.kappa > 180
+        if e_eta is None or e_chi is None or e_phi is None:
+            live = kappa_to_spherical(*current, kappa_ang=self.kappa_ang,
+                                      flipped=flipped)
+            if e_eta is None:
+                e_eta = live[0]
+            if e_chi is None:
+                e_chi = live[1]
+            if e_phi is None:
+                e_phi = live[2]
+        return spherical_to_kappa(e_eta, e_chi, e_phi,
+                                  kappa_ang=self.kappa_ang, flipped=flipped)
+
+    def e_to_k_path(self, e_eta, e_chi, e_phi, check=True):
+        """
+        Convert a trajectory in spherical coordinates to motor positions.
+
+        The whole trajectory is converted from a single reading of the motor
+        positions, and is checked with `check_motor_step` as one path
+        starting from the current position.
+
+        Parameters
+        ----------
+        e_eta : array_like
+            e_eta coordinates of the trajectory points.
+        e_chi : array_like
+            e_chi coordinates of the trajectory points.
+        e_phi : array_like
+            e_phi coordinates of the trajectory points.
+        check : bool, optional
+            Set to False to skip the motor step check.
+
+        Returns
+        -------
+        real_pos : RealPosition
+            The eta, kappa and phi arrays of the trajectory.
+
+        Raises
+        ------
+        KappaMoveAbort
+            If the path has large steps and the user does not confirm it.
+        """
+        e_eta, e_chi, e_phi = np.broadcast_arrays(
+            np.atleast_1d(e_eta), e_chi, e_phi
+        )
+        eta, kappa, phi = self.e_to_k(e_eta, e_chi, e_phi)
+        if check and not self.check_motor_step(eta, kappa, phi):
+            raise KappaMoveAbort('Unsafe Kappa path aborted!')
+        return self.RealPosition(eta=eta, kappa=kappa, phi=phi)
 
     @pseudo_position_argument
     def forward(self, pseudo_pos):
@@ -588,13 +699,17 @@ class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
         the deltas are greater than their respective max step, ask the user for
         confirmation.
 
+        Arrays of destinations are checked as a path: each point is compared
+        with the previous one, starting from the current positions, and the
+        user is asked once about all the large steps of the path.
+
         Parameters
         ----------
-        eta : number
+        eta : number or np.ndarray
             Desired eta destination position.
-        kappa : number
+        kappa : number or np.ndarray
             Desired kappa destination position.
-        phi : number
+        phi : number or np.ndarray
             Desired phi destination position.
 
         Returns
@@ -603,34 +718,51 @@ class Kappa(BaseInterface, PseudoPositioner, GroupDevice):
            `True` if motor step is smaller than the respective max step and/or
            the user has confirmed yes.
         """
-        eta_step = abs(eta - self.eta.position)
-        kappa_step = abs(kappa - self.kappa.position)
-        phi_step = abs(phi - self.phi.position)
-
-        is_eta_above_max = eta_step > self.eta_max_step
-        is_kappa_above_max = kappa_step > self.kappa_max_step
-        is_phi_above_max = phi_step > self.phi_max_step
-
-        if is_eta_above_max or is_kappa_above_max or is_phi_above_max:
+        current = self.real_position
+        path = np.array(np.broadcast_arrays(eta, kappa, phi),
+                        dtype=float).reshape(3, -1)
+        start = np.array(current, dtype=float).reshape(3, 1)
+        steps = np.abs(np.diff(np.hstack([start, path]), axis=1))
+        max_steps = np.array([self.eta_max_step, self.kappa_max_step,
+                              self.phi_max_step]).reshape(3, 1)
+        above_max = steps > max_steps
+        if not above_max.any():
+            return True
+
+        if path.shape[1] == 1:
             d_str = '\nDo you really intend to do the following motions?\n'
-            t = PrettyTable(['Motor', 'Current position', 'to',
-                             'Target position'])
-            t.add_row(['eta', self.eta.position, '-->', eta])
-            t.add_row(['kappa', self.kappa.position, '-->', kappa])
-            t.add_row(['phi', self.phi.position, '-->', phi])
-            e_eta, e_chi, e_phi = self.k_to_e(eta=eta, kappa=kappa, phi=phi)
-            t.add_row(['e_eta', self.e_eta.position, '-->', e_eta])
-            t.add_row(['e_chi', self.e_chi.position, '-->', e_chi])
-            t.add_row(['e_phi', self.e_phi.position, '-->', e_phi])
-            print(d_str, t)
-
-            if input('  (y/n) ') == 'y':
-                move_on = True
-            else:
-                move_on = False
+            t = prettytable.PrettyTable(['Motor', 'Current position', 'to',
+                                         'Target position'])
+            target = path[:, 0]
+            for motor, start_pos, end_pos in zip(current._fields, current,
+                                                 target):
+                t.add_row([motor, start_pos, '-->', end_pos])
+            flipped = current.kappa > 180
+            e_start = kappa_to_spherical(*current, kappa_ang=self.kappa_ang,
+                                         flipped=flipped)
+            e_end = kappa_to_spherical(*target, kappa_ang=self.kappa_ang,
+                                       flipped=flipped)
+            for axis, start_pos, end_pos in zip(('e_eta', 'e_chi', 'e_phi'),
+                                                e_start, e_end):
+                t.add_row([axis, start_pos, '-->', end_pos])
         else:
-            move_on = True
-        return move_on
+            points = np.flatnonzero(above_max.any(axis=0))
+            d_str = (f'\n{len(points)} of the {path.shape[1]} steps of this '
+                     'path are above the max step, do you really intend to '
+                     'do them?\n')
+            t = prettytable.PrettyTable(['Point', 'Motor', 'From', 'to',
+                                         'To'])
+            positions = np.hstack([start, path])
+            for point in points[:10]:
+                for idx, motor in enumerate(current._fields):
+                    if above_max[idx, point]:
+                        t.add_row([point, motor, positions[idx, point], '-->',
+                                   positions[idx, point + 1]])
+            if len(points) > 10:
+                d_str += f'(showing the first 10 of {len(points)})\n'
+        print(d_str, t)
+
+        return input('  (y/n) ') == 'y'
 
     def format_status_info(self, status_info):
         """Override status info handler to render the Kappa object."""
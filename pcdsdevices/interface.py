@@ -2,8 +2,10 @@
 Module for defining bell-and-whistles movement features.
 """
 import functools
+import json
 import logging
 import numbers
+import os
 import re
 import shutil
 import signal
@@ -12,11 +14,12 @@ import time
 import typing
 from contextlib import contextmanager
 from pathlib import Path
-from threading import Event
+from threading import Event, Lock
 from types import MethodType, SimpleNamespace
 from typing import Optional
 from weakref import WeakSet
 
+import numpy as np
 import ophyd
 import yaml
 from bluesky.utils import ProgressBar
@@ -44,6 +47,9 @@ except ImportError:
 logger = logging.getLogger(__name__)
 engineering_mode = True
 
+# Value shown in status_info for signals that did not answer in time
+STATUS_TIMEOUT = 'TIMEOUT'
+
 OphydObject_whitelist = []
 BlueskyInterface_whitelist = []
 Device_whitelist = ["stop"]
@@ -194,8 +200,19 @@ class BaseInterface:
     ----------
     tab_whitelist : list
         List of string regex to show in autocomplete for non-engineering mode.
+
+    status_info_workers : int, optional
+        If set, ``status_info`` reads signals concurrently using at most this
+        many threads. The default of `None` reads them one at a time.
+
+    status_info_timeout : float
+        In concurrent mode, the number of seconds each signal read may take
+        before it is reported as ``TIMEOUT``.
     """
 
+    status_info_workers: Optional[int] = None
+    status_info_timeout: float = 1.0
+
     tab_whitelist = (
         OphydObject_whitelist
         + BlueskyInterface_whitelist
@@ -372,6 +389,13 @@ class BaseInterface:
         def subdevice_filter(info):
             return bool(info['kind'] & Kind.normal)
 
+        if self.status_info_workers:
+            return concurrent_ophydobj_info(
+                self,
+                subdevice_filter=subdevice_filter,
+                max_workers=self.status_info_workers,
+                timeout=self.status_info_timeout,
+            )
         return ophydobj_info(self, subdevice_filter=subdevice_filter)
 
     def post_elog_status(self):
@@ -431,11 +455,14 @@ def get_kind(obj):
         return Kind.omitted
 
 
-def get_value(signal):
+def get_value(signal, timeout=0.1, mark_timeout=False):
     try:
         # Minimize waiting, we aren't collecting data we're showing info
         if signal.connected:
-            return signal.get(timeout=0.1, connection_timeout=0.1)
+            return signal.get(timeout=timeout, connection_timeout=timeout)
+    except TimeoutError:
+        if mark_timeout:
+            return STATUS_TIMEOUT
     except Exception:
         pass
     return None
@@ -452,19 +479,19 @@ def get_units(signal):
             ...
 
 
-def ophydobj_info(obj, subdevice_filter=None, devices=None):
+def ophydobj_info(obj, subdevice_filter=None, devices=None, pending=None):
     if isinstance(obj, Signal):
-        return signal_info(obj)
+        return signal_info(obj, pending=pending)
     elif isinstance(obj, Device):
         return device_info(obj, subdevice_filter=subdevice_filter,
-                           devices=devices)
+                           devices=devices, pending=pending)
     elif isinstance(obj, PositionerBase):
         return positionerbase_info(obj)
     else:
         return {}
 
 
-def device_info(device, subdevice_filter=None, devices=None):
+def device_info(device, subdevice_filter=None, devices=None, pending=None):
     if devices is None:
         devices = set()
     name = get_name(device, default='device')
@@ -529,7 +556,7 @@ def device_info(device, subdevice_filter=None, devices=None):
                              exc_info=True)
                 continue
             cpt_info = ophydobj_info(cpt, subdevice_filter=subdevice_filter,
-                                     devices=devices)
+                                     devices=devices, pending=pending)
             if 'position' in info:
                 # Drop some potential duplicate keys for positioners
                 try:
@@ -545,13 +572,74 @@ def device_info(device, subdevice_filter=None, devices=None):
     return info
 
 
-def signal_info(signal):
+def signal_info(signal, pending=None):
     name = get_name(signal, default='signal')
     kind = get_kind(signal)
-    value = get_value(signal)
+    if pending is None:
+        value = get_value(signal)
+    else:
+        # Filled in later by read_pending_values
+        value = None
     units = get_units(signal)
-    return dict(name=name, kind=kind, is_device=False, value=value,
+    info = dict(name=name, kind=kind, is_device=False, value=value,
                 units=units)
+    if pending is not None:
+        pending.append((info, signal))
+    return info
+
+
+def read_pending_values(pending, max_workers=8, timeout=1.0):
+    """
+    Fill in the values of signal info dictionaries using a thread pool.
+
+    Parameters
+    ----------
+    pending : list of (dict, Signal)
+        The info dictionaries and their signals, as gathered by passing a
+        list as ``pending`` to `ophydobj_info`.
+    max_workers : int, optional
+        The maximum number of signals to read at once.
+    timeout : float, optional
+        The number of seconds each read may take, counted from when it
+        starts. Reads that take longer are given the value ``TIMEOUT``.
+        If every worker is stuck on such a read, the reads that have not
+        started yet are marked ``TIMEOUT`` too.
+    """
+    def read(signal):
+        return get_value(signal, timeout=timeout, mark_timeout=True)
+
+    futures = utils.map_with_timeouts(
+        read,
+        [signal for _, signal in pending],
+        max_workers=max_workers,
+        timeout=timeout,
+        thread_name_prefix='status_info',
+    )
+    for (info, _), future in zip(pending, futures):
+        if future is None:
+            info['value'] = STATUS_TIMEOUT
+        else:
+            info['value'] = future.result()
+
+
+def concurrent_ophydobj_info(obj, subdevice_filter=None, max_workers=8,
+                             timeout=1.0):
+    """
+    Version of `ophydobj_info` that reads the signals concurrently.
+
+    The device tree is walked first without reading any signals, then the
+    reads are given to a thread pool. This way one slow PV costs at most
+    ``timeout`` seconds instead of holding up everything after it. Signals
+    that do not answer in time have the value ``TIMEOUT``.
+
+    See `read_pending_values` for the ``max_workers`` and ``timeout``
+    arguments.
+    """
+    pending = []
+    info = ophydobj_info(obj, subdevice_filter=subdevice_filter,
+                         pending=pending)
+    read_pending_values(pending, max_workers=max_workers, timeout=timeout)
+    return info
 
 
 def positionerbase_info(positioner):
@@ -748,6 +836,24 @@ class FltMvInterface(MvInterface):
         super().__init__(*args, **kwargs)
         self.presets = Presets(self)
 
+    def __getattr__(self, name):
+        # Preset methods are only added once the presets are loaded
+        presets = self.__dict__.get('presets')
+        if (
+            presets is not None
+            and not presets._loaded
+            and name.startswith(('mv_', 'umv_', 'wm_'))
+        ):
+            presets._ensure_loaded()
+            return getattr(self, name)
+        return super().__getattr__(name)
+
+    def __dir__(self):
+        presets = self.__dict__.get('presets')
+        if presets is not None:
+            presets._ensure_loaded()
+        return super().__dir__()
+
     def wm(self):
         pos = super().wm()
         try:
@@ -916,8 +1022,113 @@ def setup_preset_paths(**paths):
     Presets._paths = {}
     for k, v in paths.items():
         Presets._paths[k] = Path(v)
+    Presets._directories = {}
+    Presets._file_cache = {}
     for preset in Presets._registry:
-        preset.sync()
+        preset._unload()
+
+
+def migrate_presets(*paths, keep_yaml=False):
+    """
+    Convert the yaml preset files in some directories to preset journals.
+
+    Each ``name.yml`` file becomes a ``name.journal`` file holding the same
+    presets. Journals are updated by appending a single line per change
+    rather than by rewriting the whole file, see `Presets`.
+
+    Parameters
+    ----------
+    *paths : str or Path
+        The preset directories to convert, e.g. the ones passed to
+        `setup_preset_paths`.
+
+    keep_yaml : bool, optional
+        If True, leave the yaml files in place. By default they are renamed
+        to ``name.yml.bak`` so that they cannot go stale unnoticed.
+
+    Returns
+    -------
+    migrated : list of Path
+        The journal files that were written.
+    """
+    migrated = []
+    for directory in paths:
+        for yaml_path in sorted(Path(directory).glob('*.yml')):
+            journal_path = yaml_path.with_suffix(Presets._journal_suffix)
+            if journal_path.exists():
+                logger.warning('Skipping %s, %s already exists',
+                               yaml_path, journal_path)
+                continue
+            with open(yaml_path, 'r+') as fd:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                data = yaml.full_load(fd) or {}
+                journal_path.touch()
+                journal_path.chmod(0o666)
+                with open(journal_path, 'r+') as journal:
+                    Presets._write_journal_snapshot(journal, data)
+                if not keep_yaml:
+                    yaml_path.rename(yaml_path.with_name(yaml_path.name
+                                                         + '.bak'))
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            logger.info('Migrated %s to %s', yaml_path, journal_path)
+            migrated.append(journal_path)
+    return migrated
+
+
+def _stat_signature(stat_result):
+    """The parts of a stat result that change when a file is rewritten."""
+    return (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+
+
+class _PresetDirectory:
+    """
+    Listing of the preset files in one directory, shared by all devices.
+
+    The directory is scanned once and scanned again only when its
+    modification time changes, which happens when files are created,
+    removed or renamed, or when a rescan is requested. Some file systems,
+    such as NFS, do not always update the modification time, so explicit
+    syncs always rescan.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.scans = 0
+        self._mtime = None
+        self._entries = {}
+        self._lock = Lock()
+
+    def entries(self, refresh=False):
+        """
+        Mapping of preset file name to its stat signature.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            If True, scan the directory even if its modification time did
+            not change.
+        """
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        with self._lock:
+            if refresh or mtime != self._mtime:
+                suffixes = (Presets._yaml_suffix, Presets._journal_suffix)
+                entries = {}
+                with os.scandir(self.path) as it:
+                    for entry in it:
+                        if entry.name.endswith(suffixes):
+                            try:
+                                entries[entry.name] = _stat_signature(
+                                    entry.stat()
+                                )
+                            except FileNotFoundError:
+                                pass
+                self._entries = entries
+                self._mtime = mtime
+                self.scans += 1
+            return self._entries
 
 
 class Presets:
@@ -931,6 +1142,12 @@ class Presets:
     onto the associated device, and the :meth:`add_preset` and
     :meth:`add_preset_here` methods onto itself.
 
+    The preset files are not read when this object is created. They are
+    loaded on first use, e.g. when :attr:`positions`, the ``mv_`` methods or
+    tab completion are used. The preset directories are listed once and
+    shared by every device, and files are only read again by :meth:`sync`
+    when they have changed on disk.
+
     Parameters
     ----------
     device : :class:`~ophyd.device.Device`
@@ -942,41 +1159,174 @@ class Presets:
     positions : :class:`~types.SimpleNamespace`
         A namespace that contains all of the active presets as
         :class:`PresetPosition` objects.
+
+    use_journal : bool
+        If True, new preset files are created as journals instead of yaml.
+        Existing files keep their format. A journal is a file of json lines:
+        the first holds all of the presets and each later line records one
+        change, so saving a preset appends one line instead of rewriting the
+        file. Journals are compacted back to a single line once they hold
+        more than ``journal_compact_after`` changes. Use `migrate_presets`
+        to convert existing yaml files.
+
+    journal_compact_after : int
+        The number of changes a journal may hold before it is compacted.
     """
 
     _registry = WeakSet()
     _paths = {}
+    _directories = {}
+    _file_cache = {}
+    _yaml_suffix = '.yml'
+    _journal_suffix = '.journal'
+
+    use_journal = False
+    journal_compact_after = 100
 
     def __init__(self, device):
         self._device = device
         self._methods = []
+        self._positions = SimpleNamespace()
+        self._state_names = []
+        self._state_values = np.empty(0)
+        self._loaded = False
+        self._cache = {}
         self._fd = None
+        self._journal_lengths = {}
         self._registry.add(self)
         self.name = device.name + '_presets'
-        self.sync()
+
+    def __getattr__(self, name):
+        # The add methods are only added once the presets are loaded
+        if name.startswith('add_') and not self.__dict__.get('_loaded', True):
+            self._ensure_loaded()
+            return getattr(self, name)
+        raise AttributeError(name)
+
+    def __dir__(self):
+        self._ensure_loaded()
+        return super().__dir__()
+
+    @property
+    def positions(self):
+        """
+        A namespace that contains all of the active presets as
+        :class:`PresetPosition` objects.
+        """
+        self._ensure_loaded()
+        return self._positions
+
+    def _ensure_loaded(self):
+        """Load the presets if they have not been loaded yet."""
+        if not self._loaded:
+            self._sync(refresh=False)
+
+    def _unload(self):
+        """Forget the loaded presets, they will be loaded again on use."""
+        self._remove_methods()
+        self._cache = {}
+        self._loaded = False
+
+    @classmethod
+    def _directory(cls, preset_type):
+        """The shared :class:`_PresetDirectory` for a preset type."""
+        path = cls._paths[preset_type]
+        try:
+            return cls._directories[path]
+        except KeyError:
+            return cls._directories.setdefault(path, _PresetDirectory(path))
 
     def _path(self, preset_type):
         """Utility function to get the preset file :class:`~pathlib.Path`."""
-        path = self._paths[preset_type] / (self._device.name + '.yml')
+        directory = self._directory(preset_type)
+        entries = directory.entries()
+        journal = self._device.name + self._journal_suffix
+        yml = self._device.name + self._yaml_suffix
+        if journal in entries or (self.use_journal and yml not in entries):
+            path = directory.path / journal
+        else:
+            path = directory.path / yml
         logger.debug('select presets path %s', path)
         return path
 
+    def _is_journal(self, preset_type):
+        return self._path(preset_type).suffix == self._journal_suffix
+
     def _read(self, preset_type):
         """Utility function to get a particular preset's datum dictionary."""
         logger.debug('read presets for %s', self._device.name)
         with self._file_open_rlock(preset_type) as f:
             f.seek(0)
-            return yaml.full_load(f) or {}
+            if not self._is_journal(preset_type):
+                return yaml.full_load(f) or {}
+            data = {}
+            updates = 0
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record['op'] == 'snapshot':
+                    data = record['data']
+                else:
+                    self._apply_update(data, **record['update'])
+                    updates += 1
+            self._journal_lengths[preset_type] = updates
+            return data
 
     def _write(self, preset_type, data):
         """
         Utility function to overwrite a particular preset's datum dictionary.
         """
         logger.debug('write presets for %s', self._device.name)
+        self._file_cache.pop(self._path(preset_type), None)
         with self._file_open_rlock(preset_type) as f:
-            f.seek(0)
-            yaml.dump(data, f, default_flow_style=False)
-            f.truncate()
+            if self._is_journal(preset_type):
+                self._write_journal_snapshot(f, data)
+                self._journal_lengths[preset_type] = 0
+            else:
+                f.seek(0)
+                yaml.dump(data, f, default_flow_style=False)
+                f.truncate()
+
+    @staticmethod
+    def _write_journal_snapshot(f, data):
+        """Replace the contents of an open journal with one snapshot line."""
+        f.seek(0)
+        f.write(json.dumps({'op': 'snapshot', 'data': data}) + '\n')
+        f.truncate()
+
+    def _append(self, preset_type, update):
+        """Utility function to record one change at the end of a journal."""
+        logger.debug('append preset change for %s', self._device.name)
+        self._file_cache.pop(self._path(preset_type), None)
+        with self._file_open_rlock(preset_type) as f:
+            f.seek(0, 2)
+            f.write(json.dumps({'op': 'update', 'update': update}) + '\n')
+            self._journal_lengths[preset_type] = (
+                self._journal_lengths.get(preset_type, 0) + 1
+            )
+
+    @staticmethod
+    def _apply_update(data, name, ts, value=None, comment=None, active=True):
+        """
+        Apply one change to a preset datum dictionary in place.
+
+        If only a comment is given, it is recorded against the current value.
+        """
+        if value is None and comment is not None:
+            value = data[name]['value']
+        if value is not None:
+            if name not in data:
+                data[name] = {}
+            data[name]['value'] = value
+            history = data[name].get('history', {})
+            if comment:
+                comment = ' ' + comment
+            else:
+                comment = ''
+            history[ts] = f'{value:10.4f}{comment}'
+            data[name]['history'] = history
+        data[name]['active'] = bool(active)
 
     @contextmanager
     def _file_open_rlock(self, preset_type, timeout=1.0):
@@ -1021,10 +1371,12 @@ class Presets:
                 fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
                 logger.debug('acquired lock for %s', path)
                 self._fd = fd
-                yield fd
-                fcntl.flock(fd, fcntl.LOCK_UN)
-                logger.debug('released lock for %s', path)
-            self._fd = None
+                try:
+                    yield fd
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                    logger.debug('released lock for %s', path)
+                    self._fd = None
         else:
             logger.debug('using already open file descriptor')
             yield self._fd
@@ -1050,51 +1402,73 @@ class Presets:
             raise TypeError(
                 f"value must be a real numeric type, not type {type(value)}"
             )
+        update = dict(name=name, ts=time.strftime('%d %b %Y %H:%M:%S'),
+                      value=value, comment=comment, active=active)
         try:
             path = self._path(preset_type)
             if not path.exists():
                 path.touch()
                 path.chmod(0o666)
             with self._file_open_rlock(preset_type):
-                data = self._read(preset_type)
-                if value is None and comment is not None:
-                    value = data[name]['value']
-                if value is not None:
-                    if name not in data:
-                        data[name] = {}
-                    ts = time.strftime('%d %b %Y %H:%M:%S')
-                    data[name]['value'] = value
-                    history = data[name].get('history', {})
-                    if comment:
-                        comment = ' ' + comment
-                    else:
-                        comment = ''
-                    history[ts] = f'{value:10.4f}{comment}'
-                    data[name]['history'] = history
-                if active:
-                    data[name]['active'] = True
-                else:
-                    data[name]['active'] = False
-                self._write(preset_type, data)
+                if not self._is_journal(preset_type):
+                    data = self._read(preset_type)
+                    self._apply_update(data, **update)
+                    self._write(preset_type, data)
+                    return
+                lengths = self._journal_lengths
+                if (
+                    preset_type not in lengths
+                    or lengths[preset_type] >= self.journal_compact_after
+                ):
+                    # Unknown or long journal: fold it into one snapshot
+                    data = self._read(preset_type)
+                    self._apply_update(data, **update)
+                    self._write(preset_type, data)
+                    return
+                # Fail the same way the full update would, before writing
+                known = self._cache.get(preset_type, {})
+                if value is None and name not in known:
+                    self._apply_update(self._read(preset_type), **update)
+                self._append(preset_type, update)
         except BlockingIOError:
             self._log_flock_error()
 
     def sync(self):
         """Synchronize the presets with the database."""
         logger.debug('call %s presets.sync()', self._device.name)
+        self._sync(refresh=True)
+
+    def _sync(self, refresh):
+        """
+        Fill the cache and create the methods.
+
+        Files are only read if they changed since they were last read. With
+        ``refresh`` the directories are scanned again, otherwise the shared
+        directory listing is trusted.
+        """
         self._remove_methods()
         self._cache = {}
+        self._loaded = True
         logger.debug('filling %s cache', self.name)
         for preset_type in self._paths.keys():
+            entries = self._directory(preset_type).entries(refresh=refresh)
             path = self._path(preset_type)
-            if path.exists():
-                try:
-                    self._cache[preset_type] = self._read(preset_type)
-                except BlockingIOError:
-                    self._log_flock_error()
-            else:
+            signature = entries.get(path.name)
+            if signature is None:
                 logger.debug('No %s preset file for %s',
                              preset_type, self._device.name)
+                continue
+            cached = self._file_cache.get(path)
+            if cached is not None and cached[0] == signature:
+                self._cache[preset_type] = cached[1]
+                continue
+            try:
+                data = self._read(preset_type)
+            except BlockingIOError:
+                self._log_flock_error()
+            else:
+                self._file_cache[path] = (signature, data)
+                self._cache[preset_type] = data
         self._create_methods()
 
     def _log_flock_error(self):
@@ -1117,6 +1491,8 @@ class Presets:
             add, add_here = self._make_add(preset_type)
             self._register_method(self, 'add_' + preset_type, add)
             self._register_method(self, 'add_here_' + preset_type, add_here)
+        # Later preset types take over the methods of earlier ones
+        state_values = {}
         for preset_type, data in self._cache.items():
             for name, info in data.items():
                 if info['active']:
@@ -1125,8 +1501,15 @@ class Presets:
                     self._register_method(self._device, 'mv_' + name, mv)
                     self._register_method(self._device, 'umv_' + name, umv)
                     self._register_method(self._device, 'wm_' + name, wm)
-                    setattr(self.positions, name,
+                    setattr(self._positions, name,
                             PresetPosition(self, preset_type, name))
+                    state_values[name] = info['value']
+        self._state_names = list(state_values)
+        self._state_values = np.array(
+            [value if isinstance(value, numbers.Real) else np.nan
+             for value in state_values.values()],
+            dtype=float,
+        )
 
     def _register_method(self, obj, method_name, method):
         """
@@ -1272,11 +1655,14 @@ class Presets:
             try:
                 delattr(obj, method_name)
             except AttributeError:
-                pass
+                # Already removed, e.g. same preset name in two preset types
+                continue
             if hasattr(obj, '_tab'):
                 obj._tab.remove(method_name)
         self._methods = []
-        self.positions = SimpleNamespace()
+        self._positions = SimpleNamespace()
+        self._state_names = []
+        self._state_values = np.empty(0)
 
     @property
     def has_presets(self):
@@ -1290,19 +1676,17 @@ class Presets:
         Return the current active preset state name.
 
         This will be the state string name, or Unknown if we're not at any
-        state.
+        state. The closest preset within 0.5 of the current position wins.
         """
-        state = 'Unknown'
-        closest = 0.5
-        for device, method_name in self._methods:
-            if method_name.startswith('wm_'):
-                state_name = method_name.replace('wm_', '', 1)
-                wm_state = getattr(device, method_name)
-                diff = abs(wm_state())
-                if diff < closest:
-                    state = state_name
-                    closest = diff
-        return state
+        self._ensure_loaded()
+        if not self._state_names:
+            return 'Unknown'
+        diffs = np.abs(self._state_values - float(self._device.wm()))
+        diffs[np.isnan(diffs)] = np.inf
+        index = int(np.argmin(diffs))
+        if diffs[index] < 0.5:
+            return self._state_names[index]
+        return 'Unknown'
 
 
 class PresetPosition:
@@ -1685,11 +2069,33 @@ class LightpathMixin(Device):
 
         dev = MyDevice('PREFIX', name='dev', input_branches=['L0'],
                        output_branches=['L0'])
+
+    When the state is recalculated from a ``lightpath_summary`` callback, the
+    keyword arguments are taken from the values the summary signal has
+    already cached, rather than issuing a fresh ``get()`` on every signal.
+    Set ``lightpath_use_summary_cache = False`` to always use live gets.
+    ``lightpath_cache_stats`` reports how many values came from each source.
+
+    Recalculations can optionally be coalesced by setting
+    ``lightpath_coalesce_window`` to a time in seconds: the first summary
+    update schedules a single recalculation on ophyd's utility thread after
+    the window, and further updates inside the window are suppressed.
+    Subscribe to ``SUB_LIGHTPATH_STATE`` to be notified only when the
+    calculated ``LightpathState`` actually changes.  ``lightpath_calc_stats``
+    reports the number of calculations and suppressed updates.
     """
+    SUB_LIGHTPATH_STATE = 'lightpath_state'
+
     # Component names whose values are relevant for inserted/removed
     # can access sub-components with dot notation
     lightpath_cpts = []
 
+    # Use values cached by lightpath_summary when recalculating from callbacks
+    lightpath_use_summary_cache: bool = True
+
+    # Coalesce summary updates over this many seconds (None to disable)
+    lightpath_coalesce_window: Optional[float] = None
+
     # Flag to signify that subclass is another mixin, rather than a device
     _lightpath_mixin = False
 
@@ -1704,6 +2110,12 @@ class LightpathMixin(Device):
         self._summary_initialized = False
         self._cached_state = None
         self._md = None
+        self._lightpath_cache_hits = 0
+        self._lightpath_live_gets = 0
+        self._lightpath_computations = 0
+        self._lightpath_suppressions = 0
+        self._lightpath_pending = False
+        self._lightpath_lock = Lock()
 
         super().__init__(*args, **kwargs)
 
@@ -1754,10 +2166,22 @@ class LightpathMixin(Device):
             'a ``calc_lightpath_state`` method.'
         )
 
-    def get_lightpath_state(self, use_cache: bool = True) -> LightpathState:
+    def get_lightpath_state(
+        self,
+        use_cache: bool = True,
+        use_summary_cache: bool = False,
+    ) -> LightpathState:
         """
         Return the current LightpathState
 
+        Parameters
+        ----------
+        use_cache : bool, optional
+            Return the previously calculated state, if available.
+        use_summary_cache : bool, optional
+            When recalculating, use the signal values already cached by
+            ``lightpath_summary`` instead of a fresh ``get()`` where possible.
+
         Returns
         -------
         LightpathState
@@ -1765,18 +2189,103 @@ class LightpathMixin(Device):
         """
         if (not use_cache) or (self._cached_state is None):
             self.log.debug('calculating new LightpathState')
-            kwargs = {sig.name.removeprefix(self.name + '_'): sig.get()
-                      for sig in self.lightpath_summary._signals}
+            kwargs = self._get_lightpath_kwargs(
+                use_summary_cache=use_summary_cache
+            )
             self._cached_state = self.calc_lightpath_state(**kwargs)
+            self._lightpath_computations += 1
 
         return self._cached_state
 
+    def _lightpath_kwarg_name(self, sig: Signal) -> str:
+        """Name of the ``calc_lightpath_state`` keyword for a summary signal."""
+        return sig.name.removeprefix(self.name + '_')
+
+    def _get_lightpath_kwargs(
+        self, use_summary_cache: bool = False
+    ) -> dict[str, typing.Any]:
+        """
+        Gather the ``calc_lightpath_state`` keyword arguments.
+
+        Parameters
+        ----------
+        use_summary_cache : bool, optional
+            Use the values cached by ``lightpath_summary`` where available,
+            falling back to ``get()`` for signals without a cached value.
+        """
+        kwargs = {}
+        for sig, siginfo in self.lightpath_summary._signals.items():
+            if use_summary_cache and siginfo.value is not None:
+                value = siginfo.value
+                self._lightpath_cache_hits += 1
+            else:
+                value = sig.get()
+                self._lightpath_live_gets += 1
+            kwargs[self._lightpath_kwarg_name(sig)] = value
+        return kwargs
+
+    @property
+    def lightpath_cache_stats(self) -> dict[str, int]:
+        """
+        Counts of lightpath input values taken from the summary cache
+        (``cache_hits``) versus read with a fresh ``get()`` (``live_gets``).
+        """
+        return {
+            'cache_hits': self._lightpath_cache_hits,
+            'live_gets': self._lightpath_live_gets,
+        }
+
+    @property
+    def lightpath_calc_stats(self) -> dict[str, int]:
+        """
+        Counts of ``LightpathState`` calculations (``computations``) and of
+        summary updates absorbed by coalescing (``suppressions``).
+        """
+        return {
+            'computations': self._lightpath_computations,
+            'suppressions': self._lightpath_suppressions,
+        }
+
     def _calc_cache_lightpath_state(self, *args, **kwargs) -> None:
         """
         Calculate the lightpath state and cache it.
         Intended for use as a callback subscribed to lightpath_summary
+
+        If ``lightpath_coalesce_window`` is set, the calculation is deferred
+        and any further calls until it runs are suppressed.
         """
-        self.get_lightpath_state(use_cache=False)
+        window = self.lightpath_coalesce_window
+        if not window:
+            self._update_lightpath_state()
+            return
+
+        with self._lightpath_lock:
+            if self._lightpath_pending:
+                self._lightpath_suppressions += 1
+                return
+            self._lightpath_pending = True
+
+        utils.schedule_task(self._run_coalesced_lightpath_state, delay=window)
+
+    def _run_coalesced_lightpath_state(self) -> None:
+        """Run the deferred calculation scheduled by a coalesced update."""
+        with self._lightpath_lock:
+            self._lightpath_pending = False
+        self._update_lightpath_state()
+
+    def _update_lightpath_state(self) -> None:
+        """
+        Recalculate the cached state, notifying ``SUB_LIGHTPATH_STATE``
+        subscribers if it changed.
+        """
+        old_state = self._cached_state
+        new_state = self.get_lightpath_state(
+            use_cache=False,
+            use_summary_cache=self.lightpath_use_summary_cache,
+        )
+        if new_state != old_state:
+            self._run_subs(sub_type=self.SUB_LIGHTPATH_STATE, obj=self,
+                           state=new_state, old_state=old_state)
 
     @property
     def md(self):
@@ -1864,18 +2373,10 @@ class LightpathInOutCptMixin(LightpathMixin):
 
         self.lightpath_summary.subscribe(self._calc_cache_lightpath_state)
 
-    def get_lightpath_state(self, use_cache: bool = True) -> LightpathState:
-        if (not use_cache) or (self._cached_state is None):
-            kwargs = {}
-            for sig in self.lightpath_summary._signals:
-                parent = sig.parent or sig.biological_parent
-                sig_name = parent.name.removeprefix(self.name + '_')
-                kwargs[sig_name] = sig.get()
-
-            state = self.calc_lightpath_state(**kwargs)
-            self._cached_state = state
-
-        return self._cached_state
+    def _lightpath_kwarg_name(self, sig: Signal) -> str:
+        """Name the keyword after the InOut component owning the signal."""
+        parent = sig.parent or sig.biological_parent
+        return parent.name.removeprefix(self.name + '_')
 
     def calc_lightpath_state(self, **lightpath_kwargs):
         in_check = []
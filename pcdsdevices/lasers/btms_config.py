@@ -5,6 +5,8 @@ import enum
 import logging
 from typing import Union
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -175,8 +177,7 @@ class SourcePosition(str, enum.Enum):
 
     def is_above(self, other: SourcePosition) -> bool:
         """Is ``self`` at or above the ``other`` position?"""
-        positions = list(SourcePosition)
-        return positions.index(self) <= positions.index(other)
+        return _SOURCE_ORDER[self] <= _SOURCE_ORDER[other]
 
     @property
     def is_left(self) -> bool:
@@ -338,15 +339,7 @@ class DestinationPosition(str, enum.Enum):
         The first ``DestinationPosition`` in the returned tuple will be the
         next closest destination.
         """
-        idx1 = ALL_DESTINATIONS.index(self)
-        idx2 = ALL_DESTINATIONS.index(target)
-
-        if idx1 < idx2:
-            # Direction: right (self ... target)
-            return ALL_DESTINATIONS[idx1 + 1:idx2 + 1]
-
-        # Direction: left (target ... self)
-        return ALL_DESTINATIONS[idx2:idx1][::-1]
+        return _DESTINATION_PATHS[self, target]
 
     @property
     def is_top(self) -> bool:
@@ -362,10 +355,54 @@ class DestinationPosition(str, enum.Enum):
         )
 
 
+ALL_SOURCES = tuple(SourcePosition)
 ALL_DESTINATIONS = tuple(DestinationPosition)
 AnyPosition = Union[SourcePosition, DestinationPosition]
 
 
+def _destination_path(
+    idx1: int, idx2: int
+) -> tuple[DestinationPosition, ...]:
+    """Destinations crossed going from ``idx1`` to ``idx2``, see path_to."""
+    if idx1 < idx2:
+        # Direction: right (self ... target)
+        return ALL_DESTINATIONS[idx1 + 1:idx2 + 1]
+
+    # Direction: left (target ... self)
+    return ALL_DESTINATIONS[idx2:idx1][::-1]
+
+
+# Tables computed once for the move checks, indexed in ALL_SOURCES and
+# ALL_DESTINATIONS order
+_SOURCE_ORDER = {source: idx for idx, source in enumerate(ALL_SOURCES)}
+_DESTINATION_ORDER = {
+    dest: idx for idx, dest in enumerate(ALL_DESTINATIONS)
+}
+_DESTINATION_PATHS = {
+    (dest1, dest2): _destination_path(idx1, idx2)
+    for idx1, dest1 in enumerate(ALL_DESTINATIONS)
+    for idx2, dest2 in enumerate(ALL_DESTINATIONS)
+}
+
+
+def _path_crosses_table() -> np.ndarray:
+    """[start, target, dest] is True if moving start to target crosses dest."""
+    table = np.zeros((len(ALL_DESTINATIONS),) * 3, dtype=bool)
+    for (start, target), path in _DESTINATION_PATHS.items():
+        table[
+            _DESTINATION_ORDER[start], _DESTINATION_ORDER[target],
+            [_DESTINATION_ORDER[dest] for dest in path]
+        ] = True
+    return table
+
+
+_PATH_CROSSES = _path_crosses_table()
+# [source, other] is True if source is at or above other
+_SOURCE_ABOVE = np.less_equal.outer(np.arange(len(ALL_SOURCES)),
+                                    np.arange(len(ALL_SOURCES)))
+_DESTINATION_IS_TOP = np.array([dest.is_top for dest in ALL_DESTINATIONS])
+
+
 PORT_SPACING_MM = 215.9  # 8.5 in
 
 # NOTE: This is the primary location where valid ports are listed.
@@ -521,6 +558,20 @@ class BtmsState:
     )
     maintenance_mode: bool = False
 
+    def copy(self) -> BtmsState:
+        """A copy of the state that can be modified independently."""
+        return BtmsState(
+            sources={
+                pos: dataclasses.replace(source)
+                for pos, source in self.sources.items()
+            },
+            destinations={
+                pos: dataclasses.replace(dest)
+                for pos, dest in self.destinations.items()
+            },
+            maintenance_mode=self.maintenance_mode,
+        )
+
     def check_configuration(self) -> list[MoveError]:
         """
         Check the current configuration for any logical errors/conflicts.
@@ -685,6 +736,19 @@ class BtmsState:
         if conflicts:
             raise conflicts[0]
 
+    def get_move_table(self) -> BtmsMoveTable:
+        """
+        Check the motion of every source to every destination at once.
+
+        This gives the same verdicts as calling ``check_move_all`` with no
+        ``closest_destination`` for each pair, in a single pass.
+
+        Returns
+        -------
+        BtmsMoveTable
+        """
+        return BtmsMoveTable.from_state(self)
+
     def get_text_diagram(self) -> str:
         """A textual representation of the BTMS state."""
         diagram = _PositionDiagram()
@@ -695,3 +759,143 @@ class BtmsState:
 
     def __str__(self) -> str:
         return self.get_text_diagram()
+
+
+@dataclasses.dataclass(frozen=True)
+class BtmsMoveTable:
+    """
+    Move conflicts of every source to every destination in a ``BtmsState``.
+
+    Each conflict array has one row per source in ``sources`` and one column
+    per destination in ``destinations``, and is True where moving that
+    source to that destination has the conflict.
+
+    Attributes
+    ----------
+    sources : tuple of SourcePosition
+        The sources of the state, in its order.
+    destinations : tuple of DestinationPosition
+        All destinations, from left to right.
+    configuration_error : bool
+        True if ``check_configuration`` reported errors, which block every
+        move.
+    in_use : np.ndarray
+        Another source is positioned at the destination.
+    moving_active : np.ndarray
+        The source is sending beam.
+    in_control : np.ndarray
+        The destination the source is at has not yielded control.
+    crosses_beam : np.ndarray
+        The move would cross the active beam of another source.
+    """
+    sources: tuple[SourcePosition, ...]
+    destinations: tuple[DestinationPosition, ...]
+    configuration_error: bool
+    in_use: np.ndarray
+    moving_active: np.ndarray
+    in_control: np.ndarray
+    crosses_beam: np.ndarray
+
+    @classmethod
+    def from_state(cls, state: BtmsState) -> BtmsMoveTable:
+        """Compute the move table of ``state``."""
+        sources = tuple(state.sources)
+        source_idx = np.array(
+            [_SOURCE_ORDER[source] for source in sources], dtype=int
+        )
+        current = np.array(
+            [
+                -1 if source.destination is None
+                else _DESTINATION_ORDER[source.destination]
+                for source in state.sources.values()
+            ],
+            dtype=int,
+        )
+        beam = np.array(
+            [source.beam_status for source in state.sources.values()],
+            dtype=bool,
+        )
+        yields = np.array(
+            [
+                state.destinations[dest].yields_control
+                for dest in ALL_DESTINATIONS
+            ],
+            dtype=bool,
+        )
+        num_dest = len(ALL_DESTINATIONS)
+        positioned = current >= 0
+        targets = np.arange(num_dest)
+
+        # [source, dest] is True if the source is positioned at dest
+        at_dest = current[:, np.newaxis] == targets
+        in_use = at_dest.sum(axis=0) - at_dest > 0
+
+        moving_active = np.repeat(
+            (beam & positioned)[:, np.newaxis], num_dest, axis=1
+        )
+        in_control = (
+            (positioned & ~yields[current])[:, np.newaxis] & ~at_dest
+        )
+
+        # As in check_move_all, the last source at a destination is the one
+        # considered active there
+        active = np.full(num_dest, -1, dtype=int)
+        for idx in np.flatnonzero(positioned):
+            active[current[idx]] = idx
+        has_beam = active >= 0
+        has_beam[has_beam] = beam[active[has_beam]]
+        # Unused destinations (-1) get a dummy source, masked by has_beam
+        active_idx = np.append(source_idx, 0)[active]
+        # [source, dest] is True if moving the source past dest hits its beam
+        blocks = has_beam & np.where(
+            _DESTINATION_IS_TOP,
+            _SOURCE_ABOVE[source_idx[:, np.newaxis], active_idx],
+            _SOURCE_ABOVE[active_idx, source_idx[:, np.newaxis]],
+        )
+        paths = _PATH_CROSSES[np.where(positioned, current, 0)]
+        crosses_beam = (
+            np.any(paths & blocks[:, np.newaxis, :], axis=2)
+            & positioned[:, np.newaxis]
+        )
+
+        return cls(
+            sources=sources,
+            destinations=ALL_DESTINATIONS,
+            configuration_error=bool(state.check_configuration()),
+            in_use=in_use,
+            moving_active=moving_active,
+            in_control=in_control,
+            crosses_beam=crosses_beam,
+        )
+
+    @property
+    def allowed(self) -> np.ndarray:
+        """True for each (source, destination) move without conflicts."""
+        if self.configuration_error:
+            return np.zeros_like(self.in_use)
+        return ~(
+            self.in_use | self.moving_active | self.in_control
+            | self.crosses_beam
+        )
+
+    def is_allowed(
+        self, source: SourcePosition, destination: DestinationPosition
+    ) -> bool:
+        """Can ``source`` move to ``destination`` without conflicts?"""
+        return bool(
+            self.allowed[
+                self.sources.index(source), _DESTINATION_ORDER[destination]
+            ]
+        )
+
+    def legal_moves(
+        self,
+    ) -> dict[SourcePosition, tuple[DestinationPosition, ...]]:
+        """The destinations each source can move to without conflicts."""
+        allowed = self.allowed
+        return {
+            source: tuple(
+                dest for dest, ok in zip(self.destinations, row) if ok
+            )
+            for source, row in zip(self.sources, allowed)
+        }
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import cast
+import functools
+import logging
+import threading
+from typing import Any, Callable, Iterator, cast
 
 from ophyd.device import Component as Cpt
 from ophyd.device import Device
-from ophyd.signal import EpicsSignalRO
+from ophyd.signal import EpicsSignalRO, Signal
 from ophyd.status import AndStatus, MoveStatus
 
 from pcdsdevices.valve import VGC
@@ -18,6 +21,18 @@ from .btms_config import (BtmsSourceState, BtmsState, DestinationPosition,
                           MoveError, SourcePosition, valid_destinations,
                           valid_sources)
 
+logger = logging.getLogger(__name__)
+
+
+def _state_fields(state: BtmsState) -> Iterator[str]:
+    """All field names of ``state``, as reported by BtpsState.SUB_STATE."""
+    for source_pos in state.sources:
+        yield f"sources.{source_pos}.destination"
+        yield f"sources.{source_pos}.beam_status"
+    for dest_pos in state.destinations:
+        yield f"destinations.{dest_pos}.yields_control"
+    yield "maintenance_mode"
+
 
 class BtpsVGC(VGC):
     """
@@ -621,9 +636,19 @@ class BtpsSourceStatus(BaseInterface, Device):
 class BtpsState(BaseInterface, Device):
     """
     Beam Transport Protection System (BTPS) State.
+
+    Subscribe to ``SUB_STATE`` to be notified of changes in the BTMS state,
+    see `start_state_monitor`.
     """
+    SUB_STATE = "state"
 
     def __init__(self, *args, **kwargs):
+        self._state_lock = threading.RLock()
+        self._state_signal_map = None
+        self._state_monitored = False
+        self._state_values = {}
+        self._state_cache = None
+        self._move_table = None
         super().__init__(*args, **kwargs)
         try:
             self.sources = {
@@ -791,46 +816,203 @@ class BtpsState(BaseInterface, Device):
         """
         Determine the state for BTMS, indicating active source/destination pairs.
 
+        The first call starts monitoring the signals involved, after which the
+        state comes from the cached values without any network I/O. Until all
+        of the monitored values have arrived, the signals are read directly.
+
         Returns
         -------
         BtmsState
         """
-        state = btms.BtmsState()
-        for source in self.sources.values():
-            try:
-                dest_pos = DestinationPosition.from_index(
-                    source.current_destination.get()
-                )
-            except ValueError:
-                dest_pos = None
-
-            if dest_pos is not None:
-                dest = self.destinations[dest_pos]
-                source_to_dest = dest.sources[source.source_pos]
-                beam_status = bool(
-                    source.lss.opened_status.get()
-                    and bool(source_to_dest.entry_valve_ready.get())
-                    and bool(dest.exit_valve_ready.get())
-                )
-            else:
-                source_to_dest = None
-                beam_status = source.lss.opened_status.get()
-
-            state.sources[source.source_pos] = BtmsSourceState(
-                source=source.source_pos,
-                destination=dest_pos,
-                beam_status=bool(beam_status),
+        self.start_state_monitor()
+        with self._state_lock:
+            if self._state_cache is not None:
+                return self._state_cache.copy()
+        signals = self._state_signals
+        return self._build_btms_state(lambda key: signals[key].get())
+
+    def get_move_table(self) -> btms.BtmsMoveTable:
+        """
+        Check the motion of every source to every destination at once.
+
+        The table is kept until the cached state changes.
+
+        Returns
+        -------
+        BtmsMoveTable
+        """
+        with self._state_lock:
+            if self._move_table is not None:
+                return self._move_table
+        state = self.to_btms_state()
+        table = state.get_move_table()
+        with self._state_lock:
+            if self._state_cache is not None and self._state_cache == state:
+                self._move_table = table
+        return table
+
+    def subscribe(self, cb, event_type=None, run=True):
+        cid = super().subscribe(cb, event_type=event_type, run=run)
+        if event_type == self.SUB_STATE:
+            self.start_state_monitor()
+        return cid
+
+    @property
+    def _state_signals(self) -> dict[tuple, Signal]:
+        """The signals feeding the BTMS state, by cache key."""
+        if self._state_signal_map is None:
+            signals = {("maintenance_mode",): self.config.maintenance_mode}
+            for source_pos, source in self.sources.items():
+                signals["destination", source_pos] = source.current_destination
+                signals["shutter", source_pos] = source.lss.opened_status
+            for dest_pos, dest in self.destinations.items():
+                signals["exit_valve", dest_pos] = dest.exit_valve_ready
+                signals["yields_control", dest_pos] = dest.yields_control
+                for source_pos, config in dest.sources.items():
+                    signals["entry_valve", source_pos, dest_pos] = (
+                        config.entry_valve_ready
+                    )
+            self._state_signal_map = signals
+        return self._state_signal_map
+
+    def start_state_monitor(self) -> None:
+        """
+        Keep a cached BTMS state up to date from the signal monitors.
+
+        Subscribers to ``SUB_STATE`` are called with ``state``, a copy of the
+        new ``BtmsState``, and ``changed``, the set of changed fields such as
+        ``"sources.LS1.beam_status"``, ``"destinations.LD8.yields_control"``
+        or ``"maintenance_mode"``.
+        """
+        with self._state_lock:
+            if self._state_monitored:
+                return
+            self._state_monitored = True
+        for key, signal in self._state_signals.items():
+            signal.subscribe(
+                functools.partial(self._state_meta_changed, key),
+                event_type=signal.SUB_META,
+                run=False,
+            )
+            signal.subscribe(
+                functools.partial(self._state_value_changed, key), run=True
+            )
+
+    def _source_state(
+        self, source_pos: SourcePosition, get: Callable[[tuple], Any]
+    ) -> BtmsSourceState:
+        """Build the state of one source, reading values with ``get``."""
+        try:
+            dest_pos = DestinationPosition.from_index(
+                get(("destination", source_pos))
+            )
+        except ValueError:
+            dest_pos = None
+
+        opened = get(("shutter", source_pos))
+        if dest_pos is not None and dest_pos in self.destinations:
+            beam_status = bool(
+                opened
+                and bool(get(("entry_valve", source_pos, dest_pos)))
+                and bool(get(("exit_valve", dest_pos)))
             )
+        else:
+            beam_status = opened
 
-        for dest in self.destinations.values():
-            dest_state = state.destinations[dest.destination_pos]
-            dest_state.yields_control = bool(
-                dest.yields_control.get()
+        return BtmsSourceState(
+            source=source_pos,
+            destination=dest_pos,
+            beam_status=bool(beam_status),
+        )
+
+    def _build_btms_state(self, get: Callable[[tuple], Any]) -> BtmsState:
+        """Build the full state, reading values with ``get``."""
+        state = btms.BtmsState()
+        for source_pos in self.sources:
+            state.sources[source_pos] = self._source_state(source_pos, get)
+
+        for dest_pos in self.destinations:
+            state.destinations[dest_pos].yields_control = bool(
+                get(("yields_control", dest_pos))
             )
 
-        state.maintenance_mode = bool(self.config.maintenance_mode.get())
+        state.maintenance_mode = bool(get(("maintenance_mode",)))
         return state
 
+    def _update_state_cache(self, key: tuple) -> set[str]:
+        """Update the cached state for a new ``key`` value."""
+        state = self._state_cache
+        get = self._state_values.__getitem__
+        kind = key[0]
+        changed = set()
+        if kind == "maintenance_mode":
+            value = bool(get(key))
+            if value != state.maintenance_mode:
+                state.maintenance_mode = value
+                changed.add("maintenance_mode")
+            return changed
+        if kind == "yields_control":
+            dest = state.destinations[key[1]]
+            value = bool(get(key))
+            if value != dest.yields_control:
+                dest.yields_control = value
+                changed.add(f"destinations.{key[1]}.yields_control")
+            return changed
+
+        if kind in ("destination", "shutter"):
+            affected = [key[1]]
+        elif kind == "entry_valve":
+            affected = [key[1]] if state.sources[key[1]].destination == key[2] else []
+        else:
+            # Exit valve
+            affected = [
+                source_pos for source_pos, source in state.sources.items()
+                if source.destination == key[1]
+            ]
+        for source_pos in affected:
+            old = state.sources[source_pos]
+            new = self._source_state(source_pos, get)
+            for field in ("destination", "beam_status"):
+                if getattr(old, field) != getattr(new, field):
+                    changed.add(f"sources.{source_pos}.{field}")
+            state.sources[source_pos] = new
+        return changed
+
+    def _state_value_changed(self, key: tuple, *args, value, **kwargs) -> None:
+        """Monitor callback for the signals of the BTMS state."""
+        try:
+            with self._state_lock:
+                self._state_values[key] = value
+                if self._state_cache is not None:
+                    changed = self._update_state_cache(key)
+                elif len(self._state_values) == len(self._state_signals):
+                    self._state_cache = self._build_btms_state(
+                        self._state_values.__getitem__
+                    )
+                    changed = set(_state_fields(self._state_cache))
+                else:
+                    changed = set()
+                if not changed:
+                    return
+                self._move_table = None
+                state = self._state_cache.copy()
+            self._run_subs(
+                sub_type=self.SUB_STATE, obj=self, state=state, changed=changed
+            )
+        except Exception:
+            logger.exception("Error updating the BTMS state of %s", self.name)
+
+    def _state_meta_changed(
+        self, key: tuple, *args, connected: bool = True, **kwargs
+    ) -> None:
+        """Drop the cached state when one of its signals disconnects."""
+        if connected:
+            return
+        with self._state_lock:
+            self._state_values.pop(key, None)
+            self._state_cache = None
+            self._move_table = None
+
     def status_info(self) -> dict[str, BtmsState]:
         return {"state": self.to_btms_state()}
 
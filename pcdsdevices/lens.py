@@ -9,7 +9,6 @@ from datetime import date
 import numpy as np
 from ophyd.device import Component as Cpt
 from ophyd.device import FormattedComponent as FCpt
-from pcdscalc import be_lens_calcs as calcs
 
 from .doc_stubs import basic_positioner_init
 from .epics_motor import IMS
@@ -18,8 +17,10 @@ from .interface import BaseInterface, LightpathInOutMixin, tweak_base
 from .pseudopos import (PseudoPositioner, PseudoSingleInterface,
                         pseudo_position_argument, real_position_argument)
 from .sim import FastMotor
+from .utils import LazyModule
 
 logger = logging.getLogger(__name__)
+calcs = LazyModule('pcdscalc.be_lens_calcs')
 
 
 class XFLS(InOutRecordPositioner, LightpathInOutMixin):
@@ -19,7 +19,6 @@ from ophyd.device import FormattedComponent as FCpt
 from ophyd.signal import EpicsSignalRO
 from ophyd.sim import NullStatus
 from ophyd.status import wait as status_wait
-from pcdscalc import common, diffraction
 
 from pcdsdevices.epics_motor import OffsetIMSWithPreset, OffsetMotor
 from pcdsdevices.sim import FastMotor
@@ -31,9 +30,12 @@ from .inout import InOutRecordPositioner
 from .interface import BaseInterface, FltMvInterface, LightpathMixin
 from .pseudopos import (PseudoPositioner, PseudoSingleInterface,
                         pseudo_position_argument, real_position_argument)
-from .utils import get_status_float, get_status_value, schedule_task
+from .utils import (LazyModule, get_status_float, get_status_value,
+                    schedule_task)
 
 logger = logging.getLogger(__name__)
+common = LazyModule('pcdscalc.common')
+diffraction = LazyModule('pcdscalc.diffraction')
 
 
 class H1N(InOutRecordPositioner):
@@ -213,21 +215,49 @@ class CrystalTower1(BaseInterface, GroupDevice):
             self._hutch_prefix = 'XPP'
         elif 'XCS' in prefix:
             self._hutch_prefix = 'HFX'
+        self._crystal_cache = {}
         super().__init__(prefix, *args, **kwargs)
 
+    @h1n_state.sub_default
+    @y1_state.sub_default
+    @chi1_state.sub_default
+    @diamond_reflection.sub_value
+    @silicon_reflection.sub_value
+    def _clear_crystal_cache(self, *args, **kwargs):
+        """Forget the cached states and reflections, they changed."""
+        self._crystal_cache = {}
+
+    def _cached(self, attr):
+        """
+        Get the position of a state or the value of a reflection signal.
+
+        The result is kept until one of them changes, so that
+        `get_reflection` and `get_material` do not read the PVs every time.
+        """
+        cache = self._crystal_cache
+        try:
+            return cache[attr]
+        except KeyError:
+            obj = getattr(self, attr)
+            if attr.endswith('_state'):
+                value = obj.position
+            else:
+                value = obj.get()
+            # Stored in the old dict if the cache was cleared meanwhile
+            cache[attr] = value
+            return value
+
     def is_diamond(self):
         """Check if tower 1 is with Diamond (C) material."""
-        return ((self.h1n_state.position == 'C' or
-                 self.h1n_state.position == 'OUT') and
-                self.y1_state.position == 'C' and
-                self.chi1_state.position == 'C')
+        return (self._cached('h1n_state') in ('C', 'OUT') and
+                self._cached('y1_state') == 'C' and
+                self._cached('chi1_state') == 'C')
 
     def is_silicon(self):
         """Check if tower 1 is with Silicon (Si) material."""
-        return ((self.h1n_state.position == 'Si' or
-                 self.h1n_state.position == 'OUT') and
-                self.y1_state.position == 'Si' and
-                self.chi1_state.position == 'Si')
+        return (self._cached('h1n_state') in ('Si', 'OUT') and
+                self._cached('y1_state') == 'Si' and
+                self._cached('chi1_state') == 'Si')
 
     def get_reflection(self):
         """
@@ -246,9 +276,9 @@ class CrystalTower1(BaseInterface, GroupDevice):
         """
         reflection = None
         if self.is_diamond():
-            reflection = self.diamond_reflection.get()
+            reflection = self._cached('diamond_reflection')
         elif self.is_silicon():
-            reflection = self.silicon_reflection.get()
+            reflection = self._cached('silicon_reflection')
 
         if reflection is not None:
             return tuple(reflection)
@@ -467,19 +497,49 @@ class CrystalTower2(BaseInterface, GroupDevice):
             self._hutch_prefix = 'XPP'
         elif 'XCS' in prefix:
             self._hutch_prefix = 'HFX'
+        self._crystal_cache = {}
         super().__init__(prefix, *args, **kwargs)
 
+    @h2n_state.sub_default
+    @y2_state.sub_default
+    @chi2_state.sub_default
+    @diamond_reflection.sub_value
+    @silicon_reflection.sub_value
+    def _clear_crystal_cache(self, *args, **kwargs):
+        """Forget the cached states and reflections, they changed."""
+        self._crystal_cache = {}
+
+    def _cached(self, attr):
+        """
+        Get the position of a state or the value of a reflection signal.
+
+        The result is kept until one of them changes, so that
+        `get_reflection` and `get_material` do not read the PVs every time.
+        """
+        cache = self._crystal_cache
+        try:
+            return cache[attr]
+        except KeyError:
+            obj = getattr(self, attr)
+            if attr.endswith('_state'):
+                value = obj.position
+            else:
+                value = obj.get()
+            # Stored in the old dict if the cache was cleared meanwhile
+            cache[attr] = value
+            return value
+
     def is_diamond(self):
         """Check if tower 2 is with Diamond (C) material."""
-        return (self.h2n_state.position == 'C' and
-                self.y2_state.position == 'C' and
-                self.chi2_state.position == 'C')
+        return (self._cached('h2n_state') == 'C' and
+                self._cached('y2_state') == 'C' and
+                self._cached('chi2_state') == 'C')
 
     def is_silicon(self):
         """Check if tower 2 is with Silicon (Si) material."""
-        return (self.h2n_state.position == 'Si' and
-                self.y2_state.position == 'Si' and
-                self.chi2_state.position == 'Si')
+        return (self._cached('h2n_state') == 'Si' and
+                self._cached('y2_state') == 'Si' and
+                self._cached('chi2_state') == 'Si')
 
     def get_reflection(self):
         """
@@ -498,9 +558,9 @@ class CrystalTower2(BaseInterface, GroupDevice):
         """
         reflection = None
         if self.is_diamond():
-            reflection = self.diamond_reflection.get()
+            reflection = self._cached('diamond_reflection')
         elif self.is_silicon():
-            reflection = self.silicon_reflection.get()
+            reflection = self._cached('silicon_reflection')
 
         if reflection is not None:
             return tuple(reflection)
@@ -830,7 +890,7 @@ class LODCMEnergySi(FltMvInterface, PseudoPositioner, GroupDevice):
         reflection = reflection or self.get_reflection()
         th = self.th1Si.wm()
         length = (2 * np.sin(np.deg2rad(th)) *
-                  diffraction.d_space(material, reflection))
+                  get_d_space(material, reflection))
         return common.wavelength_to_energy(length) / 1000
 
     def calc_geometry(self, energy, material='Si', reflection=None):
@@ -850,7 +910,7 @@ class LODCMEnergySi(FltMvInterface, PseudoPositioner, GroupDevice):
             Returns `theta` in degrees and `zm` TODO: what is this?
         """
         reflection = reflection or self.get_reflection()
-        th, z = diffraction.get_lom_geometry(energy*1e3, material, reflection)
+        th, z = get_lom_geometry(energy, material, reflection)
         return (th, z)
 
     @pseudo_position_argument
@@ -905,7 +965,7 @@ class LODCMEnergySi(FltMvInterface, PseudoPositioner, GroupDevice):
             return self.PseudoPosition(energy=np.NaN)
         real_pos = self.RealPosition(*real_pos)
         length = (2 * np.sin(np.deg2rad(real_pos.th1Si))
-                    * diffraction.d_space('Si', reflection))
+                    * get_d_space('Si', reflection))
         if length == 0:
             # don't bother transforming this
             # TODO maybe catch error in common.wave.. when send 0
@@ -1059,7 +1119,7 @@ class LODCMEnergyC(FltMvInterface, PseudoPositioner, GroupDevice):
         reflection = reflection or self.get_reflection()
         th = self.th1C.wm()
         length = (2 * np.sin(np.deg2rad(th)) *
-                  diffraction.d_space(material, reflection))
+                  get_d_space(material, reflection))
         return common.wavelength_to_energy(length) / 1000
 
     def calc_geometry(self, energy, material='C', reflection=None):
@@ -1079,7 +1139,7 @@ class LODCMEnergyC(FltMvInterface, PseudoPositioner, GroupDevice):
             Returns `theta` in degrees and `zm` TODO: what is this?
         """
         reflection = reflection or self.get_reflection()
-        th, z = diffraction.get_lom_geometry(energy*1e3, material, reflection)
+        th, z = get_lom_geometry(energy, material, reflection)
         return (th, z)
 
     @pseudo_position_argument
@@ -1133,7 +1193,7 @@ class LODCMEnergyC(FltMvInterface, PseudoPositioner, GroupDevice):
             return self.PseudoPosition(energy=np.NaN)
         real_pos = self.RealPosition(*real_pos)
         length = (2 * np.sin(np.deg2rad(real_pos.th1C))
-                    * diffraction.d_space('C', reflection))
+                    * get_d_space('C', reflection))
         if length == 0:
             # don't bother transforming this
             # TODO maybe catch error in common.wave.. when send 0
@@ -1272,7 +1332,7 @@ class LODCMEnergyC1(FltMvInterface, PseudoPositioner, GroupDevice):
         reflection = reflection or self.get_reflection()
         th = self.th1C.wm()
         length = (2 * np.sin(np.deg2rad(th)) *
-                  diffraction.d_space(material, reflection))
+                  get_d_space(material, reflection))
         return common.wavelength_to_energy(length) / 1000
 
     def calc_geometry(self, energy, material='C', reflection=None):
@@ -1292,7 +1352,7 @@ class LODCMEnergyC1(FltMvInterface, PseudoPositioner, GroupDevice):
             Returns `theta` in degrees and `zm` TODO: what is this?
         """
         reflection = reflection or self.get_reflection()
-        th, z = diffraction.get_lom_geometry(energy*1e3, material, reflection)
+        th, z = get_lom_geometry(energy, material, reflection)
         return (th, z)
 
     @pseudo_position_argument
@@ -1344,7 +1404,7 @@ class LODCMEnergyC1(FltMvInterface, PseudoPositioner, GroupDevice):
             return self.PseudoPosition(energy=np.NaN)
         real_pos = self.RealPosition(*real_pos)
         length = (2 * np.sin(np.deg2rad(real_pos.th1C))
-                    * diffraction.d_space('C', reflection))
+                    * get_d_space('C', reflection))
         if length == 0:
             # don't bother transforming this
             # TODO maybe catch error in common.wave.. when send 0
@@ -1753,8 +1813,7 @@ class LODCM(BaseInterface, GroupDevice, LightpathMixin):
         # try to determine the material and reflection:
         material = material or self.get_material()
         reflection = reflection or self.get_reflection()
-        th, z = diffraction.get_lom_geometry(energy * 1e3, material,
-                                             reflection)
+        th, z = get_lom_geometry(energy, material, reflection)
         if material == 'Si':
             self.th1Si.set_current_position(th)
             self.th2Si.set_current_position(th)
@@ -2213,6 +2272,47 @@ class XPPLODCM(LODCM):
         )
 
 
+@functools.lru_cache(maxsize=64)
+def _d_space(material, reflection):
+    return diffraction.d_space(material, reflection)
+
+
+@functools.lru_cache(maxsize=4096)
+def _lom_geometry(energy, material, reflection):
+    return diffraction.get_lom_geometry(energy * 1e3, material, reflection)
+
+
+def get_d_space(material, reflection):
+    """
+    Get the d-spacing of a crystal reflection in m.
+
+    This is `pcdscalc.diffraction.d_space`, cached by material and
+    reflection.
+    """
+    return _d_space(str(material), tuple(reflection))
+
+
+def get_lom_geometry(energy, material, reflection):
+    """
+    Calculate the LODCM geometry for a photon energy in keV.
+
+    This is `pcdscalc.diffraction.get_lom_geometry`, cached by energy,
+    material and reflection for the last few thousand calls.
+
+    Returns
+    -------
+    th, z : tuple
+        The crystal angle in degrees and the z position in mm.
+    """
+    return _lom_geometry(float(energy), str(material), tuple(reflection))
+
+
+def clear_lodcm_caches():
+    """Clear the caches of `get_d_space` and `get_lom_geometry`."""
+    _d_space.cache_clear()
+    _lom_geometry.cache_clear()
+
+
 class SimFirstTower(CrystalTower1):
     """Crystal Tower 1 Simulator for Testing."""
     # first tower
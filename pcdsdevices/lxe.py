@@ -35,7 +35,6 @@ import typing
 import numpy as np
 from ophyd import Component as Cpt
 from ophyd import EpicsSignal, PVPositioner
-from scipy.constants import speed_of_light
 
 from .device import UnrelatedComponent as UCpt
 from .epics_motor import DelayNewport, EpicsMotorInterface
@@ -45,11 +44,13 @@ from .pseudopos import (LookupTablePositioner, PseudoSingleInterface,
                         real_position_argument)
 from .signal import NotepadLinkedSignal, UnitConversionDerivedSignal
 from .sim import FastMotor
-from .utils import convert_unit, get_status_float, get_status_value
+from .utils import LazyModule, convert_unit, get_status_float, get_status_value
 
 if typing.TYPE_CHECKING:
     import matplotlib  # noqa
 
+constants = LazyModule('scipy.constants')
+
 
 def load_calibration_file(filename: typing.Union[pathlib.Path, str]) -> np.ndarray:
     """
@@ -603,7 +604,7 @@ class _ReversedTimeToolDelay(DelayNewport):
         """Convert delay unit to motor unit."""
         seconds = convert_unit(-pseudo_pos.delay - self.user_offset.get(),
                                self.delay.egu, 'seconds')
-        meters = seconds * speed_of_light / self.n_bounces
+        meters = seconds * constants.speed_of_light / self.n_bounces
         motor_value = convert_unit(meters, 'meters', self.motor.egu)
         return self.RealPosition(motor=motor_value)
 
@@ -611,7 +612,7 @@ class _ReversedTimeToolDelay(DelayNewport):
     def inverse(self, real_pos):
         """Convert motor unit to delay unit."""
         meters = convert_unit(real_pos.motor, self.motor.egu, 'meters')
-        seconds = meters / speed_of_light * self.n_bounces
+        seconds = meters / constants.speed_of_light * self.n_bounces
         delay_value = convert_unit(seconds, 'seconds', self.delay.egu)
         return self.PseudoPosition(delay=-(delay_value
                                            + self.user_offset.get()))
@@ -1,7 +1,9 @@
 import copy
 import enum
+import functools
 import logging
 import time
+import typing
 import warnings
 
 import numpy as np
@@ -13,16 +15,17 @@ from ophyd.positioner import PositionerBase
 from ophyd.pseudopos import (PseudoSingle, pseudo_position_argument,
                              real_position_argument)
 from ophyd.signal import EpicsSignal
-from scipy.constants import speed_of_light
 
 from .device import InterfaceComponent as ICpt
 from .device import InterfaceDevice
 from .interface import FltMvInterface
 from .signal import NotepadLinkedSignal
 from .sim import FastMotor
-from .utils import convert_unit, get_status_float, get_status_value
+from .utils import LazyModule, convert_unit, get_status_float, get_status_value
 
 logger = logging.getLogger(__name__)
+constants = LazyModule('scipy.constants')
+interpolate = LazyModule('scipy.interpolate')
 
 
 class PseudoSingleInterface(FltMvInterface, PseudoSingle):
@@ -801,7 +804,7 @@ class DelayBase(FltMvInterface, PseudoPositioner):
         """Convert delay unit to motor unit."""
         seconds = convert_unit(pseudo_pos.delay - self.user_offset.get(),
                                self.delay.egu, 'seconds')
-        meters = seconds * speed_of_light / self.n_bounces
+        meters = seconds * constants.speed_of_light / self.n_bounces
         motor_value = convert_unit(meters, 'meters', self.motor.egu)
         return self.RealPosition(motor=motor_value)
 
@@ -809,7 +812,7 @@ class DelayBase(FltMvInterface, PseudoPositioner):
     def inverse(self, real_pos):
         """Convert motor unit to delay unit."""
         meters = convert_unit(real_pos.motor, self.motor.egu, 'meters')
-        seconds = meters / speed_of_light * self.n_bounces
+        seconds = meters / constants.speed_of_light * self.n_bounces
         delay_value = convert_unit(seconds, 'seconds', self.delay.egu)
         return self.PseudoPosition(delay=delay_value + self.user_offset.get())
 
@@ -921,12 +924,131 @@ class SimDelayStage(DelayBase):
 delay_classes[FastMotor] = SimDelayStage
 
 
+class LookupTable:
+    """
+    Interpolation between the columns of a look-up table.
+
+    Any column can be looked up from any other one. The first time a
+    direction is used, the rows are sorted by the source column and
+    checked, and the resulting interpolator is kept for later calls. The
+    values to look up can be floats or arrays.
+
+    Parameters
+    ----------
+    table : np.ndarray
+        2D table with one column per axis.
+
+    column_names : list of str
+        The names of the columns.
+
+    kind : {'linear', 'cubic', 'pchip'}, optional
+        Linear interpolation (default), a cubic spline, or a monotonic
+        cubic (PCHIP) interpolation. Values outside of the table are
+        clipped to its range.
+    """
+
+    kinds = ('linear', 'cubic', 'pchip')
+
+    table: np.ndarray
+    column_names: tuple[str, ...]
+    kind: str
+
+    def __init__(self, table: np.ndarray, column_names: list[str],
+                 kind: str = 'linear'):
+        table = np.asarray(table, dtype=float)
+        if table.ndim != 2:
+            raise ValueError(f'Unsupported table dimensions: {table.shape}')
+        if len(column_names) != table.shape[-1]:
+            raise ValueError(
+                'Incorrect number of column names for the given table.'
+            )
+        if table.shape[0] < 2:
+            raise ValueError('The table needs at least two rows.')
+        if not np.all(np.isfinite(table)):
+            raise ValueError('The table has non-finite values.')
+        if kind not in self.kinds:
+            raise ValueError(
+                f'Unsupported interpolation {kind}, use one of {self.kinds}'
+            )
+        self.table = table
+        self.column_names = tuple(column_names)
+        self.kind = kind
+        self._columns = {
+            column_name: table[:, idx]
+            for idx, column_name in enumerate(column_names)
+        }
+        self._interpolators = {}
+
+    def column(self, name: str) -> np.ndarray:
+        """The values of one column, in the order of the table."""
+        return self._columns[name]
+
+    def interpolator(self, source: str, target: str):
+        """
+        Get the function that looks up column ``target`` from ``source``.
+
+        Raises
+        ------
+        ValueError
+            If ``source`` has repeated values.
+        """
+        try:
+            return self._interpolators[source, target]
+        except KeyError:
+            pass
+        x = self._columns[source]
+        order = np.argsort(x, kind='stable')
+        if np.any(np.diff(x[order]) == 0):
+            raise ValueError(
+                f'Column {source} has repeated values, {target} cannot be '
+                'looked up from it.'
+            )
+        steps = np.diff(x)
+        if not (np.all(steps > 0) or np.all(steps < 0)):
+            logger.warning(
+                'Column %s is not monotonic in the table, looking up %s '
+                'from it is ambiguous.', source, target
+            )
+        x = np.ascontiguousarray(x[order])
+        y = np.ascontiguousarray(self._columns[target][order])
+        if self.kind == 'linear':
+            func = functools.partial(np.interp, xp=x, fp=y)
+        else:
+            if self.kind == 'cubic':
+                spline = interpolate.CubicSpline(x, y)
+            else:
+                spline = interpolate.PchipInterpolator(x, y)
+
+            def func(values):
+                return spline(np.clip(values, x[0], x[-1]))
+
+        self._interpolators[source, target] = func
+        return func
+
+    def interpolate(self, source: str, target: str, values):
+        """
+        Look up column ``target`` at ``values`` of column ``source``.
+
+        Returns a float for a float input, an array for an array input.
+        """
+        result = self.interpolator(source, target)(values)
+        if np.ndim(result) == 0:
+            return float(result)
+        return result
+
+
 class LookupTablePositioner(PseudoPositioner):
     """
     A pseudo positioner which uses a look-up table to compute positions.
 
-    Currently supports 1 pseudo positioner and 1 "real" positioner, which
-    should be columns of a 2D numpy.ndarray ``table``.
+    Each pseudo and real positioner is a column of the 2D numpy.ndarray
+    ``table``. The table describes one path through all of them: the real
+    positions are looked up from one pseudo column, and the pseudo positions
+    are looked up from one real column. By default these are the first
+    pseudo and the first real positioners.
+
+    For arrays of positions, e.g. to plan a scan, use
+    ``lookup.interpolate(source_name, target_name, values)``.
 
     For additional ``__init__`` arguments, see :class:`ophyd.PseudoPositioner`.
 
@@ -945,19 +1067,38 @@ class LookupTablePositioner(PseudoPositioner):
         List of column names, corresponding to the component attribute names.
         That is, if you have a real motor ``mtr = Cpt(EpicsMotor, ...)``,
         ``"mtr"`` should be in the list of column names of the table.
+
+    interpolation : {'linear', 'cubic', 'pchip'}, optional
+        How to interpolate between the rows of the table, see
+        `LookupTable`.
+
+    forward_column : str, optional
+        The pseudo positioner the real positions are looked up from.
+
+    inverse_column : str, optional
+        The real positioner the pseudo positions are looked up from.
     """
 
     table: np.ndarray
     column_names: tuple[str, ...]
+    lookup: LookupTable
     _table_data_by_name: dict[str, np.ndarray]
 
     def __init__(self, *args,
                  table: np.ndarray,
                  column_names: list[str],
+                 interpolation: str = 'linear',
+                 forward_column: typing.Optional[str] = None,
+                 inverse_column: typing.Optional[str] = None,
                  **kwargs):
+        # Set up before the readback subscriptions can call inverse
+        self._forward_column = forward_column
+        self._inverse_column = inverse_column
+        self.lookup = LookupTable(table, column_names, kind=interpolation)
+        self.table = self.lookup.table
+        self.column_names = self.lookup.column_names
+        self._table_data_by_name = self.lookup._columns
         super().__init__(*args, **kwargs)
-        self.table = table
-        self.column_names = tuple(column_names)
         missing = set()
         for positioner in self._real + self._pseudo:
             if positioner.attr_name not in column_names:
@@ -966,19 +1107,22 @@ class LookupTablePositioner(PseudoPositioner):
         if missing:
             raise ValueError(f'Positioners {missing} not present in the table')
 
-        if len(column_names) != self.table.shape[-1]:
+        self._forward_column = forward_column or self._pseudo[0].attr_name
+        if self._forward_column not in self.PseudoPosition._fields:
             raise ValueError(
-                'Incorrect number of column names for the given table.'
+                f'{self._forward_column} is not a pseudo positioner'
+            )
+        self._inverse_column = inverse_column or self._real[0].attr_name
+        if self._inverse_column not in self.RealPosition._fields:
+            raise ValueError(
+                f'{self._inverse_column} is not a real positioner'
             )
 
-        # For now, no fancy interpolation options
-        if len(table.shape) != 2:
-            raise ValueError(f'Unsupported table dimensions: {table.shape}')
-
-        self._table_data_by_name = {
-            column_name: self.table[:, idx]
-            for idx, column_name in enumerate(column_names)
-        }
+        # Check the lookup directions now rather than on the first move
+        for real_field in self.RealPosition._fields:
+            self.lookup.interpolator(self._forward_column, real_field)
+        for pseudo_field in self.PseudoPosition._fields:
+            self.lookup.interpolator(self._inverse_column, pseudo_field)
 
         for attr, data in self._table_data_by_name.items():
             obj = getattr(self, attr)
@@ -996,8 +1140,6 @@ class LookupTablePositioner(PseudoPositioner):
         '''
         Calculate a RealPosition from a given PseudoPosition
 
-        Must be defined on the subclass.
-
         Parameters
         ----------
         pseudo_pos : PseudoPosition
@@ -1008,24 +1150,17 @@ class LookupTablePositioner(PseudoPositioner):
         real_position : RealPosition
             The real position output, a namedtuple.
         '''
-        values = pseudo_pos._asdict()
-
-        pseudo_field, = self.PseudoPosition._fields
-        real_field, = self.RealPosition._fields
-
-        real_value = np.interp(
-            values[pseudo_field],
-            self._table_data_by_name[pseudo_field],
-            self._table_data_by_name[real_field]
-        )
-        return self.RealPosition(**{real_field: real_value})
+        source = self._forward_column or self.PseudoPosition._fields[0]
+        value = getattr(pseudo_pos, source)
+        return self.RealPosition(**{
+            real_field: self.lookup.interpolate(source, real_field, value)
+            for real_field in self.RealPosition._fields
+        })
 
     @real_position_argument
     def inverse(self, real_pos: tuple) -> tuple:
         '''Calculate a PseudoPosition from a given RealPosition
 
-        Must be defined on the subclass.
-
         Parameters
         ----------
         real_position : RealPosition
@@ -1036,16 +1171,12 @@ class LookupTablePositioner(PseudoPositioner):
         pseudo_pos : PseudoPosition
             The pseudo position output
         '''
-        values = real_pos._asdict()
-        pseudo_field, = self.PseudoPosition._fields
-        real_field, = self.RealPosition._fields
-
-        pseudo_value = np.interp(
-            values[real_field],
-            self._table_data_by_name[real_field],
-            self._table_data_by_name[pseudo_field]
-        )
-        return self.PseudoPosition(**{pseudo_field: pseudo_value})
+        source = self._inverse_column or self.RealPosition._fields[0]
+        value = getattr(real_pos, source)
+        return self.PseudoPosition(**{
+            pseudo_field: self.lookup.interpolate(source, pseudo_field, value)
+            for pseudo_field in self.PseudoPosition._fields
+        })
 
 
 class OffsetMotorBase(FltMvInterface, PseudoPositioner):
@@ -1,5 +1,6 @@
 import logging
 
+import numpy as np
 from ophyd import Component as Cpt
 from ophyd import Device, EpicsSignal, EpicsSignalRO
 from ophyd.flyers import FlyerInterface, MonitorFlyerMixin
@@ -10,6 +11,108 @@ from .interface import BaseInterface
 
 logger = logging.getLogger(__name__)
 
+# Number of lines in the sequencer waveforms
+SEQUENCE_LENGTH = 2048
+# One line of the event sequence
+sequence_dtype = np.dtype([
+    ('beam_code', np.int32),
+    ('delta_beam', np.int32),
+    ('delta_fiducial', np.int32),
+    ('burst_count', np.int32),
+])
+
+
+class SequenceWriteError(RuntimeError):
+    """Exception raised when a written sequence does not read back."""
+    pass
+
+
+def sequence_array(beam_code, delta_beam=0, delta_fiducial=0,
+                   burst_count=0):
+    """
+    Build an event sequence from one array per column.
+
+    The arguments are broadcast against each other, so scalars can be used for
+    the columns that are the same on every line.
+
+    Parameters
+    ----------
+    beam_code : array_like
+        Event code of each line.
+    delta_beam : array_like, optional
+        Number of beam pulses to wait before each line.
+    delta_fiducial : array_like, optional
+        Number of fiducials to wait before each line.
+    burst_count : array_like, optional
+        Burst count of each line.
+
+    Returns
+    -------
+    sequence : np.ndarray
+        Structured array with the `sequence_dtype` fields.
+
+    Examples
+    --------
+    Fire 182 then 170 on the same shot, every other shot:
+    >>> sequence_array([182, 170], delta_beam=[2, 0])
+    """
+    columns = np.broadcast_arrays(
+        np.atleast_1d(beam_code), delta_beam, delta_fiducial, burst_count
+    )
+    if columns[0].ndim != 1:
+        raise ValueError('Sequence columns must be one-dimensional.')
+    sequence = np.empty(len(columns[0]), dtype=sequence_dtype)
+    for field, column in zip(sequence_dtype.names, columns):
+        sequence[field] = column
+    return sequence
+
+
+def periodic_sequence(event_codes, periods, num_shots, offsets=0):
+    """
+    Build a sequence that fires event codes periodically.
+
+    Event code ``event_codes[i]`` fires on every shot ``n`` below
+    ``num_shots`` where ``(n - offsets[i]) % periods[i] == 0``. Codes firing
+    on the same shot are on consecutive lines, in the order given. The first
+    line waits for the shots left over at the end of the sequence, so the
+    pattern is unchanged when the sequence is looped.
+
+    Parameters
+    ----------
+    event_codes : array_like of int
+        The event codes to fire.
+    periods : array_like of int
+        The period of each event code, in beam pulses.
+    num_shots : int
+        The number of beam pulses the sequence lasts.
+    offsets : array_like of int, optional
+        The first shot of each event code.
+
+    Returns
+    -------
+    sequence : np.ndarray
+        Structured array with the `sequence_dtype` fields.
+
+    Examples
+    --------
+    Pump every other shot and probe every shot:
+    >>> periodic_sequence([90, 91], [2, 1], num_shots=120)
+    """
+    event_codes, periods, offsets = np.broadcast_arrays(
+        np.atleast_1d(event_codes), periods, offsets
+    )
+    if np.any(periods < 1):
+        raise ValueError('Periods must be at least one beam pulse.')
+    shots = np.arange(num_shots)
+    fires = (shots - offsets[:, np.newaxis]) % periods[:, np.newaxis] == 0
+    fires &= shots >= offsets[:, np.newaxis]
+    # Transposing orders the lines by shot, then by event code
+    shot_idx, code_idx = np.nonzero(fires.T)
+    if not len(shot_idx):
+        return np.empty(0, dtype=sequence_dtype)
+    delta_beam = np.diff(shot_idx, prepend=shot_idx[-1] - num_shots)
+    return sequence_array(event_codes[code_idx], delta_beam=delta_beam)
+
 
 class EventSequence(BaseInterface, Device):
     """Class for the event sequence of the event sequencer."""
@@ -19,7 +122,137 @@ class EventSequence(BaseInterface, Device):
     bc_array = Cpt(EpicsSignal, ':SEQ.D')
     seq_proc = Cpt(EpicsSignal, ':SEQ.PROC')
 
-    tab_whitelist = ['get_seq', 'put_seq', 'show']
+    # The waveform holding each field of sequence_dtype
+    _field_arrays = dict(zip(sequence_dtype.names,
+                             ('ec_array', 'bd_array', 'fd_array',
+                              'bc_array')))
+
+    tab_whitelist = ['get_seq', 'put_seq', 'get_array', 'put_array', 'show']
+
+    def _read_columns(self, fields=sequence_dtype.names, **kwargs):
+        """Read the whole waveforms of the given fields."""
+        columns = {}
+        for field in fields:
+            value = getattr(self, self._field_arrays[field]).get(**kwargs)
+            column = np.zeros(SEQUENCE_LENGTH, dtype=sequence_dtype[field])
+            value = np.atleast_1d(value)[:SEQUENCE_LENGTH]
+            column[:len(value)] = value
+            columns[field] = column
+        return columns
+
+    def get_array(self, current_length=True):
+        """
+        Retrieve the current event sequence as a structured array.
+
+        This is the array version of `get_seq`, with one line of the sequence
+        per element and the fields of `sequence_dtype`.
+
+        Parameters
+        ----------
+        current_length : bool
+            Option to retrieve the sequence up to the current length. Defaults
+            to `True`.
+
+        Returns
+        -------
+        sequence : np.ndarray
+            Structured array of the sequence lines.
+        """
+        if self.parent and current_length is True:
+            seq_length = self.parent.sequence_length.get()
+        else:
+            seq_length = SEQUENCE_LENGTH  # Whole thing
+
+        columns = self._read_columns()
+        sequence = np.empty(min(seq_length, SEQUENCE_LENGTH),
+                            dtype=sequence_dtype)
+        for field, column in columns.items():
+            sequence[field] = column[:len(sequence)]
+        return sequence
+
+    def put_array(self, sequence, update_length=True, verify=True):
+        """
+        Write a structured array sequence to the event sequencer.
+
+        This is the array version of `put_seq`. Only the waveforms that differ
+        from the current sequence are written, and the sequencer is only
+        updated if a waveform or the play length changed. The written
+        waveforms are then read back once to check that the sequencer took
+        them.
+
+        Parameters
+        ----------
+        sequence : np.ndarray
+            Structured array with the fields of `sequence_dtype`, for example
+            from `sequence_array` or `periodic_sequence`.
+
+        update_length : bool
+            Option to automatically update the play length (the '{prefix}:LEN'
+            PV) to the length of the written sequence. Defaults to `True`.
+
+        verify : bool
+            Option to read back the written waveforms. Defaults to `True`.
+
+        Returns
+        -------
+        written : list of str
+            The fields of the waveforms that were written.
+
+        Raises
+        ------
+        SequenceWriteError
+            If a written waveform does not read back as expected.
+        """
+        sequence = np.asarray(sequence)
+        if sequence.dtype.names is None or any(
+                field not in sequence.dtype.names
+                for field in sequence_dtype.names):
+            raise ValueError(
+                f'Expected a structured array with the fields '
+                f'{sequence_dtype.names}, got {sequence.dtype}.'
+            )
+        if sequence.ndim != 1 or len(sequence) > SEQUENCE_LENGTH:
+            raise ValueError(
+                f'Expected a one-dimensional sequence of at most '
+                f'{SEQUENCE_LENGTH} lines, got shape {sequence.shape}.'
+            )
+
+        # Update the length of the sequence if update_length == True and
+        # the event sequence is a child of the EventSequencer
+        length_written = False
+        if self.parent and update_length is True:
+            if self.parent.sequence_length.get() != len(sequence):
+                self.parent.sequence_length.put(len(sequence))
+                length_written = True
+
+        columns = self._read_columns()
+        written = []
+        for field, column in columns.items():
+            new_column = column.copy()
+            new_column[:len(sequence)] = sequence[field]
+            if np.array_equal(new_column, column):
+                continue
+            getattr(self, self._field_arrays[field]).put(new_column)
+            columns[field] = new_column
+            written.append(field)
+
+        if not written and not length_written:
+            logger.debug('Sequence unchanged, nothing written')
+            return written
+        self.seq_proc.put(1)  # Force the sequencer to update sequence
+
+        if verify:
+            # Bypass the monitors, which may not have updated yet
+            readback = self._read_columns(written, use_monitor=False)
+            mismatched = [field for field in written
+                          if not np.array_equal(readback[field],
+                                                columns[field])]
+            if mismatched:
+                raise SequenceWriteError(
+                    f'Sequence {", ".join(mismatched)} did not read back '
+                    f'as written.'
+                )
+        return written
 
     def get_seq(self, current_length=True):
         """
@@ -31,6 +264,8 @@ class EventSequence(BaseInterface, Device):
         `current_length` option is set to :keyword:`False`. If
         :keyword:`False`, the whole sequence will be returned.
 
+        Use `get_array` to get the sequence as a structured array instead.
+
         Parameters
         ----------
         current_length : bool
@@ -44,24 +279,8 @@ class EventSequence(BaseInterface, Device):
         Get the whole sequence:
         >>> EventSequence.get_seq(current_length=False)
         """
-
-        if self.parent and current_length is True:
-            seq_length = self.parent.sequence_length.get()
-        else:
-            seq_length = 2048  # Whole thing
-
-        sequence = [[], [], [], []]
-        sequence[0] = self.ec_array.get()[0:seq_length]
-        sequence[1] = self.bd_array.get()[0:seq_length]
-        sequence[2] = self.fd_array.get()[0:seq_length]
-        sequence[3] = self.bc_array.get()[0:seq_length]
-
-        zip_seq = zip(sequence[0], sequence[1], sequence[2], sequence[3])
-        seq_list = list(zip_seq)
-        # Convert list of tuples (from zip) to list of lists
-        seq = [list(line) for line in seq_list]
-
-        return seq
+        sequence = self.get_array(current_length=current_length)
+        return [list(line) for line in sequence.tolist()]
 
     def put_seq(self, sequence, update_length=True):
         """
@@ -74,6 +293,8 @@ class EventSequence(BaseInterface, Device):
         sequencer will automatically be updated, unless the `update_length`
         flag is set to :keyword:`False`.
 
+        Use `put_array` to write a structured array instead.
+
         Parameters
         ----------
         sequence : list
@@ -97,25 +318,16 @@ class EventSequence(BaseInterface, Device):
         Don't update length:
         >>> EventSequence.put_seq(seq, update_length=False)
         """
-
-        curr_seq = self.get_seq(current_length=False)
-        new_seq = curr_seq.copy()
-
-        for i in range(len(sequence)):
-            new_seq[i] = sequence[i]
-
-        # Update the length of the sequence if update_length == True and
-        # the event sequence is a child of the EventSequencer
-        if self.parent and update_length is True:
-            new_len = len(sequence)
-            self.parent.sequence_length.put(new_len)
-
-        seq = [arr for arr in zip(*new_seq)]
-        self.ec_array.put(seq[0])
-        self.bd_array.put(seq[1])
-        self.fd_array.put(seq[2])
-        self.bc_array.put(seq[3])
-        self.seq_proc.put(1)  # Force the sequencer to update sequence
+        lines = np.asarray(sequence, dtype=np.int32)
+        if not lines.size:
+            lines = lines.reshape(0, len(sequence_dtype.names))
+        if lines.ndim != 2 or lines.shape[1] != len(sequence_dtype.names):
+            raise ValueError(
+                f'Expected sequence lines of {len(sequence_dtype.names)} '
+                f'items, got shape {lines.shape}.'
+            )
+        self.put_array(sequence_array(*lines.T), update_length=update_length,
+                       verify=False)
 
     def show(self, num_lines=None):
         """
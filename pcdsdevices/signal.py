@@ -9,13 +9,18 @@ if __name__ != 'pcdsdevices.signal':
                        'inside the pcdsdevices directory and can cause '
                        'extremely confusing bugs. Please run your script '
                        'elsewhere for better results.')
+import bisect
+import collections
 import contextlib
 import dataclasses
 import inspect
 import itertools
 import logging
+import math
 import numbers
+import time
 import typing
+import warnings
 from threading import RLock
 from typing import Any, Generator, Mapping, Optional, Union
 
@@ -153,17 +158,27 @@ class AggregateSignal(Signal):
 
     This signal type is intended to be used programmatically with a subclass.
     For simple per-device usage, see :class:`MultiDerivedSignal`.
+
+    Running counts of connected signals and cached values are kept up to date
+    as each constituent signal changes, so connectivity and readiness checks
+    do not need to walk every signal on each callback.
     """
 
     _update_only_on_change: bool = True
     _has_subscribed: bool
     _signals: dict[Signal, _AggregateSignalState]
+    _num_connected: int
+    _num_with_values: int
+    _num_ready: int
 
     def __init__(self, *, name, value=None, **kwargs):
         super().__init__(name=name, value=value, **kwargs)
         self._has_subscribed = False
         self._lock = RLock()
         self._signals = {}
+        self._num_connected = 0
+        self._num_with_values = 0
+        self._num_ready = 0
 
     def _calc_readback(self):
         """
@@ -183,16 +198,41 @@ class AggregateSignal(Signal):
     def _insert_value(self, signal, value):
         """Update the cache with one value and recalculate."""
         with self._lock:
-            self._signals[signal].value = value
+            self._set_cached_value(self._signals[signal], value)
             self._update_readback()
             return self._readback
 
+    def _count_signal_state(
+        self, siginfo: _AggregateSignalState, sign: int
+    ) -> None:
+        """Add (sign=1) or remove (sign=-1) one signal from the counters."""
+        has_value = siginfo.value is not None
+        self._num_connected += sign * siginfo.connected
+        self._num_with_values += sign * has_value
+        self._num_ready += sign * (siginfo.connected and has_value)
+
+    def _set_cached_value(
+        self, siginfo: _AggregateSignalState, value: OphydDataType
+    ) -> None:
+        """Update the cached value of one signal, keeping counts current."""
+        with self._lock:
+            self._count_signal_state(siginfo, -1)
+            siginfo.value = value
+            self._count_signal_state(siginfo, 1)
+
+    def _set_cached_connected(
+        self, siginfo: _AggregateSignalState, connected: bool
+    ) -> None:
+        """Update the connection status of one signal, keeping counts."""
+        with self._lock:
+            self._count_signal_state(siginfo, -1)
+            siginfo.connected = bool(connected)
+            self._count_signal_state(siginfo, 1)
+
     @property
     def _have_values(self) -> bool:
         """Is the value cache populated?"""
-        return all(
-            siginfo.value is not None for siginfo in self._signals.values()
-        )
+        return self._num_with_values == len(self._signals)
 
     def _update_readback(self) -> Optional[OphydDataType]:
         """
@@ -226,7 +266,7 @@ class AggregateSignal(Signal):
         """
         with self._lock:
             for signal, siginfo in self._signals.items():
-                siginfo.value = signal.get(**kwargs)
+                self._set_cached_value(siginfo, signal.get(**kwargs))
             return self._update_readback()
 
     def put(self, value, **kwargs):
@@ -281,7 +321,7 @@ class AggregateSignal(Signal):
     ) -> None:
         """This is a SUB_META callback from one of the aggregated signals."""
         with self._check_connectivity():
-            self._signals[obj].connected = connected
+            self._set_cached_connected(self._signals[obj], connected)
 
     def _signal_value_callback(self, *, obj: Signal, **kwargs):
         """This is a SUB_VALUE callback from one of the aggregated signals."""
@@ -310,10 +350,7 @@ class AggregateSignal(Signal):
             return False
 
         if self._has_subscribed:
-            return all(
-                siginfo.connected and siginfo.value is not None
-                for siginfo in self._signals.values()
-            )
+            return self._num_ready == len(self._signals)
 
         # Only check connectivity status of the signal; cross fingers that it
         # reflects both being connected and having a not-None value.
@@ -406,7 +443,10 @@ class AggregateSignal(Signal):
             sig = getattr(sig, part)
 
         # Add if not yet there; but do not subscribe just yet.
-        self._signals[sig] = _AggregateSignalState(signal=sig)
+        with self._lock:
+            if sig in self._signals:
+                self._count_signal_state(self._signals[sig], -1)
+            self._signals[sig] = _AggregateSignalState(signal=sig)
         return sig
 
     def destroy(self):
@@ -433,7 +473,9 @@ class SummarySignal(AggregateSignal):
     care about instead.
     """
     def _calc_readback(self):
-        values = tuple(sig.get() for sig in self._signals)
+        # Use the cached values, which are kept current by subscriptions or
+        # refreshed by ``get()``, to avoid one read per signal per update.
+        values = tuple(siginfo.value for siginfo in self._signals.values())
         # We return a hash here, rather than the tuple, to always provide
         # an ophyd-compatible datatype.
         return hash(values)
@@ -791,6 +833,14 @@ class AvgSignal(Signal):
     Warning: this means that if we only have recieved ONE value, the mean will
     just be the mean of a single value!
 
+    The mean is kept as a running sum, so an update costs the same regardless
+    of the buffer size. Other statistics of the same window can be tracked on
+    request and read with `get_statistic` or through `AvgStatSignal`
+    components. ``std``, ``min`` and ``max`` are also O(1) per update, while
+    ``median`` keeps a sorted copy of the window and costs O(n) per update.
+    ``ema`` is an exponential moving average of every value received, and is
+    not limited to the window.
+
     Parameters
     ----------
     signal : Signal
@@ -800,15 +850,34 @@ class AvgSignal(Signal):
     averages : int
         The number of `SUB_VALUE` updates to include in the average. New values
         after this number is reached will begin overriding old values.
+
+    duration : float, optional
+        If provided, only include the values received in the last ``duration``
+        seconds before the newest value, and at most ``averages`` of them.
+
+    statistics : list of str, optional
+        Extra statistics to track, out of ``std``, ``min``, ``max``,
+        ``median`` and ``ema``.
+
+    ema_alpha : float, optional
+        The smoothing factor of the exponential moving average. Defaults to
+        ``2 / (averages + 1)``.
     """
+    statistic_names = ('mean', 'std', 'min', 'max', 'median', 'ema')
 
-    def __init__(self, signal, averages, *, name, parent=None, **kwargs):
+    def __init__(self, signal, averages, *, name, parent=None, duration=None,
+                 statistics=(), ema_alpha=None, **kwargs):
         super().__init__(name=name, parent=parent, **kwargs)
         if isinstance(signal, str):
             signal = getattr(parent, signal)
         self.raw_sig = signal
         self._lock = RLock()
+        self._tracked = set()
+        self.duration = duration
+        self.ema_alpha = ema_alpha
         self.averages = averages
+        for statistic in statistics:
+            self.track(statistic)
         self.raw_sig.subscribe(self._update_avg)
 
     @property
@@ -825,19 +894,235 @@ class AvgSignal(Signal):
         """Reinitialize an empty internal buffer of size `avg`."""
         with self._lock:
             self._avg = avg
-            self.index = 0
-            # Allocate uninitalized array
-            self.values = np.empty(avg)
-            # Fill with nan
-            self.values.fill(np.nan)
+            # Entries are (sequence number, timestamp, value)
+            self._window = collections.deque()
+            self._seq = 0
+            self._ema = np.nan
+            self._rebuild()
+
+    @property
+    def values(self):
+        """
+        Backcompatibility view of the last `averages` values.
+
+        Laid out as the old ring buffer, padded with nan and written at
+        `index`. This is a copy built on each access, use `window_values`
+        instead.
+        """
+        warnings.warn(
+            'AvgSignal.values is deprecated, please use window_values instead',
+            DeprecationWarning,
+        )
+        with self._lock:
+            values = np.full(self._avg, np.nan)
+            for seq, _, value in self._window:
+                values[(seq - 1) % self._avg] = value
+            return values
+
+    @property
+    def index(self):
+        """
+        Backcompatibility position of the next value in `values`.
+        """
+        warnings.warn(
+            'AvgSignal.index is deprecated, please use window_values instead',
+            DeprecationWarning,
+        )
+        return self._seq % self._avg
+
+    @property
+    def window_values(self):
+        """The values currently averaged over, oldest first."""
+        with self._lock:
+            return np.array([value for _, _, value in self._window],
+                            dtype=float)
 
-    def _update_avg(self, *args, value, **kwargs):
+    @property
+    def statistics(self):
+        """The statistics tracked on top of the mean."""
+        return tuple(name for name in self.statistic_names
+                     if name in self._tracked)
+
+    def track(self, statistic):
+        """
+        Start tracking one more statistic of the buffer.
+
+        Parameters
+        ----------
+        statistic : str
+            One of ``std``, ``min``, ``max``, ``median`` or ``ema``.
+        """
+        if statistic not in self.statistic_names:
+            raise ValueError(
+                f'Unknown statistic {statistic!r}, expected one of '
+                f'{self.statistic_names}'
+            )
+        with self._lock:
+            if statistic not in self._tracked:
+                self._tracked.add(statistic)
+                self._rebuild()
+
+    def get_statistic(self, statistic):
+        """
+        Return the current value of a tracked statistic.
+
+        Statistics of an empty buffer, or one holding only NaN values, are
+        NaN.
+        """
+        with self._lock:
+            if statistic == 'mean':
+                return self._mean()
+            if statistic not in self._tracked:
+                raise ValueError(f'{self.name} is not tracking {statistic!r}')
+            if statistic == 'ema':
+                return self._ema
+            if not self._count:
+                return np.nan
+            if statistic == 'std':
+                mean = self._sum / self._count
+                return math.sqrt(max(self._sumsq / self._count - mean ** 2,
+                                     0.0))
+            if statistic == 'min':
+                return self._min_queue[0][1]
+            if statistic == 'max':
+                return self._max_queue[0][1]
+            # median
+            values = self._sorted
+            mid = len(values) // 2
+            if len(values) % 2:
+                return values[mid]
+            return (values[mid - 1] + values[mid]) / 2
+
+    def _mean(self):
+        if not self._count:
+            return np.nan
+        return self._shift + self._sum / self._count
+
+    def _rebuild(self):
+        """Recompute every running statistic from the buffer contents."""
+        self._count = 0
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._shift = 0.0
+        self._removed = 0
+        self._min_queue = collections.deque()
+        self._max_queue = collections.deque()
+        self._sorted = []
+        for seq, _, value in self._window:
+            if not math.isnan(value):
+                self._push(seq, value)
+
+    def _resum(self):
+        """Recompute the running sums to drop accumulated rounding errors."""
+        valid = [value for _, _, value in self._window
+                 if not math.isnan(value)]
+        self._shift = valid[0] if valid else 0.0
+        deltas = [value - self._shift for value in valid]
+        self._count = len(valid)
+        self._sum = math.fsum(deltas)
+        self._sumsq = math.fsum(delta * delta for delta in deltas)
+        self._removed = 0
+
+    def _push(self, seq, value):
+        """Include a non-NaN value in the running statistics."""
+        if not self._count:
+            # Sums are kept relative to a shift to limit cancellation
+            self._shift = value
+        delta = value - self._shift
+        self._count += 1
+        self._sum += delta
+        self._sumsq += delta * delta
+        tracked = self._tracked
+        if 'min' in tracked:
+            queue = self._min_queue
+            while queue and queue[-1][1] >= value:
+                queue.pop()
+            queue.append((seq, value))
+        if 'max' in tracked:
+            queue = self._max_queue
+            while queue and queue[-1][1] <= value:
+                queue.pop()
+            queue.append((seq, value))
+        if 'median' in tracked:
+            bisect.insort(self._sorted, value)
+
+    def _pop(self, seq, value):
+        """Remove the oldest non-NaN value from the running statistics."""
+        delta = value - self._shift
+        self._count -= 1
+        self._sum -= delta
+        self._sumsq -= delta * delta
+        if self._min_queue and self._min_queue[0][0] <= seq:
+            self._min_queue.popleft()
+        if self._max_queue and self._max_queue[0][0] <= seq:
+            self._max_queue.popleft()
+        if 'median' in self._tracked:
+            del self._sorted[bisect.bisect_left(self._sorted, value)]
+        self._removed += 1
+        if self._removed > len(self._window):
+            self._resum()
+
+    def _update_avg(self, *args, value, timestamp=None, **kwargs):
         """Add new value to the buffer, overriding old values if needed."""
+        value = float(value)
+        if timestamp is None:
+            timestamp = time.time()
         with self._lock:
-            self.values[self.index] = value
-            self.index = (self.index + 1) % len(self.values)
-            # This takes a mean, skipping nan values.
-            self.put(np.nanmean(self.values))
+            self._seq += 1
+            window = self._window
+            window.append((self._seq, timestamp, value))
+            if not math.isnan(value):
+                self._push(self._seq, value)
+                if 'ema' in self._tracked:
+                    if math.isnan(self._ema):
+                        self._ema = value
+                    else:
+                        alpha = self.ema_alpha
+                        if alpha is None:
+                            alpha = 2 / (self._avg + 1)
+                        self._ema += alpha * (value - self._ema)
+            oldest = None
+            if self.duration is not None:
+                oldest = timestamp - self.duration
+            while len(window) > self._avg or (
+                    oldest is not None and window[0][1] < oldest):
+                seq, _, old = window.popleft()
+                if not math.isnan(old):
+                    self._pop(seq, old)
+            self.put(self._mean())
+
+
+class AvgStatSignal(Signal):
+    """
+    Signal that reports one statistic of an `AvgSignal`.
+
+    The statistic is tracked by the `AvgSignal` from then on, and this signal
+    updates every time the `AvgSignal` does.
+
+    Parameters
+    ----------
+    signal : AvgSignal or str
+        The averaging signal, or its attribute name on the parent device.
+
+    statistic : str
+        One of ``std``, ``min``, ``max``, ``median`` or ``ema``.
+    """
+
+    def __init__(self, signal, statistic, *, name, parent=None, **kwargs):
+        super().__init__(name=name, parent=parent, **kwargs)
+        if isinstance(signal, str):
+            signal = getattr(parent, signal)
+        self.avg_sig = signal
+        self.statistic = statistic
+        signal.track(statistic)
+        signal.subscribe(self._update_stat, run=False)
+
+    @property
+    def connected(self):
+        return self.avg_sig.connected
+
+    def _update_stat(self, *args, **kwargs):
+        self.put(self.avg_sig.get_statistic(self.statistic))
 
 
 class NotImplementedSignal(SignalRO):
@@ -4,10 +4,10 @@ Module for common target stage stack configurations.
 import json
 import logging
 import os
+import struct
 from datetime import datetime
-from itertools import chain
+from itertools import chain, islice
 
-import jsonschema
 import numpy as np
 import yaml
 from ophyd.device import Device
@@ -15,8 +15,10 @@ from ophyd.device import Device
 from pcdsdevices.epics_motor import _GetMotorClass
 
 from .interface import tweak_base
+from .utils import LazyModule
 
 logger = logging.getLogger(__name__)
+jsonschema = LazyModule('jsonschema')
 
 
 def StageStack(mdict, name):
@@ -298,8 +300,24 @@ class XYGridStage():
     path : str
         Path to an `yaml` file where to save the grid patterns for
         different samples.
+
+    Attributes
+    ----------
+    status_batch_size : int
+        Number of target status changes kept in memory before they are
+        written to the sample file. The default of 1 writes every change
+        right away. Call `flush_statuses` to write pending changes.
+
+    sample_format : str
+        Format used by `save_grid` for new samples, either ``'yaml'`` or
+        ``'grid'`` for a binary `SampleGridFile`. Existing samples keep
+        their format, and a ``.grid`` file is used over a ``.yml`` file
+        of the same name.
     """
 
+    status_batch_size = 1
+    sample_format = 'yaml'
+
     sample_schema = json.loads("""
     {
         "type": "object",
@@ -335,6 +353,9 @@ class XYGridStage():
         self._current_sample = ''
         self._positions_x = []
         self._positions_y = []
+        self._target_map_key = None
+        self._target_map = None
+        self._statuses = None
 
     @property
     def m_n_points(self):
@@ -593,9 +614,29 @@ class XYGridStage():
         with os.scandir(path) as entries:
             for entry in entries:
                 if entry.is_file():
-                    samples.append(entry.name.split('.yml')[0])
+                    name = entry.name.split('.yml')[0]
+                    if name.endswith(SampleGridFile.suffix):
+                        name = name[:-len(SampleGridFile.suffix)]
+                    if name not in samples:
+                        samples.append(name)
         return samples
 
+    def _sample_path(self, sample_name, path=None):
+        """
+        Get the file of a sample in a samples folder.
+
+        This is the ``.grid`` file if there is one, the ``.yml`` file
+        otherwise, or the file to create according to `sample_format`.
+        """
+        path = path or self._path
+        grid = os.path.join(path, sample_name + SampleGridFile.suffix)
+        yml = os.path.join(path, sample_name + '.yml')
+        if os.path.isfile(grid):
+            return grid
+        if self.sample_format == 'grid' and not os.path.isfile(yml):
+            return grid
+        return yml
+
     @property
     def current_sample(self):
         """
@@ -618,6 +659,9 @@ class XYGridStage():
         sample_name : str
             The name of the sample to be set as current one.
         """
+        if str(sample_name) != self._current_sample:
+            self.flush_statuses()
+            self._statuses = None
         self._current_sample = str(sample_name)
 
     @property
@@ -677,7 +721,7 @@ class XYGridStage():
         Dictionary with current sample information.
         """
         if self._current_sample != '':
-            return os.path.join(self._path, self._current_sample + '.yml')
+            return self._sample_path(self._current_sample)
         raise ValueError('No current sample loaded, please use load() first.')
 
     def load(self, sample_name, path=None):
@@ -695,13 +739,26 @@ class XYGridStage():
         path : str, optional
             Path where the samples yaml file exists.
         """
-        path = path or self._path
-        entry = os.path.join(path, sample_name + '.yml')
-        m_points, n_points, coeffs = self.get_sample_map_info(str(sample_name), path=entry)
+        entry = self._sample_path(str(sample_name), path)
+        if entry.endswith(SampleGridFile.suffix):
+            grid_file = SampleGridFile(entry)
+            sample = grid_file.metadata
+        else:
+            grid_file = None
+            sample = self.get_sample_data(str(sample_name), path=entry)
+        m_points, n_points, coeffs = self._get_map_info(sample_name, sample)
         self.m_n_points = m_points, n_points
         self.coefficients = coeffs
         # make this sample the current one
         self.current_sample = str(sample_name)
+        # precompute all of the target positions and statuses
+        if grid_file is not None:
+            self._statuses = GridFileStatuses(grid_file)
+        else:
+            x, y = self.get_target_map()
+            self._statuses = TargetStatuses(str(sample_name), entry, x, y,
+                                            sample.get('xx') or [],
+                                            sample.get('yy') or [])
 
     def get_sample_data(self, sample_name, path=None):
         """
@@ -745,7 +802,14 @@ class XYGridStage():
         yy:
         ...}
         """
-        path = path or os.path.join(self._path, sample_name + '.yml')
+        path = path or self._sample_path(sample_name)
+        if str(path).endswith(SampleGridFile.suffix):
+            grid_file = SampleGridFile(path, mode='r')
+            if grid_file.metadata.get('sample_name') != str(sample_name):
+                logger.error('The sample %s might not exist in the file.',
+                             sample_name)
+                return {}
+            return grid_file.to_sample_data()
         data = None
         with open(path) as sample_file:
             try:
@@ -778,8 +842,15 @@ class XYGridStage():
         path : str, optional
             Path to the samples yaml file.
         """
-        path = path or os.path.join(self._path, sample_name + '.yml')
-        sample = self.get_sample_data(str(sample_name), path=path)
+        path = path or self._sample_path(sample_name)
+        if str(path).endswith(SampleGridFile.suffix):
+            sample = SampleGridFile(path, mode='r').metadata
+        else:
+            sample = self.get_sample_data(str(sample_name), path=path)
+        return self._get_map_info(sample_name, sample)
+
+    def _get_map_info(self, sample_name, sample):
+        """Get the m and n points and the coeffs from the sample data."""
         coeffs = []
         m_points, n_points = 0, 0
         if sample:
@@ -827,6 +898,10 @@ class XYGridStage():
         """
         path = path or self._path
         entry = os.path.join(path, sample_name + '.yml')
+        if sample_name == self.current_sample:
+            # keep the pending statuses, the positions may change
+            self.flush_statuses()
+            self._statuses = None
         now = str(datetime.now())
         top_left, top_right, bottom_right, bottom_left = [], [], [], []
         if self.get_presets():
@@ -857,6 +932,17 @@ class XYGridStage():
         except jsonschema.exceptions.ValidationError as err:
             logger.warning('Invalid input: %s', err)
             raise err
+        grid_entry = self._sample_path(sample_name, path)
+        if grid_entry.endswith(SampleGridFile.suffix):
+            status = None
+            if os.path.isfile(grid_entry):
+                # keep the previous statuses, as for the yaml files
+                status = np.array(SampleGridFile(grid_entry, mode='r').status)
+                if status.shape != (m_points, n_points):
+                    status = None
+            SampleGridFile.from_sample_data(grid_entry, sample_name,
+                                            data[sample_name], status=status)
+            return
         # entry = os.path.join(path, sample_name + '.yml')
         # if this is an existing file, overrite the info but keep the statuses
         if os.path.isfile(entry):
@@ -898,7 +984,14 @@ class XYGridStage():
             Path to the `.yml` file. Defaults to the path defined when
             creating this object.
         """
-        path = path or os.path.join(self._path, sample_name + '.yml')
+        path = path or self._sample_path(sample_name)
+        if sample_name == self.current_sample and self._statuses is not None:
+            self._statuses.clear()
+        if str(path).endswith(SampleGridFile.suffix):
+            grid_file = SampleGridFile(path)
+            grid_file.status[:] = False
+            grid_file.flush()
+            return
         with open(path) as sample_file:
             yaml_dict = yaml.safe_load(sample_file) or {}
             sample = yaml_dict.get(sample_name)
@@ -964,23 +1057,14 @@ class XYGridStage():
         a_coeffs, b_coeffs = mesh_interpolation(top_left, top_right,
                                                 bottom_right, bottom_left)
         self.coefficients = a_coeffs.tolist() + b_coeffs.tolist()
-        x_points, y_points = [], []
-
-        xx, yy = get_unit_meshgrid(m_rows=rows, n_columns=columns)
-
-        # return x_points, y_points
-        for rowx, rowy in zip(xx, yy):
-            for x, y in zip(rowx, rowy):
-                i, j = convert_to_physical(a_coeffs=a_coeffs,
-                                           b_coeffs=b_coeffs,
-                                           logic_x=x, logic_y=y)
-                x_points.append(i)
-                y_points.append(j)
+
+        xx, yy = compute_target_map(rows, columns, self.coefficients)
         if snake_like:
-            x_points = snake_grid_list(
-                np.array(x_points).reshape(rows, columns))
-            y_points = snake_grid_list(
-                np.array(y_points).reshape(rows, columns))
+            x_points = snake_grid_list(xx)
+            y_points = snake_grid_list(yy)
+        else:
+            x_points = list(xx.ravel())
+            y_points = list(yy.ravel())
         self.positions_x = x_points
         self.positions_y = y_points
         return x_points, y_points
@@ -1006,6 +1090,15 @@ class XYGridStage():
         is_shot : bool
             Indicates is target is shot or not.
         """
+        statuses = self._get_statuses()
+        if (
+            statuses is not None
+            and sample in (None, self.current_sample)
+            and path is None
+        ):
+            self._check_m_n(m, n)
+            return statuses.get(m, n)
+
         sample = sample or self.current_sample
         path = path or self.current_sample_path
         x, y = self.compute_mapped_point(m_row=m,
@@ -1074,28 +1167,168 @@ class XYGridStage():
         if (m_row or n_column) == 0:
             raise IndexError('Please start at 1, 1, as the initial points.')
 
-        xx_origin, yy_origin = get_unit_meshgrid(m_rows=m_points,
-                                                 n_columns=n_points)
-
-        a_coeffs = coeffs[:4]
-        b_coeffs = coeffs[4:]
+        xx, yy = self.get_target_map(m_points, n_points, coeffs)
 
         if not compute_all:
-            logic_x = xx_origin[m_row - 1][n_column - 1]
-            logic_y = yy_origin[m_row - 1][n_column - 1]
-            x, y = convert_to_physical(a_coeffs, b_coeffs, logic_x, logic_y)
-            return x, y
+            return xx[m_row - 1, n_column - 1], yy[m_row - 1, n_column - 1]
         else:
             # compute all points
-            x_points, y_points = [], []
-            for rowx, rowy in zip(xx_origin, yy_origin):
-                for x, y in zip(rowx, rowy):
-                    i, j = convert_to_physical(a_coeffs=a_coeffs,
-                                               b_coeffs=b_coeffs,
-                                               logic_x=x, logic_y=y)
-                    x_points.append(i)
-                    y_points.append(j)
-            return x_points, y_points
+            return list(xx.ravel()), list(yy.ravel())
+
+    def get_target_map(self, m_points=None, n_points=None, coefficients=None):
+        """
+        Get the physical x, y positions of every target on the grid.
+
+        The positions are computed once and reused until the grid size or
+        the coefficients change. They default to the current ones.
+
+        Returns
+        -------
+        xx, yy : tuple of arrays
+            Arrays of shape `(m_points, n_points)`, where `xx[m - 1, n - 1]`
+            is the x position of the target at row m, column n.
+        """
+        if m_points is None or n_points is None:
+            m_points, n_points = self.m_n_points
+        if coefficients is None:
+            coefficients = self.coefficients
+        key = (m_points, n_points, tuple(coefficients))
+        if key != self._target_map_key:
+            self._target_map = compute_target_map(m_points, n_points,
+                                                  coefficients)
+            self._target_map_key = key
+        return self._target_map
+
+    def _get_statuses(self):
+        """Statuses of the current sample, loading them if needed."""
+        if self._statuses is None and self.current_sample:
+            entry = self.current_sample_path
+            if not os.path.isfile(entry):
+                return None
+            if entry.endswith(SampleGridFile.suffix):
+                self._statuses = GridFileStatuses(SampleGridFile(entry))
+                return self._statuses
+            sample = self.get_sample_data(self.current_sample, path=entry)
+            if not sample.get('xx'):
+                return None
+            x, y = self.get_target_map()
+            self._statuses = TargetStatuses(self.current_sample, entry, x, y,
+                                            sample.get('xx') or [],
+                                            sample.get('yy') or [])
+        return self._statuses
+
+    def _check_m_n(self, m, n):
+        m_points, n_points = self.m_n_points
+        if (m > m_points) or (n > n_points):
+            raise IndexError('Index out of range, make sure the m and n values'
+                             f' are between ({m_points, n_points})')
+        if (m or n) == 0:
+            raise IndexError('Please start at 1, 1, as the initial points.')
+
+    def flush_statuses(self):
+        """
+        Write the pending target status changes to the sample file.
+
+        See `status_batch_size`.
+        """
+        if self._statuses is not None:
+            self._statuses.flush()
+
+    def iter_targets(self, order='snake', start=None):
+        """
+        Iterate over the targets of the current sample that are not shot.
+
+        The statuses are checked as the iteration goes, so targets marked
+        as shot with `set_status` while iterating are skipped.
+
+        Parameters
+        ----------
+        order : str, optional
+            ``'snake'`` (default) to go along the rows, alternating their
+            direction as in `map_points`, or ``'nearest'`` to always go to
+            the closest target left, which minimizes the stage travel.
+        start : tuple of int, optional
+            The (m, n) target to start from. With ``'snake'`` the targets
+            before it are left out. With ``'nearest'`` the first target is
+            the closest to it, by default the closest to the current x and
+            y motor positions.
+
+        Yields
+        ------
+        m, n, x, y : tuple
+            The row and column of the target, and its x and y positions.
+        """
+        if order not in ('snake', 'nearest'):
+            raise ValueError(f'Unknown target order {order}, use "snake" '
+                             'or "nearest".')
+        if start is not None:
+            self._check_m_n(*start)
+        xx, yy = self.get_target_map()
+        statuses = self._get_statuses()
+        if statuses is None:
+            shot = np.zeros(xx.size, dtype=bool)
+        else:
+            # a view, so that status changes are seen while iterating
+            shot = statuses.status.reshape(-1)
+        if order == 'snake':
+            return self._iter_snake(xx, yy, shot, start)
+        return self._iter_nearest(xx, yy, shot, start)
+
+    def _iter_snake(self, xx, yy, shot, start):
+        n_points = xx.shape[1]
+        index = _snake_order(np.arange(xx.size).reshape(xx.shape))
+        if start is not None:
+            first = (start[0] - 1) * n_points + start[1] - 1
+            index = index[np.flatnonzero(index == first)[0]:]
+        # skip the targets already shot without looking at them one by one
+        for idx in index[~shot[index]]:
+            if shot[idx]:
+                continue
+            m, n = divmod(int(idx), n_points)
+            yield m + 1, n + 1, xx.flat[idx], yy.flat[idx]
+
+    def _iter_nearest(self, xx, yy, shot, start):
+        n_points = xx.shape[1]
+        flat_x, flat_y = xx.reshape(-1), yy.reshape(-1)
+        remaining = ~shot
+        if start is None:
+            x_pos, y_pos = self.x.position, self.y.position
+        else:
+            x_pos = xx[start[0] - 1, start[1] - 1]
+            y_pos = yy[start[0] - 1, start[1] - 1]
+        while True:
+            remaining &= ~shot
+            candidates = np.flatnonzero(remaining)
+            if not candidates.size:
+                return
+            distance = np.hypot(flat_x[candidates] - x_pos,
+                                flat_y[candidates] - y_pos)
+            idx = candidates[np.argmin(distance)]
+            remaining[idx] = False
+            x_pos, y_pos = flat_x[idx], flat_y[idx]
+            m, n = divmod(int(idx), n_points)
+            yield m + 1, n + 1, x_pos, y_pos
+
+    def next_targets(self, count=1, order='snake', start=None):
+        """
+        Get the next targets that are not shot, without moving.
+
+        This precomputes the next motor setpoints, see `iter_targets` for
+        the parameters.
+
+        Returns
+        -------
+        m, n, x, y : tuple of arrays
+            The rows, columns, and x and y positions of up to `count`
+            targets, in order.
+        """
+        targets = list(islice(self.iter_targets(order=order, start=start),
+                              count))
+        if not targets:
+            return (np.array([], dtype=int), np.array([], dtype=int),
+                    np.array([]), np.array([]))
+        m, n, x, y = zip(*targets)
+        return np.array(m), np.array(n), np.array(x), np.array(y)
 
     def move_to_sample(self, m, n):
         """
@@ -1140,9 +1373,12 @@ class XYGridStage():
 
     def set_status(self, m, n, status=False, sample_name=None, path=None):
         """
-        TODO not working properly yet
         Set the status for a specific m and n point.
 
+        For the current sample, the change is kept in memory and written to
+        the sample file once `status_batch_size` changes are pending, or
+        when `flush_statuses` is called.
+
         Parametrs:
         ---------
         m : int
@@ -1155,47 +1391,348 @@ class XYGridStage():
         """
         assert isinstance(status, bool)
         sample_name = sample_name or self.current_sample
-        path = path or os.path.join(self._path, sample_name + '.yml')
-        m_points, n_points = self.m_n_points
-
-        if (m > m_points) or (n > n_points):
-            raise IndexError('Index out of range, make sure the m and n values'
-                             f' are between ({m_points, n_points})')
-        if (m or n) == 0:
-            raise IndexError('Please start at 1, 1, as the initial points.')
+        path = path or self._sample_path(sample_name)
+        self._check_m_n(m, n)
+
+        if sample_name == self.current_sample and self._get_statuses():
+            statuses = self._statuses
+            if os.path.abspath(path) == os.path.abspath(statuses.path):
+                statuses.set(m, n, status)
+                if statuses.pending >= self.status_batch_size:
+                    statuses.flush()
+                return
+
+        if str(path).endswith(SampleGridFile.suffix):
+            statuses = GridFileStatuses(SampleGridFile(path))
+            statuses.set(m, n, status)
+            statuses.flush()
+            return
+        sample = self.get_sample_data(sample_name, path=path)
+        if not sample:
+            raise ValueError('Could not find this sample name in the file:'
+                             f' {sample}')
+        m_points, n_points, coeffs = self._get_map_info(sample_name, sample)
+        x, y = compute_target_map(m_points, n_points, coeffs)
+        statuses = TargetStatuses(sample_name, path, x, y,
+                                  sample.get('xx') or [],
+                                  sample.get('yy') or [])
+        statuses.set(m, n, status)
+        statuses.flush()
+
+
+class TargetStatuses():
+    """
+    Shot statuses of the targets of one sample.
 
-        with open(path) as sample_file:
-            yaml_dict = yaml.safe_load(sample_file) or {}
-            sample = yaml_dict.get(sample_name)
-            if sample:
-                xx = sample['xx']
-                yy = sample['yy']
+    The sample file stores one ``{"pos": ..., "status": ...}`` entry per
+    target in ``xx`` and ``yy``. Here the statuses are kept in a boolean
+    array indexed by ``(m - 1, n - 1)``, and each target is matched to its
+    file entry by its x, y position. Changes are only written to the file
+    by `flush`.
 
-                n_pos = next(d['pos'] for (index, d) in enumerate(xx)
-                             if index == n - 1)
+    Parameters
+    ----------
+    sample_name : str
+        The name of the sample.
+    path : str
+        Path to the sample `.yml` file.
+    x, y : array
+        Target positions, as returned by `compute_target_map`.
+    xx, yy : list of dict
+        The entries of the sample file.
+    """
 
-                m_pos = next(d['pos'] for (index, d) in enumerate(yy)
-                             if index == m - 1)
+    def __init__(self, sample_name, path, x, y, xx, yy):
+        self.sample_name = sample_name
+        self.path = path
+        self.entry_index = match_target_entries(x, y, xx, yy)
+        self.known = self.entry_index >= 0
+        entry_status = np.array([bool(d.get('status')) for d in xx],
+                                dtype=bool)
+        self.status = np.zeros(np.shape(x), dtype=bool)
+        self.status[self.known] = entry_status[self.entry_index[self.known]]
+        self._pending = {}
 
-                for xd in sample.get('xx'):
-                    for k, v in xd.items():
-                        if k == 'pos' and v == n_pos:
-                            xd.update((st, status)
-                                      for st, vv in xd.items()
-                                      if st == 'status')
-                for yd in sample.get('yy'):
-                    for k, v in yd.items():
-                        if k == 'pos' and v == m_pos:
-                            yd.update((st, status)
-                                      for st, vv in xd.items()
-                                      if st == 'status')
-                yaml_dict[sample_name].update(sample)
-            else:
-                raise ValueError('Could not find this sample name in the file:'
-                                 f' {sample}')
-        with open(path, 'w') as sample_file:
+    @property
+    def pending(self):
+        """Number of changes not yet written to the file."""
+        return len(self._pending)
+
+    def get(self, m, n):
+        """Status of the target at row m, column n, or None if unknown."""
+        if not self.known[m - 1, n - 1]:
+            return None
+        return bool(self.status[m - 1, n - 1])
+
+    def set(self, m, n, status):
+        """Set the status of the target at row m, column n."""
+        self.status[m - 1, n - 1] = status
+        index = self.entry_index[m - 1, n - 1]
+        if index >= 0:
+            self._pending[int(index)] = bool(status)
+        else:
+            logger.debug('Target (%s, %s) is not in the sample file, its '
+                         'status will not be saved.', m, n)
+
+    def clear(self):
+        """Mark every target as not shot, dropping pending changes."""
+        self.status[:] = False
+        self._pending = {}
+
+    def flush(self):
+        """Write the pending changes to the sample file."""
+        if not self._pending:
+            return
+        with open(self.path) as sample_file:
+            yaml_dict = yaml.safe_load(sample_file) or {}
+        sample = yaml_dict.get(self.sample_name)
+        if not sample:
+            raise ValueError('Could not find this sample name in the file:'
+                             f' {self.sample_name}')
+        for index, status in self._pending.items():
+            for key in ('xx', 'yy'):
+                entries = sample.get(key) or []
+                if index < len(entries):
+                    entries[index]['status'] = status
+        with open(self.path, 'w') as sample_file:
             yaml.safe_dump(yaml_dict, sample_file,
                            sort_keys=False, default_flow_style=False)
+        self._pending = {}
+
+
+class GridFileStatuses(TargetStatuses):
+    """
+    Shot statuses of the targets of a sample stored in a `SampleGridFile`.
+
+    The status array is memory mapped from the file, so changes are written
+    in place right away. `flush` makes sure they reach the disk.
+
+    Parameters
+    ----------
+    grid_file : SampleGridFile
+        The open sample grid file.
+    """
+
+    def __init__(self, grid_file):
+        self.grid_file = grid_file
+        self.sample_name = grid_file.metadata.get('sample_name')
+        self.path = grid_file.path
+        self.status = grid_file.status
+        self.known = np.ones(self.status.shape, dtype=bool)
+        self.entry_index = np.arange(self.status.size).reshape(
+            self.status.shape)
+        self._changes = 0
+
+    @property
+    def pending(self):
+        """Number of changes not yet flushed to the disk."""
+        return self._changes
+
+    def set(self, m, n, status):
+        """Set the status of the target at row m, column n."""
+        self.status[m - 1, n - 1] = status
+        self._changes += 1
+
+    def clear(self):
+        """Mark every target as not shot."""
+        self.status[:] = False
+        self.flush()
+
+    def flush(self):
+        """Flush the status changes to the disk."""
+        self.grid_file.flush()
+        self._changes = 0
+
+
+class SampleGridFile():
+    """
+    Binary file holding a sample grid, as an alternative to the yaml files.
+
+    The file starts with the magic bytes ``PCDSGRID``, the length of the
+    header as a little-endian unsigned 64 bit integer, and a json header
+    with the sample metadata: the same keys as `XYGridStage.sample_schema`
+    except ``xx`` and ``yy``, plus ``sample_name`` and ``version``. The
+    header is padded so that the data starts on a 64 byte boundary. The
+    data are the x positions and the y positions as little-endian float64
+    arrays, then the statuses as one byte per target, all of shape
+    ``(M, N)`` in row-major order: ``[m - 1, n - 1]`` is the target at row
+    m, column n.
+
+    The arrays are memory mapped. The statuses can be changed in place
+    when the file is opened with mode ``'r+'``.
+
+    Parameters
+    ----------
+    path : str
+        Path to the ``.grid`` file.
+    mode : str, optional
+        ``'r+'`` (default) to allow status changes, ``'r'`` for read only.
+    """
+
+    suffix = '.grid'
+    _magic = b'PCDSGRID'
+    _version = 1
+    _metadata_keys = ('time_created', 'top_left', 'top_right',
+                      'bottom_right', 'bottom_left', 'M', 'N',
+                      'coefficients')
+
+    def __init__(self, path, mode='r+'):
+        self.path = str(path)
+        with open(self.path, 'rb') as fd:
+            if fd.read(len(self._magic)) != self._magic:
+                raise ValueError(f'{path} is not a sample grid file.')
+            (header_len,) = struct.unpack('<Q', fd.read(8))
+            self.metadata = json.loads(fd.read(header_len).decode())
+        shape = (self.metadata['M'], self.metadata['N'])
+        size = shape[0] * shape[1]
+        offset = len(self._magic) + 8 + header_len
+        self.x = np.memmap(self.path, dtype='<f8', mode='r', offset=offset,
+                           shape=shape)
+        self.y = np.memmap(self.path, dtype='<f8', mode='r',
+                           offset=offset + 8 * size, shape=shape)
+        self.status = np.memmap(self.path, dtype=np.bool_, mode=mode,
+                                offset=offset + 16 * size, shape=shape)
+
+    @classmethod
+    def create(cls, path, metadata, x, y, status=None):
+        """
+        Write a new sample grid file, replacing any existing one.
+
+        Parameters
+        ----------
+        path : str
+            Path to the ``.grid`` file.
+        metadata : dict
+            The header keys, see the class description.
+        x, y : array
+            The target positions, of shape ``(M, N)``.
+        status : array, optional
+            The target statuses, of shape ``(M, N)``. Defaults to all
+            `False`.
+
+        Returns
+        -------
+        grid_file : SampleGridFile
+            The new file, opened with mode ``'r+'``.
+        """
+        x = np.asarray(x, dtype='<f8')
+        y = np.asarray(y, dtype='<f8')
+        if status is None:
+            status = np.zeros(x.shape, dtype=np.bool_)
+        status = np.asarray(status, dtype=np.bool_)
+        metadata = dict(metadata, M=x.shape[0], N=x.shape[1],
+                        version=cls._version)
+        header = json.dumps(metadata).encode()
+        prefix_len = len(cls._magic) + 8
+        header_len = -(-(prefix_len + len(header)) // 64) * 64 - prefix_len
+        tmp_path = str(path) + '.tmp'
+        with open(tmp_path, 'wb') as fd:
+            fd.write(cls._magic)
+            fd.write(struct.pack('<Q', header_len))
+            fd.write(header.ljust(header_len))
+            fd.write(x.tobytes())
+            fd.write(y.tobytes())
+            fd.write(status.tobytes())
+        os.replace(tmp_path, path)
+        return cls(path)
+
+    @classmethod
+    def from_sample_data(cls, path, sample_name, sample, status=None):
+        """
+        Write a sample grid file from a sample in the yaml schema.
+
+        The positions are computed from ``M``, ``N`` and ``coefficients``,
+        and the statuses are taken from ``xx`` and ``yy`` unless `status`
+        is given.
+        """
+        x, y = compute_target_map(sample['M'], sample['N'],
+                                  sample['coefficients'])
+        if status is None:
+            status = TargetStatuses(sample_name, None, x, y,
+                                    sample.get('xx') or [],
+                                    sample.get('yy') or []).status
+        metadata = {key: sample.get(key) for key in cls._metadata_keys}
+        metadata['sample_name'] = str(sample_name)
+        return cls.create(path, metadata, x, y, status=status)
+
+    def to_sample_data(self):
+        """
+        Get the sample in the yaml schema.
+
+        The ``xx`` and ``yy`` entries are in the snake-like order used by
+        `XYGridStage.save_grid`.
+        """
+        data = {key: self.metadata.get(key) for key in self._metadata_keys}
+        statuses = [bool(st) for st in _snake_order(self.status)]
+        data['xx'] = [{'pos': pos, 'status': st} for pos, st
+                      in zip(snake_grid_list(np.asarray(self.x)), statuses)]
+        data['yy'] = [{'pos': pos, 'status': st} for pos, st
+                      in zip(snake_grid_list(np.asarray(self.y)), statuses)]
+        return data
+
+    def flush(self):
+        """Flush status changes to the disk."""
+        if self.status.mode != 'r':
+            self.status.flush()
+
+
+def convert_sample_to_grid(yaml_path, sample_name=None, grid_path=None):
+    """
+    Convert a yaml sample file to a binary `SampleGridFile`.
+
+    Parameters
+    ----------
+    yaml_path : str
+        Path to the ``.yml`` sample file.
+    sample_name : str, optional
+        The sample to convert. Defaults to the file name.
+    grid_path : str, optional
+        Path of the new file. Defaults to `yaml_path` with a ``.grid``
+        extension.
+
+    Returns
+    -------
+    grid_path : str
+        Path of the new file.
+    """
+    yaml_path = str(yaml_path)
+    base = os.path.splitext(yaml_path)[0]
+    sample_name = sample_name or os.path.basename(base)
+    grid_path = str(grid_path or base + SampleGridFile.suffix)
+    with open(yaml_path) as sample_file:
+        data = yaml.safe_load(sample_file) or {}
+    if sample_name not in data:
+        raise ValueError(f'Could not find the sample {sample_name} in '
+                         f'{yaml_path}')
+    SampleGridFile.from_sample_data(grid_path, sample_name, data[sample_name])
+    return grid_path
+
+
+def convert_grid_to_sample(grid_path, yaml_path=None):
+    """
+    Convert a binary `SampleGridFile` to a yaml sample file.
+
+    Parameters
+    ----------
+    grid_path : str
+        Path to the ``.grid`` sample file.
+    yaml_path : str, optional
+        Path of the new file. Defaults to `grid_path` with a ``.yml``
+        extension.
+
+    Returns
+    -------
+    yaml_path : str
+        Path of the new file.
+    """
+    grid_path = str(grid_path)
+    yaml_path = str(yaml_path or os.path.splitext(grid_path)[0] + '.yml')
+    grid_file = SampleGridFile(grid_path, mode='r')
+    data = {grid_file.metadata['sample_name']: grid_file.to_sample_data()}
+    with open(yaml_path, 'w') as sample_file:
+        yaml.safe_dump(data, sample_file, sort_keys=False,
+                       default_flow_style=False)
+    return yaml_path
 
 
 def mesh_interpolation(top_left, top_right, bottom_right, bottom_left):
@@ -1329,6 +1866,70 @@ def convert_to_physical(a_coeffs, b_coeffs, logic_x, logic_y):
     return x, y
 
 
+def compute_target_map(m_points, n_points, coefficients):
+    """
+    Compute the physical positions of all the targets on a grid.
+
+    Parameters
+    ----------
+    m_points : int
+        Number of rows the grid has.
+    n_points : int
+        Number of columns the grid has.
+    coefficients : list
+        The 8 projective transformation coefficients, alpha then beta.
+
+    Returns
+    -------
+    xx, yy : tuple of arrays
+        The x and y positions, as arrays of shape `(m_points, n_points)`.
+    """
+    logic_x, logic_y = get_unit_meshgrid(m_rows=m_points, n_columns=n_points)
+    return convert_to_physical(coefficients[:4], coefficients[4:],
+                               logic_x, logic_y)
+
+
+def match_target_entries(x, y, xx, yy):
+    """
+    Find the sample file entry of each target on a grid.
+
+    Parameters
+    ----------
+    x, y : array
+        Target positions, as returned by `compute_target_map`.
+    xx, yy : list of dict
+        The ``{"pos": ..., "status": ...}`` entries of a sample file.
+
+    Targets are matched by their x and y positions. Targets without such a
+    match fall back to the first entry with the same x position, which is
+    how older versions looked statuses up.
+
+    Returns
+    -------
+    index : array
+        Integer array shaped like `x` with the index of the matching entry
+        in `xx` and `yy`, or -1 for targets that are not in the file.
+    """
+    pairs = {}
+    x_only = {}
+    for index, xd in enumerate(xx):
+        x_only.setdefault(xd['pos'], index)
+        if index < len(yy):
+            pairs.setdefault((xd['pos'], yy[index]['pos']), index)
+    return np.array(
+        [pairs.get(pos, x_only.get(pos[0], -1))
+         for pos in zip(np.ravel(x).tolist(), np.ravel(y).tolist())],
+        dtype=int,
+    ).reshape(np.shape(x))
+
+
+def _snake_order(points):
+    """Flatten an (M, N) array, reversing every other row."""
+    points = np.array(points)
+    points[1::2] = points[1::2, ::-1]
+    return points.ravel()
+
+
 def snake_grid_list(points):
     """
     Flatten them into lists with snake_like pattern coordinate points.
@@ -260,5 +260,11 @@ def test_at2l0_clear_errors(at2l0):
     for sig in signals:
         assert not sig.get()
     at2l0.clear_errors()
+    # Signals are set from background threads; give them a moment
+    deadline = time.monotonic() + 2
+    while not all(sig.get() for sig in signals):
+        if time.monotonic() > deadline:
+            break
+        time.sleep(0.01)
     for sig in signals:
         assert sig.get()
@@ -1,5 +1,6 @@
 from typing import Optional
 
+import numpy as np
 import pytest
 
 from ..lasers.btms_config import (BtmsDestinationState, BtmsSourceState,
@@ -449,3 +450,72 @@ def test_destination_acknowledgement():
         # Yield control and try again
         state.destinations[DestinationPosition.ld1].yields_control = True
         state.check_move(source, None, DestinationPosition.ld1)
+
+
+def random_state(rng: np.random.Generator) -> BtmsState:
+    all_sources = list(SourcePosition)
+    all_dests = list(DestinationPosition)
+    sources = [
+        all_sources[idx]
+        for idx in rng.permutation(len(all_sources))[:rng.integers(0, 9)]
+    ]
+    state = BtmsState(
+        sources={
+            source: BtmsSourceState(
+                source=source,
+                destination=(
+                    all_dests[rng.integers(len(all_dests))]
+                    if rng.random() > 0.05 else None
+                ),
+                beam_status=bool(rng.random() > 0.5),
+            )
+            for source in sources
+        },
+        maintenance_mode=bool(rng.random() > 0.95),
+    )
+    for dest in state.destinations.values():
+        dest.yields_control = bool(rng.random() > 0.2)
+    return state
+
+
+def test_move_table_matches_check_move_all():
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        state = random_state(rng)
+        table = state.get_move_table()
+        assert table.sources == tuple(state.sources)
+        for source, row in zip(table.sources, table.allowed):
+            for dest, allowed in zip(table.destinations, row):
+                errors = state.check_move_all(source, None, dest)
+                assert allowed == (not errors), (state, source, dest)
+                crossed = any(isinstance(err, PathCrossedError)
+                              for err in errors)
+                assert crossed == table.crosses_beam[
+                    table.sources.index(source),
+                    table.destinations.index(dest)
+                ]
+
+
+def test_move_table_legal_moves():
+    state = BtmsState(
+        sources={
+            SourcePosition.ls6: BtmsSourceState(
+                source=SourcePosition.ls6,
+                destination=DestinationPosition.ld9,
+                beam_status=True,
+            ),
+            SourcePosition.ls1: BtmsSourceState(
+                source=SourcePosition.ls1,
+                destination=DestinationPosition.ld8,
+                beam_status=False,
+            ),
+        }
+    )
+    table = state.get_move_table()
+    # LS1 is above LS6, and would cross its beam going right past LD9
+    assert table.legal_moves() == {
+        SourcePosition.ls6: (),
+        SourcePosition.ls1: (DestinationPosition.ld8, DestinationPosition.ld1),
+    }
+    assert table.is_allowed(SourcePosition.ls1, DestinationPosition.ld1)
+    assert not table.is_allowed(SourcePosition.ls1, DestinationPosition.ld2)
@@ -0,0 +1,105 @@
+import pytest
+from ophyd.sim import make_fake_device
+
+from ..lasers.btms_config import DestinationPosition, SourcePosition
+from ..lasers.btps import BtpsState
+
+
+@pytest.fixture(scope='function')
+def btps():
+    FakeBtps = make_fake_device(BtpsState)
+    btps = FakeBtps('', name='btps')
+    # Monitors would start with the current values
+    btps.config.maintenance_mode.sim_put(0)
+    for source in btps.sources.values():
+        source.current_destination.sim_put(0)
+        source.lss.opened_status.sim_put(0)
+    for dest in btps.destinations.values():
+        dest.exit_valve_ready.sim_put(0)
+        dest.yields_control.sim_put(0)
+        for config in dest.sources.values():
+            config.entry_valve_ready.sim_put(0)
+    # LS1 at LD8 with beam, the others at their own destination without
+    btps.ls1.current_destination.sim_put(8)
+    btps.ls1.lss.opened_status.sim_put(1)
+    btps.ld8.ls1.entry_valve_ready.sim_put(1)
+    btps.ld8.exit_valve_ready.sim_put(1)
+    btps.ls3.current_destination.sim_put(1)
+    btps.ls4.current_destination.sim_put(4)
+    btps.ls5.current_destination.sim_put(10)
+    btps.ls6.current_destination.sim_put(14)
+    btps.ls8.current_destination.sim_put(6)
+    for dest in btps.destinations.values():
+        dest.yields_control.sim_put(1)
+    return btps
+
+
+def test_btps_state_cache(btps):
+    # The first call starts the monitors, which fill the cache at once
+    state = btps.to_btms_state()
+    assert btps._state_cache is not None
+    assert state.sources[SourcePosition.ls1].beam_status
+    assert state.sources[SourcePosition.ls1].destination == (
+        DestinationPosition.ld8
+    )
+    assert not state.sources[SourcePosition.ls3].beam_status
+
+    # Later changes are applied to the cache, and no signal is read
+    btps.ld8.exit_valve_ready.sim_put(0)
+    btps.ls3.current_destination.sim_put(2)
+    for signal in btps._state_signals.values():
+        signal.get = None
+    state = btps.to_btms_state()
+    assert not state.sources[SourcePosition.ls1].beam_status
+    assert state.sources[SourcePosition.ls3].destination == (
+        DestinationPosition.ld2
+    )
+    # Copies can be modified without touching the cache
+    state.maintenance_mode = True
+    assert not btps.to_btms_state().maintenance_mode
+
+
+def test_btps_state_subscription(btps):
+    events = []
+
+    def on_state(state, changed, **kwargs):
+        events.append((state, changed))
+
+    btps.subscribe(on_state, event_type=btps.SUB_STATE, run=False)
+    assert len(events) == 1
+    assert 'maintenance_mode' in events[0][1]
+
+    btps.ld8.exit_valve_ready.sim_put(0)
+    state, changed = events[-1]
+    assert changed == {'sources.LS1.beam_status'}
+    assert not state.sources[SourcePosition.ls1].beam_status
+
+    btps.ld9.yields_control.sim_put(0)
+    assert events[-1][1] == {'destinations.LD9.yields_control'}
+    # The entry valve of another destination does not change anything
+    btps.ld2.ls1.entry_valve_ready.sim_put(1)
+    assert len(events) == 3
+
+
+def test_btps_move_table(btps):
+    table = btps.get_move_table()
+    assert table is btps.get_move_table()
+    assert not table.is_allowed(SourcePosition.ls1, DestinationPosition.ld1)
+    assert table.is_allowed(SourcePosition.ls3, DestinationPosition.ld2)
+    btps.ls1.lss.opened_status.sim_put(0)
+    table = btps.get_move_table()
+    assert table.is_allowed(SourcePosition.ls1, DestinationPosition.ld9)
+    # LS3 is at LD1
+    assert not table.is_allowed(SourcePosition.ls1, DestinationPosition.ld1)
+
+
+def test_btps_state_disconnect(btps):
+    btps.to_btms_state()
+    signal = btps.ls1.current_destination
+    signal._run_subs(sub_type=signal.SUB_META, connected=False)
+    assert btps._state_cache is None
+    # Falls back to reading the signals
+    state = btps.to_btms_state()
+    assert state.sources[SourcePosition.ls1].destination == (
+        DestinationPosition.ld8
+    )
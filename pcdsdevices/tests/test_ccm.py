@@ -46,6 +46,27 @@ def test_energy_wavelength_inversion():
     assert wavelength_calc == SAMPLE_WAVELENGTH
 
 
+def test_alio_to_intermediates():
+    logger.debug('test_alio_to_intermediates')
+    constants = (ccm.default_theta0, ccm.default_dspacing, ccm.default_gr,
+                 ccm.default_gd)
+    alio = np.linspace(-2, 10, 13)
+    theta, wavelength, energy, resolution = ccm.alio_to_intermediates(
+        alio, *constants)
+    assert np.allclose(theta, ccm.alio_to_theta(alio, constants[0],
+                                                *constants[2:]))
+    assert np.allclose(wavelength, ccm.theta_to_wavelength(theta,
+                                                           constants[1]))
+    assert np.allclose(energy, ccm.alio_to_energy(alio, *constants))
+    # Compare with finite differences
+    delta = 1e-6
+    finite = np.abs(
+        ccm.alio_to_energy(alio + delta/2, *constants)
+        - ccm.alio_to_energy(alio - delta/2, *constants)
+    ) / delta
+    assert np.allclose(resolution, finite, rtol=1e-5)
+
+
 @pytest.fixture(scope='function')
 def fake_ccm():
     return make_fake_ccm()
@@ -187,6 +208,35 @@ def test_vernier(fake_ccm):
     assert pseudopos.acr_energy.position == 9002
 
 
+def test_ccm_calc_arrays(fake_ccm):
+    logger.debug('test_ccm_calc_arrays')
+    calc = fake_ccm.energy
+    energies = np.linspace(6, 14, 9)
+    alios = calc.energy_to_alio(energies)
+    assert alios.shape == energies.shape
+    for energy, alio in zip(energies, alios):
+        assert np.isclose(calc.energy_to_alio(energy), alio)
+    assert np.allclose(calc.alio_to_energy(alios), energies)
+    assert np.allclose(
+        ccm.energy_to_alio(list(energies), *calc.constants),
+        alios,
+    )
+
+
+def test_ccm_constants_cache(fake_ccm):
+    logger.debug('test_ccm_constants_cache')
+    calc = fake_ccm.energy
+    constants = calc.constants
+    assert calc.constants is constants
+    assert constants == (calc.theta0_rad_val, calc.dspacing_val,
+                         calc.gr_val, calc.gd_val)
+    alio = calc.energy_to_alio(10)
+    calc.dspacing.put(ccm.si_511_dspacing)
+    assert calc.constants is not constants
+    assert calc.constants.dspacing == ccm.si_511_dspacing
+    assert not np.isclose(calc.energy_to_alio(10), alio)
+
+
 @pytest.mark.timeout(5)
 def test_set_current_position(fake_ccm):
     logger.debug('test_set_current_position')
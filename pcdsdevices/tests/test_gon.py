@@ -5,8 +5,9 @@ import numpy as np
 import pytest
 from ophyd.sim import make_fake_device
 
-from ..gon import (BaseGon, Goniometer, GonWithDetArm, Kappa, SamPhi, SimKappa,
-                   XYZStage)
+from ..gon import (BaseGon, Goniometer, GonWithDetArm, Kappa, KappaMoveAbort,
+                   SamPhi, SimKappa, XYZStage, kappa_to_spherical,
+                   spherical_to_kappa)
 
 logger = logging.getLogger(__name__)
 
@@ -168,6 +169,58 @@ def test_check_motor_step(fake_kappa):
     assert res is False
 
 
+def test_check_motor_step_path(fake_kappa):
+    # current positions: 10, 20, 30, every step of 1 degree is fine
+    eta = np.arange(11, 20)
+    assert fake_kappa.check_motor_step(eta, 20, 30) is True
+    # one jump in the middle of the path asks once
+    eta[5:] += 5
+    with patch('builtins.input', return_value='n') as prompt:
+        assert fake_kappa.check_motor_step(eta, 20, 30) is False
+    prompt.assert_called_once()
+
+
+def test_kappa_transform_arrays(fake_kappa):
+    eta = np.linspace(-10, 40, 11)
+    kappa = np.linspace(0, 45, 11)
+    phi = np.linspace(5, -30, 11)
+    e_coords = fake_kappa.k_to_e(eta, kappa, phi)
+    for idx in range(len(eta)):
+        expected = fake_kappa.k_to_e(eta[idx], kappa[idx], phi[idx])
+        assert np.allclose([coord[idx] for coord in e_coords], expected)
+    for flipped in (False, True):
+        e_coords = kappa_to_spherical(eta, kappa + 225 * flipped, phi,
+                                      flipped=flipped)
+        k_coords = spherical_to_kappa(*e_coords, flipped=flipped)
+        assert np.allclose(k_coords, (eta, kappa + 225 * flipped, phi))
+
+
+def test_e_to_k_path(fake_kappa):
+    real_position = SimKappa.real_position
+    reads = []
+
+    def counted(self):
+        reads.append(self)
+        return real_position.fget(self)
+
+    with patch.object(SimKappa, 'real_position', property(counted)):
+        assert np.allclose(fake_kappa.e_to_k(), (10, 20, 30))
+        e_eta, e_chi, e_phi = fake_kappa.k_to_e()
+        steps = np.arange(1, 6)
+        path = fake_kappa.e_to_k_path(e_eta + steps, e_chi, e_phi)
+    # One snapshot per conversion, and one for the step check
+    assert len(reads) == 4
+    assert np.allclose(path.eta, 10 - steps)
+    assert np.allclose(path.kappa, 20)
+    assert np.allclose(path.phi, 30)
+    with patch('builtins.input', return_value='n'):
+        with pytest.raises(KappaMoveAbort):
+            fake_kappa.e_to_k_path(e_eta + 10 * steps, e_chi, e_phi)
+    path = fake_kappa.e_to_k_path(e_eta + 10 * steps, e_chi, e_phi,
+                                  check=False)
+    assert np.allclose(path.eta, 10 - 10 * steps)
+
+
 @pytest.mark.timeout(5)
 def test_moving(fake_kappa):
     eta_pos, kappa_pos, phi_pos = fake_kappa.e_to_k(e_eta=3, e_chi=5, e_phi=7)
@@ -0,0 +1,69 @@
+import logging
+import subprocess
+import sys
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+# Third-party packages that pcdsdevices needs no matter what.  These are
+# imported first so that the budgets below only cover pcdsdevices itself.
+PREIMPORT = (
+    'import bluesky, epics, happi, lightpath, numpy, ophyd, ophyd.sim, '
+    'pcdsutils.ext_scripts, pytmc.pragmas, yaml'
+)
+
+# Heavy dependencies that should only be imported when actually used.
+# Some of these are loaded by the packages above, so they are removed from
+# sys.modules again before pcdsdevices is imported.
+LAZY_MODULES = ('sympy', 'pcdscalc', 'scipy', 'prettytable', 'jsonschema')
+
+# Cumulative import time budgets in seconds, with plenty of slack for CI.
+# Importing sympy eagerly costs more than any of these on its own.
+IMPORT_BUDGETS = {
+    'pcdsdevices.utils': 0.3,
+    'pcdsdevices.epics_motor': 0.6,
+    'pcdsdevices.attenuator': 0.75,
+    'pcdsdevices.targets': 0.75,
+}
+
+
+def measure_import(module: str) -> tuple[float, set[str]]:
+    """
+    Import ``module`` in a fresh interpreter with ``-X importtime``.
+
+    Returns the cumulative import time of the module in seconds and the set
+    of top-level modules loaded afterwards.
+    """
+    code = (
+        f'{PREIMPORT}; import sys; '
+        f'[sys.modules.pop(name) for name in list(sys.modules) '
+        f'if name.split(".")[0] in {LAZY_MODULES!r}]; '
+        f'import {module}; '
+        f'print(",".join(sorted({{name.split(".")[0] '
+        f'for name in sys.modules}})))'
+    )
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, check=True,
+    )
+    cumulative_us = None
+    for line in proc.stderr.splitlines():
+        if line.startswith('import time:') and line.split('|')[-1].strip() == module:
+            cumulative_us = int(line.split('|')[1])
+    assert cumulative_us is not None, f'{module} missing from importtime'
+    loaded = set(proc.stdout.strip().splitlines()[-1].split(','))
+    return cumulative_us / 1e6, loaded
+
+
+@pytest.mark.timeout(60)
+@pytest.mark.parametrize('module', list(IMPORT_BUDGETS))
+def test_import_time(module):
+    elapsed, loaded = measure_import(module)
+    logger.info('Importing %s took %.3f s', module, elapsed)
+    eager = [name for name in LAZY_MODULES if name in loaded]
+    assert not eager, f'{module} eagerly imports {eager}'
+    assert elapsed < IMPORT_BUDGETS[module], (
+        f'Importing {module} took {elapsed:.3f} s, over the '
+        f'{IMPORT_BUDGETS[module]} s budget'
+    )
@@ -1,15 +1,19 @@
 import logging
 import multiprocessing as mp
+import os
 import sys
 import threading
 import time
+from pathlib import Path
 
 import ophyd
 import pytest
+from lightpath import LightpathState
 
-from ..interface import (BaseInterface, TabCompletionHelperClass,
-                         get_engineering_mode, set_engineering_mode,
-                         setup_preset_paths)
+from ..interface import (STATUS_TIMEOUT, BaseInterface, LightpathMixin,
+                         Presets, TabCompletionHelperClass,
+                         get_engineering_mode, migrate_presets,
+                         set_engineering_mode, setup_preset_paths)
 from ..sim import FastMotor, SlowMotor
 from . import conftest
 
@@ -170,10 +174,11 @@ def test_presets(presets, fast_motor):
         time.sleep(0.2)
 
         assert fast_motor.presets.positions.sample.pos == 3
+        # The update fails, the unchanged file is not read again
         fast_motor.presets.positions.sample.update_pos(2)
-        assert not hasattr(fast_motor, 'wm_sample')
+        assert fast_motor.presets.positions.sample.pos == 3
         fast_motor.presets.sync()
-        assert not hasattr(fast_motor, 'mv_sample')
+        assert hasattr(fast_motor, 'mv_sample')
 
     proc.join()
 
@@ -181,6 +186,170 @@ def test_presets(presets, fast_motor):
     assert hasattr(fast_motor, 'mv_sample')
 
 
+@pytest.mark.skipif(
+    sys.platform in ("win32", "darwin"),
+    reason="Fails on Windows, no fcntl and different signal handling",
+)
+def test_presets_journal(presets, fast_motor, monkeypatch):
+    monkeypatch.setattr(Presets, 'use_journal', True)
+    monkeypatch.setattr(Presets, 'journal_compact_after', 3)
+
+    fast_motor.mv(3, wait=True)
+    fast_motor.presets.add_hutch('zero', 0, comment='center')
+    fast_motor.presets.add_here_user('sample')
+    assert fast_motor.wm_zero() == -3
+    assert fast_motor.wm_sample() == 0
+    assert fast_motor.presets.state() == 'sample'
+
+    path = Path(fast_motor.presets.positions.zero.path)
+    assert path.suffix == '.journal'
+    assert not path.with_suffix('.yml').exists()
+
+    # Each change is one appended line until the journal is compacted
+    for value in (1, 2, 3):
+        fast_motor.presets.positions.zero.update_pos(value)
+        assert fast_motor.presets.positions.zero.pos == value
+    assert len(path.read_text().splitlines()) == 4
+    fast_motor.presets.positions.zero.update_comment('hats')
+    assert len(path.read_text().splitlines()) == 1
+    assert fast_motor.presets.positions.zero.pos == 3
+    assert 'hats' in list(fast_motor.presets.positions.zero.history.values())[-1]
+
+    with pytest.raises(KeyError):
+        fast_motor.presets._update('hutch', 'missing', comment='nothing')
+
+    fast_motor.presets.positions.zero.deactivate()
+    assert not hasattr(fast_motor, 'wm_zero')
+
+
+@pytest.mark.skipif(
+    sys.platform in ("win32", "darwin"),
+    reason="Fails on Windows, no fcntl and different signal handling",
+)
+def test_migrate_presets(presets, fast_motor):
+    fast_motor.mv(3, wait=True)
+    fast_motor.presets.add_hutch('zero', 0, comment='center')
+    fast_motor.presets.add_here_hutch('sample')
+    before = fast_motor.presets._cache['hutch']
+    yaml_path = Path(fast_motor.presets.positions.zero.path)
+    assert yaml_path.suffix == '.yml'
+
+    migrated = migrate_presets(yaml_path.parent)
+    assert migrated == [yaml_path.with_suffix('.journal')]
+    assert not yaml_path.exists()
+    assert yaml_path.with_name(yaml_path.name + '.bak').exists()
+
+    fast_motor.presets.sync()
+    assert fast_motor.presets._cache['hutch'] == before
+    assert fast_motor.presets.positions.zero.path == str(migrated[0])
+    assert fast_motor.wm_zero() == -3
+
+    fast_motor.presets.add_hutch('four', 4)
+    assert fast_motor.wm_four() == 1
+    assert not yaml_path.exists()
+
+
+@pytest.mark.skipif(
+    sys.platform in ("win32", "darwin"),
+    reason="Fails on Windows, no fcntl and different signal handling",
+)
+def test_presets_lazy_shared(presets, monkeypatch):
+    hutch = Presets._paths['hutch']
+    for idx in range(3):
+        (hutch / f'motor{idx}.yml').write_text(
+            f'pos:\n  active: true\n  value: {idx}\n'
+        )
+
+    reads = []
+    original_read = Presets._read
+
+    def counting_read(self, preset_type):
+        reads.append(self._device.name)
+        return original_read(self, preset_type)
+
+    monkeypatch.setattr(Presets, '_read', counting_read)
+    motors = [FastMotor(name=f'motor{idx}') for idx in range(4)]
+    assert reads == []
+    assert Presets._directories == {}
+
+    # Loaded on first use, with one scan of each directory for all motors
+    assert motors[1].wm_pos() == 1
+    assert 'mv_pos' in dir(motors[2])
+    assert motors[0].presets.positions.pos.pos == 0
+    assert not motors[3].presets.has_presets
+    assert reads == ['motor1', 'motor2', 'motor0']
+    assert Presets._directories[hutch].scans == 1
+
+    # Unchanged files are not read again
+    motors[1].presets.sync()
+    assert reads == ['motor1', 'motor2', 'motor0']
+
+    (hutch / 'motor1.yml').write_text(
+        'pos:\n  active: true\n  value: 10.5\n'
+    )
+    motors[1].presets.sync()
+    assert reads[-1] == 'motor1'
+    assert motors[1].wm_pos() == 10.5
+
+    # New files are found after the directory changes
+    motors[3].presets.add_hutch('pos', 3)
+    assert motors[3].wm_pos() == 3
+    assert Presets._directories[hutch].scans > 1
+
+
+@pytest.mark.skipif(
+    sys.platform in ("win32", "darwin"),
+    reason="Fails on Windows, no fcntl and different signal handling",
+)
+def test_presets_sync_unchanged_mtime(presets):
+    hutch = Presets._paths['hutch']
+    a = FastMotor(name='a')
+    b = FastMotor(name='b')
+    a.presets.add_hutch('x', 1)
+    b.presets.sync()
+    assert not hasattr(b, 'wm_x')
+
+    # Some file systems (NFS) can miss the directory modification time
+    before = hutch.stat()
+    (hutch / 'b.yml').write_text('x:\n  active: true\n  value: 2\n')
+    os.utime(hutch, ns=(before.st_atime_ns, before.st_mtime_ns))
+    b.presets.sync()
+    assert b.wm_x() == 2
+
+
+@pytest.mark.skipif(
+    sys.platform in ("win32", "darwin"),
+    reason="Fails on Windows, no fcntl and different signal handling",
+)
+def test_presets_state(presets, fast_motor, monkeypatch):
+    assert fast_motor.presets.state() == 'Unknown'
+    for idx in range(20):
+        fast_motor.presets.add_hutch(f'pos{idx}', float(idx))
+    # Same name in a later preset type takes over
+    fast_motor.presets.add_user('pos5', 5.3)
+
+    wm_calls = []
+    original_wm = fast_motor.wm
+
+    def counting_wm():
+        wm_calls.append(1)
+        return original_wm()
+
+    fast_motor.mv(7.2, wait=True)
+    monkeypatch.setattr(fast_motor, 'wm', counting_wm)
+    assert fast_motor.presets.state() == 'pos7'
+    assert len(wm_calls) == 1
+    fast_motor.mv(5.6, wait=True)
+    assert fast_motor.presets.state() == 'pos5'
+    assert fast_motor.wm_pos5() == pytest.approx(-0.3)
+    fast_motor.mv(30, wait=True)
+    assert fast_motor.presets.state() == 'Unknown'
+
+    fast_motor.presets.positions.pos19.deactivate()
+    fast_motor.mv(19, wait=True)
+    assert fast_motor.presets.state() == 'Unknown'
+
+
 def test_presets_type(presets, fast_motor):
     logger.debug('test_presets_type')
     # Mess up the input types, fail before opening the file
@@ -341,3 +510,132 @@ def test_tab_helper_class():
     tab.add('foobar')
     tab.reset()
     assert 'foobar' not in tab.get_filtered_dir_list()
+
+
+class LightpathSignals(LightpathMixin):
+    lightpath_cpts = ['sig1', 'sig2']
+    sig1 = ophyd.Component(ophyd.Signal)
+    sig2 = ophyd.Component(ophyd.Signal)
+
+    def calc_lightpath_state(self, sig1, sig2):
+        return LightpathState(
+            inserted=bool(sig1),
+            removed=not sig1,
+            output={self.output_branches[0]: sig2},
+        )
+
+
+def test_lightpath_summary_cache():
+    dev = LightpathSignals(name='dev', input_branches=['L0'],
+                           output_branches=['L0'])
+    dev.sig1.put(1)
+    dev.sig2.put(0.5)
+    # Summary callback recalculated the state from cached values only
+    state = dev.get_lightpath_state()
+    assert state.inserted
+    assert state.output == {'L0': 0.5}
+    assert dev.lightpath_cache_stats == {'cache_hits': 2, 'live_gets': 0}
+
+    dev.sig1.put(0)
+    state = dev.get_lightpath_state()
+    assert state.removed
+    assert dev.lightpath_cache_stats == {'cache_hits': 4, 'live_gets': 0}
+
+    dev.get_lightpath_state(use_cache=False)
+    assert dev.lightpath_cache_stats == {'cache_hits': 4, 'live_gets': 2}
+
+    dev.lightpath_use_summary_cache = False
+    dev.sig2.put(0.25)
+    assert dev.get_lightpath_state().output == {'L0': 0.25}
+    assert dev.lightpath_cache_stats == {'cache_hits': 4, 'live_gets': 4}
+
+
+def test_lightpath_coalesce():
+    dev = LightpathSignals(name='dev', input_branches=['L0'],
+                           output_branches=['L0'])
+    dev.lightpath_coalesce_window = 0.05
+    states = []
+
+    def state_cb(state, old_state, **kwargs):
+        states.append(state)
+
+    dev.subscribe(state_cb, event_type=dev.SUB_LIGHTPATH_STATE, run=False)
+    dev.sig2.put(1.0)
+    for value in (1, 2, 3):
+        dev.sig1.put(value)
+
+    def wait_for_computations(count):
+        deadline = time.monotonic() + 2
+        while dev.lightpath_calc_stats['computations'] < count:
+            assert time.monotonic() < deadline, 'Coalesced update never ran'
+            time.sleep(0.01)
+
+    wait_for_computations(1)
+    assert dev.lightpath_calc_stats == {'computations': 1, 'suppressions': 2}
+    assert len(states) == 1
+    assert states[0].inserted
+
+    # Recalculated, but unchanged: no new state notification
+    dev.sig1.put(4)
+    wait_for_computations(2)
+    assert len(states) == 1
+
+    dev.sig1.put(0)
+    wait_for_computations(3)
+    assert len(states) == 2
+    assert states[1].removed
+
+
+class SlowSignal(ophyd.Signal):
+    """Signal with a get that takes ``delay`` seconds."""
+    delay = 0.2
+
+    def get(self, **kwargs):
+        time.sleep(self.delay)
+        return super().get(**kwargs)
+
+
+class SlowStatusDevice(BaseInterface, ophyd.Device):
+    fast = ophyd.Component(ophyd.Signal, value=1)
+    slow1 = ophyd.Component(SlowSignal, value=2)
+    slow2 = ophyd.Component(SlowSignal, value=3)
+    slow3 = ophyd.Component(SlowSignal, value=4)
+    hung = ophyd.Component(SlowSignal, value=5)
+
+
+@pytest.mark.timeout(10)
+def test_concurrent_status_info():
+    dev = SlowStatusDevice(name='dev')
+    serial = dev.status_info()
+
+    dev.status_info_workers = 4
+    start = time.monotonic()
+    concurrent = dev.status_info()
+    elapsed = time.monotonic() - start
+    assert concurrent == serial
+    # All four slow reads run at the same time
+    assert elapsed < 0.6
+
+    dev.hung.delay = 5
+    dev.status_info_timeout = 0.5
+    start = time.monotonic()
+    info = dev.status_info()
+    assert time.monotonic() - start < 2
+    assert info['hung']['value'] == STATUS_TIMEOUT
+    assert info['slow3']['value'] == 4
+    assert 'hung: TIMEOUT' in dev.format_status_info(info)
+
+
+@pytest.mark.timeout(10)
+def test_concurrent_status_info_all_stuck():
+    dev = SlowStatusDevice(name='dev')
+    for sig in (dev.slow1, dev.slow2, dev.slow3, dev.hung):
+        sig.delay = 5
+    dev.status_info_workers = 2
+    dev.status_info_timeout = 0.3
+    start = time.monotonic()
+    info = dev.status_info()
+    assert time.monotonic() - start < 2
+    attrs = ('slow1', 'slow2', 'slow3', 'hung')
+    values = [info[attr]['value'] for attr in attrs]
+    assert values == [STATUS_TIMEOUT] * 4
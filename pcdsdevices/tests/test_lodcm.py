@@ -8,7 +8,8 @@ from ophyd.sim import make_fake_device
 from ..epics_motor import OffsetMotor
 from ..lodcm import (CHI1, CHI2, H1N, H2N, LODCM, Y1, Y2, Dectris, Diode, Foil,
                      LODCMEnergyC, LODCMEnergySi, SimFirstTower, SimLODCM,
-                     SimSecondTower, YagLom)
+                     SimSecondTower, YagLom, clear_lodcm_caches,
+                     get_lom_geometry)
 
 logger = logging.getLogger(__name__)
 
@@ -373,6 +374,37 @@ def test_get_reflection_tower2(fake_tower2):
                 tower2.get_reflection()
 
 
+def test_tower_crystal_cache(fake_tower1):
+    tower1 = fake_tower1
+    assert tower1.get_reflection() == (1, 1, 1)
+    # Cached, so neither the reflection nor the states are read again
+    with patch.object(tower1.diamond_reflection, 'get') as get:
+        with patch.object(type(tower1.y1_state), 'position', 'Si'):
+            assert tower1.get_reflection() == (1, 1, 1)
+            assert tower1.get_material() == 'C'
+            get.assert_not_called()
+    # Changes are seen through the subscriptions
+    tower1.diamond_reflection.sim_put((2, 2, 0))
+    assert tower1.get_reflection() == (2, 2, 0)
+    tower1.y1_state.move('Si')
+    tower1.chi1_state.move('Si')
+    assert tower1.get_material() == 'Si'
+    assert tower1.get_reflection() == (1, 1, 1)
+
+
+def test_lom_geometry_cache():
+    clear_lodcm_caches()
+    with patch('pcdsdevices.lodcm.diffraction') as diffraction:
+        diffraction.get_lom_geometry.return_value = (1.0, 2.0)
+        assert get_lom_geometry(10, 'Si', [1, 1, 1]) == (1.0, 2.0)
+        assert get_lom_geometry(10.0, 'Si', (1, 1, 1)) == (1.0, 2.0)
+        diffraction.get_lom_geometry.assert_called_once_with(
+            10000.0, 'Si', (1, 1, 1))
+        get_lom_geometry(10, 'C', (1, 1, 1))
+        assert diffraction.get_lom_geometry.call_count == 2
+    clear_lodcm_caches()
+
+
 def test_get_reflection_lodcm(fake_lodcm):
     lodcm = fake_lodcm
     # as of now tower 1: (1, 1, 1), tower 2: (1, 1, 1) - match
@@ -8,9 +8,9 @@ from ophyd.device import Component as Cpt
 from ophyd.positioner import SoftPositioner
 from ophyd.sim import make_fake_device
 
-from ..pseudopos import (DelayBase, LookupTablePositioner, OffsetMotorBase,
-                         PseudoSingleInterface, SimDelayStage, SyncAxesBase,
-                         SyncAxis, SyncAxisOffsetMode)
+from ..pseudopos import (DelayBase, LookupTable, LookupTablePositioner,
+                         OffsetMotorBase, PseudoSingleInterface, SimDelayStage,
+                         SyncAxesBase, SyncAxis, SyncAxisOffsetMode)
 from ..sim import FastMotor
 
 logger = logging.getLogger(__name__)
@@ -233,6 +233,90 @@ def test_lut_positioner():
     assert lut.pseudo.limits == (40, 400)
 
 
+def test_lookup_table():
+    logger.debug('test_lookup_table')
+    # decreasing and unsorted columns are sorted for each direction
+    table = np.asarray([[2, 60], [0, 80], [1, 70], [3, 50]])
+    lookup = LookupTable(table, ['real', 'pseudo'])
+    assert lookup.interpolate('pseudo', 'real', 75) == 0.5
+    assert lookup.interpolate('real', 'pseudo', 2.5) == 55
+    np.testing.assert_allclose(
+        lookup.interpolate('pseudo', 'real', np.array([50, 65, 80, 100])),
+        [3, 1.5, 0, 0],
+    )
+    assert isinstance(lookup.interpolate('real', 'pseudo', 1), float)
+
+    for kind in ('cubic', 'pchip'):
+        curve = np.column_stack([np.linspace(0, 3, 31),
+                                 np.linspace(0, 3, 31) ** 2])
+        lookup = LookupTable(curve, ['x', 'y'], kind=kind)
+        np.testing.assert_allclose(lookup.interpolate('x', 'y', [1.25, 2.05]),
+                                   [1.5625, 4.2025], rtol=1e-3)
+        # clipped to the table like the linear interpolation
+        assert lookup.interpolate('x', 'y', 5) == pytest.approx(9)
+
+    lookup = LookupTable([[0, 1], [1, 1], [2, 3]], ['a', 'b'])
+    assert lookup.interpolate('a', 'b', 1.5) == 2
+    with pytest.raises(ValueError):
+        lookup.interpolate('b', 'a', 1)
+    # repeats that are not in neighbouring rows are caught too
+    for kind in LookupTable.kinds:
+        lookup = LookupTable([[1, 10], [2, 20], [1, 30], [3, 40]],
+                             ['a', 'b'], kind=kind)
+        with pytest.raises(ValueError, match='repeated'):
+            lookup.interpolate('a', 'b', 1)
+    with pytest.raises(ValueError):
+        LookupTable([[0, np.nan], [1, 2]], ['a', 'b'])
+    with pytest.raises(ValueError):
+        LookupTable([[0, 1], [1, 2]], ['a', 'b'], kind='quintic')
+
+
+def test_lut_positioner_multiple_axes():
+    logger.debug('test_lut_positioner_multiple_axes')
+
+    class MyLUTPositioner(LookupTablePositioner):
+        pseudo = Cpt(PseudoSingleInterface)
+        other = Cpt(PseudoSingleInterface)
+        real = Cpt(SoftPositioner, init_pos=0)
+        real2 = Cpt(SoftPositioner, init_pos=0)
+
+    table = np.asarray(
+        [[0, 40, 10, 4],
+         [1, 50, 20, 3],
+         [2, 60, 30, 2],
+         [3, 70, 40, 1]]
+    )
+    lut = MyLUTPositioner('', table=table,
+                          column_names=['real', 'pseudo', 'real2', 'other'],
+                          name='lut')
+    assert lut.forward(lut.PseudoPosition(pseudo=55, other=0)) == (1.5, 25)
+    assert lut.inverse((2.5, 35)) == (65, 1.5)
+
+    lut.move(lut.PseudoPosition(pseudo=60, other=2), wait=True)
+    assert lut.real.position == 2
+    assert lut.real2.position == 30
+    assert lut.other.position == 2
+
+    lut = MyLUTPositioner('', table=table,
+                          column_names=['real', 'pseudo', 'real2', 'other'],
+                          forward_column='other', inverse_column='real2',
+                          name='lut2')
+    assert lut.forward(lut.PseudoPosition(pseudo=0, other=3.5)) == (0.5, 15)
+    assert lut.inverse((0, 15)) == (45, 3.5)
+    with pytest.raises(ValueError):
+        MyLUTPositioner('', table=table,
+                        column_names=['real', 'pseudo', 'real2', 'other'],
+                        forward_column='real', name='lut3')
+
+    # unusable lookup columns are rejected when the positioner is built
+    repeated = table.copy()
+    repeated[2, 1] = 40
+    with pytest.raises(ValueError, match='repeated'):
+        MyLUTPositioner('', table=repeated,
+                        column_names=['real', 'pseudo', 'real2', 'other'],
+                        name='lut4')
+
+
 FakeDelayBase = make_fake_device(DelayBase)
 
 
@@ -1,12 +1,14 @@
 import logging
 
+import numpy as np
 import pytest
 from bluesky import RunEngine
 from bluesky.plan_stubs import sleep
 from bluesky.preprocessors import fly_during_wrapper, run_wrapper
 from ophyd.sim import NullStatus, make_fake_device
 
-from ..sequencer import EventSequencer
+from ..sequencer import (EventSequencer, SequenceWriteError, periodic_sequence,
+                         sequence_array)
 
 logger = logging.getLogger(__name__)
 
@@ -46,10 +48,7 @@ class SimSequencer(FakeSequencer):
         self.sequence.bc_array.sim_put([0] * 2048)
 
         # Initialize sequence
-        initial_sequence = [[0] * 20,
-                            [0] * 20,
-                            [0] * 20,
-                            [0] * 20]
+        initial_sequence = [[0] * 4] * 20
         self.sequence.put_seq(initial_sequence)
 
     def kickoff(self):
@@ -180,6 +179,54 @@ def test_sequence_get_put():
     assert curr_seq == dummy_sequence
 
 
+def test_sequence_array_put():
+    seq = SimSequencer('ECS:TST:100', name='seq')
+    sequence = sequence_array([182, 170, 169], delta_beam=[12, 2, 1])
+    assert seq.sequence.put_array(sequence) == ['beam_code', 'delta_beam']
+    assert seq.sequence_length.get() == 3
+    np.testing.assert_array_equal(seq.sequence.get_array(), sequence)
+    assert seq.sequence.get_seq() == [[182, 12, 0, 0], [170, 2, 0, 0],
+                                      [169, 1, 0, 0]]
+
+    # Only the changed waveforms are written
+    seq.sequence.seq_proc.put(0)
+    sequence['burst_count'] = 1
+    assert seq.sequence.put_array(sequence) == ['burst_count']
+    assert seq.sequence.seq_proc.get() == 1
+    seq.sequence.seq_proc.put(0)
+    assert seq.sequence.put_array(sequence) == []
+    assert seq.sequence.seq_proc.get() == 0
+    # Shortening to a prefix only changes the length, which still updates
+    assert seq.sequence.put_array(sequence[:2]) == []
+    assert seq.sequence_length.get() == 2
+    assert seq.sequence.seq_proc.get() == 1
+    np.testing.assert_array_equal(seq.sequence.get_array(), sequence[:2])
+
+    with pytest.raises(ValueError):
+        seq.sequence.put_array(np.zeros(3))
+    with pytest.raises(ValueError):
+        seq.sequence.put_seq([[0] * 20] * 4)
+
+    # The IOC does not take the new beam codes
+    seq.sequence.ec_array.put = lambda value, **kwargs: None
+    sequence['beam_code'] = 140
+    with pytest.raises(SequenceWriteError):
+        seq.sequence.put_array(sequence)
+
+
+def test_periodic_sequence():
+    sequence = periodic_sequence([90, 91], [2, 1], num_shots=4)
+    np.testing.assert_array_equal(sequence['beam_code'], [90, 91, 91, 90, 91,
+                                                          91])
+    np.testing.assert_array_equal(sequence['delta_beam'], [1, 0, 1, 1, 0, 1])
+    # Looping keeps the period when the offset leaves shots at the end
+    sequence = periodic_sequence(95, 3, num_shots=6, offsets=1)
+    np.testing.assert_array_equal(sequence['delta_beam'], [3, 3])
+    assert len(periodic_sequence(95, 10, num_shots=6, offsets=8)) == 0
+    with pytest.raises(ValueError):
+        periodic_sequence(95, 0, num_shots=6)
+
+
 @pytest.mark.timeout(5)
 def test_seq_disconnected():
     EventSequencer('ECS:TST:100', name='seq')
@@ -4,6 +4,7 @@ import time
 from typing import Any
 from unittest.mock import MagicMock, Mock
 
+import numpy as np
 import pytest
 from ophyd import Component as Cpt
 from ophyd import Device
@@ -12,9 +13,9 @@ from ophyd.sim import FakeEpicsSignal
 from ophyd.status import Status
 
 from .. import signal as signal_module
-from ..signal import (AggregateSignal, AvgSignal, MultiDerivedSignal,
-                      MultiDerivedSignalRO, PytmcSignal, ReadOnlyError,
-                      SignalEditMD, UnitConversionDerivedSignal)
+from ..signal import (AggregateSignal, AvgSignal, AvgStatSignal,
+                      MultiDerivedSignal, MultiDerivedSignalRO, PytmcSignal,
+                      ReadOnlyError, SignalEditMD, UnitConversionDerivedSignal)
 from ..type_hints import OphydDataType, SignalToValue
 
 logger = logging.getLogger(__name__)
@@ -60,6 +61,77 @@ def test_avg_signal():
     assert cb.called
 
 
+def test_avg_signal_statistics():
+    logger.debug('test_avg_signal_statistics')
+    sig = Signal(name='raw')
+    avg = AvgSignal(sig, 4, name='avg',
+                    statistics=['std', 'min', 'max', 'median', 'ema'])
+    rng = np.random.default_rng(0)
+    values = rng.normal(1e6, 3, size=50)
+    values[[5, 17]] = np.nan
+    ema = np.nan
+    for idx, value in enumerate(values):
+        sig.put(value)
+        window = values[max(idx - 3, 0):idx + 1]
+        if not np.isnan(value):
+            ema = value if np.isnan(ema) else ema + 0.4 * (value - ema)
+        np.testing.assert_allclose(avg.get(), np.nanmean(window))
+        np.testing.assert_allclose(avg.get_statistic('std'),
+                                   np.nanstd(window), atol=1e-6)
+        assert avg.get_statistic('min') == np.nanmin(window)
+        assert avg.get_statistic('max') == np.nanmax(window)
+        assert avg.get_statistic('median') == np.nanmedian(window)
+        np.testing.assert_allclose(avg.get_statistic('ema'), ema)
+    np.testing.assert_array_equal(avg.window_values, values[-4:])
+    # The deprecated ring buffer view starts at the write index
+    with pytest.warns(DeprecationWarning):
+        index = avg.index
+    with pytest.warns(DeprecationWarning):
+        ring = avg.values
+    assert index == 50 % 4
+    np.testing.assert_array_equal(np.roll(ring, -index), values[-4:])
+
+    with pytest.raises(ValueError):
+        avg.track('mode')
+    avg.averages = 4
+    assert np.isnan(avg.get_statistic('min'))
+
+
+def test_avg_signal_duration():
+    logger.debug('test_avg_signal_duration')
+    sig = Signal(name='raw')
+    avg = AvgSignal(sig, 100, duration=1.0, name='avg')
+    for timestamp, value in ((0, 1), (0.5, 3), (1.2, 5), (3, 7)):
+        sig.put(value, timestamp=timestamp)
+    assert avg.get() == 7
+    sig.put(9, timestamp=3.5)
+    assert avg.get() == 8
+    assert len(avg.window_values) == 2
+    # The deprecated view keeps room for `averages` values
+    with pytest.warns(DeprecationWarning):
+        ring = avg.values
+    assert len(ring) == 100
+    np.testing.assert_array_equal(ring[:5], [np.nan] * 3 + [7, 9])
+
+
+def test_avg_stat_signal():
+    logger.debug('test_avg_stat_signal')
+
+    class AvgDevice(Device):
+        raw = Cpt(Signal, value=0.)
+        avg = Cpt(AvgSignal, 'raw', averages=3)
+        high = Cpt(AvgStatSignal, 'avg', statistic='max')
+
+    dev = AvgDevice(name='dev')
+    assert dev.avg.statistics == ('max',)
+    for value in (1., 5., 2., 3.):
+        dev.raw.put(value)
+    assert dev.avg.get() == pytest.approx(10 / 3)
+    assert dev.high.get() == 5
+    dev.raw.put(1.)
+    assert dev.high.get() == 3
+
+
 class MockCallbackHelper:
     """
     Simple helper for getting a callback, setting an event, and checking args.
@@ -566,3 +638,24 @@ def test_multi_derived_connectivity_without_subs(any_multi_derived):
     assert any_multi_derived.connected
     any_multi_derived.destroy()
     assert not any_multi_derived.cpt.connected
+
+
+def test_aggregate_signal_running_counts(multi_derived_rw: Device):
+    cpt = multi_derived_rw.cpt
+    cpt.wait_for_connection()
+    assert cpt._num_connected == 3
+    assert cpt._num_with_values == 3
+    assert cpt._num_ready == 3
+    assert cpt.connected
+
+    cpt._signal_meta_callback(obj=multi_derived_rw.a, connected=False)
+    assert cpt._num_connected == 2
+    assert cpt._num_with_values == 3
+    assert cpt._num_ready == 2
+    assert not cpt.connected
+
+    cpt._signal_meta_callback(obj=multi_derived_rw.a, connected=True)
+    multi_derived_rw.b.sim_put(5)
+    assert cpt._num_ready == 3
+    assert cpt.connected
+    assert cpt.get() == 1 + 5 + 3
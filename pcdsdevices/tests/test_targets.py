@@ -4,7 +4,9 @@ import yaml
 from ophyd.sim import make_fake_device
 
 from ..sim import FastMotor
-from ..targets import (XYGridStage, convert_to_physical, get_unit_meshgrid,
+from ..targets import (SampleGridFile, XYGridStage, compute_target_map,
+                       convert_grid_to_sample, convert_sample_to_grid,
+                       convert_to_physical, get_unit_meshgrid,
                        mesh_interpolation, snake_grid_list)
 
 
@@ -473,3 +475,149 @@ def test_set_status(fake_grid_stage, sample_file):
 
     with pytest.raises(IndexError):
         stage.set_status(1, 5, False, 'test_sample')
+
+
+def test_compute_target_map():
+    coeffs = [-20.59, 0.755, 0.417, -0.005, 26.41, -0.006, 25.0, -0.012]
+    xx, yy = compute_target_map(7, 4, coeffs)
+    assert xx.shape == yy.shape == (7, 4)
+    logic_x, logic_y = get_unit_meshgrid(m_rows=7, n_columns=4)
+    for m in range(7):
+        for n in range(4):
+            # Must be exactly equal, statuses are matched by position
+            assert (xx[m, n], yy[m, n]) == convert_to_physical(
+                coeffs[:4], coeffs[4:], logic_x[m][n], logic_y[m][n])
+
+
+def test_target_map_cached(fake_grid_stage):
+    stage = fake_grid_stage
+    first = stage.get_target_map()
+    assert stage.get_target_map() is first
+    assert stage.compute_mapped_point(2, 3) == (first[0][1, 2],
+                                                first[1][1, 2])
+    stage.coefficients = [0.0, 8.0, 0.0, 0.0, 0.0, 0.0, 8.0, 0.0]
+    assert stage.get_target_map() is not first
+    assert stage.compute_mapped_point(2, 3) == (4.0, 2.0)
+
+
+def test_set_status_batched(fake_grid_stage, sample_file):
+    stage = fake_grid_stage
+    stage.status_batch_size = 3
+    stage.load('test_sample')
+
+    def file_statuses():
+        info = stage.get_sample_data('test_sample')
+        return [x['status'] for x in info['xx']]
+
+    original = file_statuses()
+    stage.set_status(1, 1, False)
+    stage.set_status(2, 1, True)
+    # Not written yet, but already visible
+    assert file_statuses() == original
+    assert stage.is_target_shot(1, 1) is False
+    assert stage.is_target_shot(2, 1) is True
+    # Not part of the file
+    assert stage.is_target_shot(3, 1) is None
+
+    stage.flush_statuses()
+    # Row 2 is stored in snake order, so column 1 is the last entry
+    assert file_statuses() == [False, True, True, True,
+                               False, False, False, True]
+
+    stage.set_status(1, 2, False)
+    stage.set_status(1, 3, False)
+    assert file_statuses()[1:3] == [True, True]
+    stage.set_status(1, 4, False)
+    assert file_statuses()[:4] == [False, False, False, False]
+
+
+def test_sample_grid_file_convert(sample_file, tmp_path):
+    grid_path = convert_sample_to_grid(sample_file)
+    assert grid_path == str(sample_file.with_suffix('.grid'))
+    grid_file = SampleGridFile(grid_path, mode='r')
+    assert grid_file.metadata['sample_name'] == 'test_sample'
+    assert grid_file.status.shape == (101, 4)
+    x, y = compute_target_map(101, 4, grid_file.metadata['coefficients'])
+    assert np.allclose(grid_file.x, x)
+    assert np.allclose(grid_file.y, y)
+    assert grid_file.status[0].tolist() == [True] * 4
+    assert grid_file.status[1:].sum() == 0
+
+    yaml_path = convert_grid_to_sample(grid_path, tmp_path / 'back.yml')
+    with open(yaml_path) as fd:
+        data = yaml.safe_load(fd)['test_sample']
+    assert data['M'] == 101 and data['N'] == 4
+    assert len(data['xx']) == len(data['yy']) == 404
+    # snake order, as written by save_grid
+    assert np.isclose(data['xx'][4]['pos'], x[1, 3])
+    assert [entry['status'] for entry in data['xx'][:5]] == [True] * 4 + [
+        False]
+
+
+def test_sample_grid_file_stage(fake_grid_stage, sample_file):
+    stage = fake_grid_stage
+    convert_sample_to_grid(sample_file)
+    assert stage.get_samples() == ['test_sample']
+    stage.load('test_sample')
+    assert stage.current_sample_path.endswith('test_sample.grid')
+    assert stage.is_target_shot(1, 4) is True
+    assert stage.is_target_shot(60, 2) is False
+
+    stage.set_status(60, 2, True)
+    other = SampleGridFile(stage.current_sample_path, mode='r')
+    assert other.status[59, 1]
+    assert stage.get_sample_data('test_sample')['M'] == 101
+
+    stage.reset_statuses('test_sample')
+    assert not other.status.any()
+    assert stage.is_target_shot(1, 1) is False
+
+    stage.sample_format = 'grid'
+    stage.save_grid('new_sample')
+    new_file = SampleGridFile(sample_file.parent / 'new_sample.grid')
+    assert new_file.status.shape == (101, 4)
+    assert not new_file.status.any()
+    assert not (sample_file.parent / 'new_sample.yml').exists()
+
+
+def test_iter_targets(fake_grid_stage, sample_file):
+    stage = fake_grid_stage
+    stage.load('test_sample')
+    targets = stage.iter_targets()
+    # the first row is shot
+    assert next(targets)[:2] == (2, 4)
+    stage.set_status(2, 3, True)
+    assert next(targets)[:2] == (2, 2)
+    assert next(targets)[:2] == (2, 1)
+    assert next(targets)[:2] == (3, 1)
+
+    m, n, x, y = stage.next_targets(3, start=(5, 3))
+    assert m.tolist() == [5, 5, 6]
+    assert n.tolist() == [3, 4, 4]
+    xx, yy = stage.get_target_map()
+    assert x.tolist() == [xx[4, 2], xx[4, 3], xx[5, 3]]
+    assert y.tolist() == [yy[4, 2], yy[4, 3], yy[5, 3]]
+
+    with pytest.raises(ValueError):
+        stage.iter_targets(order='random')
+
+
+def test_iter_targets_nearest(fake_grid_stage):
+    stage = fake_grid_stage
+    stage.m_n_points = 3, 3
+    stage.x.set(8.1)
+    stage.y.set(0)
+    order = [(m, n) for m, n, _, _ in stage.iter_targets(order='nearest')]
+    # the grid spacing is 2, along x for n and along y for m
+    assert order == [(1, 3), (1, 2), (1, 1), (2, 1), (2, 2), (2, 3),
+                     (3, 3), (3, 2), (3, 1)]
+    xx, yy = stage.get_target_map()
+    travel = 0
+    for (m0, n0), (m1, n1) in zip(order, order[1:]):
+        travel += np.hypot(xx[m1 - 1, n1 - 1] - xx[m0 - 1, n0 - 1],
+                           yy[m1 - 1, n1 - 1] - yy[m0 - 1, n0 - 1])
+    assert np.isclose(travel, 8 * 2)
+
+    m, n, _, _ = stage.next_targets(2, order='nearest', start=(2, 2))
+    assert (m[0], n[0]) == (2, 2)
+    assert len(m) == 2
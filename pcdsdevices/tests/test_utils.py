@@ -3,16 +3,22 @@ import sys
 import threading
 import time
 
+import numpy as np
 import pytest
+import sympy.physics.units as units
 from ophyd import Component as Cpt
 from ophyd import Device, Signal
+from ophyd.status import Status
 
 from .. import utils
 from ..device import GroupDevice
 from ..pv_positioner import PVPositionerDone
-from ..utils import (move_subdevices_to_start, post_ophyds_to_elog,
-                     reorder_components, set_many, set_standard_ordering,
-                     sort_components_by_kind, sort_components_by_name)
+from ..utils import (AllStatus, TaskScheduler, convert_unit,
+                     format_ophyds_to_html, map_with_timeouts,
+                     move_subdevices_to_start, post_ophyds_to_elog,
+                     reorder_components, schedule_task, set_many,
+                     set_standard_ordering, sort_components_by_kind,
+                     sort_components_by_name)
 
 try:
     import pty
@@ -158,6 +164,67 @@ def test_ophyd_to_elog(elog):
             assert post[0][0].count('<'+tag) == post[0][0].count('</'+tag)
 
 
+class SlowStatus:
+    """Minimal object with a slow status method."""
+    parent = None
+
+    def __init__(self, name, delay=0.0, fail=False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+
+    def status(self):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError('status failed')
+        return f'{self.name} status'
+
+
+@pytest.mark.timeout(10)
+def test_format_ophyds_to_html_concurrent():
+    objs = [
+        [SlowStatus(f'dev{idx}', delay=0.1) for idx in range(8)],
+        [SlowStatus('broken', fail=True)],
+        SlowStatus('last'),
+    ]
+    serial = format_ophyds_to_html(objs)
+    assert serial.count('<pre>') == 9
+    # The group with only a failed device is dropped
+    assert serial.count("class='parent'") == 2
+
+    progress = []
+    start = time.monotonic()
+    concurrent = format_ophyds_to_html(
+        objs, max_workers=8, progress=lambda *args: progress.append(args))
+    assert time.monotonic() - start < 0.5
+    assert concurrent == serial
+    assert progress[-1] == (10, 10)
+
+    objs[0][0].delay = 5
+    html = format_ophyds_to_html(objs, max_workers=4, timeout=0.5)
+    assert html.count('<pre>') == 9
+    assert '<pre>TIMEOUT</pre>' in html
+
+
+@pytest.mark.timeout(10)
+def test_map_with_timeouts():
+    def func(delay):
+        if delay < 0:
+            raise ValueError(delay)
+        time.sleep(delay)
+        return delay
+
+    futures = map_with_timeouts(func, [0, 0.1, -1, 5, 0], max_workers=2,
+                                timeout=0.5)
+    assert futures[0].result() == 0
+    assert futures[1].result() == 0.1
+    with pytest.raises(ValueError):
+        futures[2].result()
+    assert futures[3] is None
+    assert futures[4].result() == 0
+    assert map_with_timeouts(func, []) == []
+
+
 class SampleSub(Device):
     sig = Cpt(Signal)
 
@@ -288,3 +355,144 @@ def test_set_many():
     assert device.done.get() == 1
     assert device.setpoint.get() == 5
     assert device.another_signal.get() == 7
+
+
+def sympy_convert_unit(value, unit, new_unit):
+    """The original, fully symbolic convert_unit implementation."""
+    unit = getattr(units, unit)
+    new_unit = getattr(units, new_unit)
+    if unit == new_unit:
+        return value
+    new_value = value * units.convert_to(unit, new_unit)
+    return float(new_value.as_coeff_Mul()[0])
+
+
+@pytest.mark.parametrize(
+    'unit, new_unit',
+    [
+        ('s', 'ns'), ('ns', 's'), ('seconds', 'ns'), ('seconds', 'ps'),
+        ('ps', 'seconds'), ('s', 's'), ('meters', 'mm'), ('mm', 'meters'),
+        ('meters', 'um'), ('um', 'meters'), ('mm', 'um'), ('degree', 'radian'),
+    ]
+)
+def test_convert_unit_matches_sympy(unit, new_unit):
+    rng = np.random.default_rng(0)
+    values = [0, 1, -7, 123456789, 1.5, -2.25e-12, np.float64(3.3)]
+    values.extend(rng.uniform(-1e3, 1e3, 50))
+    values.extend(rng.uniform(-1, 1, 50) * 10. ** rng.integers(-15, 15, 50))
+    for value in values:
+        expected = sympy_convert_unit(value, unit, new_unit)
+        result = convert_unit(value, unit, new_unit)
+        assert result == expected
+        assert type(result) is type(expected)
+
+
+def test_convert_unit_array():
+    values = np.linspace(-1, 1, 11)
+    result = convert_unit(values, 'ns', 's')
+    assert isinstance(result, np.ndarray)
+    np.testing.assert_array_equal(
+        result, [convert_unit(value, 'ns', 's') for value in values]
+    )
+    assert convert_unit(values, 's', 's') is values
+
+
+def test_schedule_task_delay():
+    done = threading.Event()
+    task = schedule_task(done.set, delay=0.05)
+    assert not task.cancelled
+    assert done.wait(timeout=2)
+
+
+def test_schedule_task_cancel():
+    ran = threading.Event()
+    task = schedule_task(ran.set, delay=0.1)
+    task.cancel()
+    assert task.cancelled
+    assert not ran.wait(timeout=0.3)
+
+
+def test_task_scheduler_ordering_and_metrics():
+    scheduler = TaskScheduler(name='test_scheduler')
+    order = []
+    finished = threading.Event()
+
+    def dispatch(task):
+        task.run()
+        if len(order) == 2:
+            finished.set()
+
+    now = time.monotonic()
+    late = utils.ScheduledTask(order.append, ('late',), {}, due=now + 0.1)
+    early = utils.ScheduledTask(order.append, ('early',), {}, due=now + 0.05)
+    cancelled = utils.ScheduledTask(order.append, ('never',), {},
+                                    due=now + 0.01)
+    for task in (late, early, cancelled):
+        scheduler.schedule(task, dispatch)
+    cancelled.cancel()
+    assert scheduler.queue_depth == 2
+
+    assert finished.wait(timeout=2)
+    assert order == ['early', 'late']
+    metrics = scheduler.metrics()
+    assert metrics['queue_depth'] == 0
+    assert metrics['dispatched'] == 2
+    assert metrics['cancelled'] == 1
+    assert metrics['max_lateness'] >= 0
+
+
+@pytest.mark.timeout(30)
+def test_schedule_task_stress():
+    num_tasks = 10_000
+    count = 0
+    lock = threading.Lock()
+    finished = threading.Event()
+
+    def task():
+        nonlocal count
+        with lock:
+            count += 1
+            if count == num_tasks:
+                finished.set()
+
+    threads_before = threading.active_count()
+    for idx in range(num_tasks):
+        schedule_task(task, delay=0.01 + (idx % 100) * 0.001)
+    # One shared scheduler thread at most, not one thread per task
+    assert threading.active_count() <= threads_before + 1
+    assert finished.wait(timeout=20)
+    assert utils.task_scheduler.queue_depth == 0
+
+
+def test_set_many_all_status():
+    signals = [Signal(name=f'sig{idx}') for idx in range(10)]
+    st = set_many({sig: idx for idx, sig in enumerate(signals)})
+    assert isinstance(st, AllStatus)
+    st.wait(timeout=3)
+    assert st.success
+    assert st.remaining == 0
+    assert [sig.get() for sig in signals] == list(range(10))
+
+
+def test_all_status_failures():
+    statuses = [Status(), Status(timeout=0.1), Status()]
+    st = AllStatus(statuses)
+    statuses[0].set_finished()
+    assert st.remaining == 2
+    assert st.pending == statuses[1:]
+    # The second status times out
+    with pytest.raises(TimeoutError):
+        st.wait(timeout=1)
+    assert st.done
+    assert not st.success
+    assert st.failed == [statuses[1]]
+    assert st.timed_out == [statuses[1]]
+    statuses[2].set_exception(RuntimeError('failed'))
+    assert st.failed == statuses[1:]
+    assert st.timed_out == [statuses[1]]
+    assert statuses[2] in st
+
+
+def test_all_status_empty():
+    st = AllStatus([])
+    assert st.done and st.success
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import enum
+import fractions
+import heapq
+import importlib
 import inspect
 import logging
+import numbers
 import operator
 import select
 import shutil
@@ -11,13 +15,14 @@ import sys
 import threading
 import time
 from collections.abc import Iterable
-from functools import reduce
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                wait)
+from functools import lru_cache, reduce
 from types import MethodType
-from typing import Callable, Iterator, Union
+from typing import Callable, Iterator, Optional, Union
 
+import numpy as np
 import ophyd
-import prettytable
-import sympy.physics.units as units
 from ophyd.device import Component as Cpt
 from ophyd.device import Device
 from ophyd.ophydobj import Kind
@@ -34,6 +39,43 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+
+class LazyModule:
+    """
+    Stand-in for a module that is only imported on first attribute access.
+
+    Used for heavy dependencies that only a few code paths need, so that
+    importing pcdsdevices modules does not pay for them up front.
+
+    Parameters
+    ----------
+    name : str
+        The full module name, e.g. ``'sympy.physics.units'``.
+    """
+
+    def __init__(self, name: str):
+        self._lazy_name = name
+        self._lazy_module = None
+
+    def _load(self):
+        if self._lazy_module is None:
+            self._lazy_module = importlib.import_module(self._lazy_name)
+        return self._lazy_module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'loaded' if self._lazy_module is not None else 'not loaded'
+        return f'<LazyModule {self._lazy_name!r} ({state})>'
+
+
+prettytable = LazyModule('prettytable')
+units = LazyModule('sympy.physics.units')
+
 arrow_up = "\x1b[A"
 arrow_down = "\x1b[B"
 arrow_right = "\x1b[C"
@@ -135,13 +177,40 @@ def get_input():
 ureg = None
 
 
+@lru_cache(maxsize=256)
+def _unit_conversion_factor(
+    unit: str, new_unit: str
+) -> tuple[float, Optional[fractions.Fraction]] | None:
+    """
+    Resolve the multiplicative factor between two units, once per pair.
+
+    Returns ``None`` if the units are the same, otherwise a tuple of the
+    float factor and, if rational, the exact factor as a ``Fraction``.
+    """
+    unit = getattr(units, unit)
+    new_unit = getattr(units, new_unit)
+
+    if unit == new_unit:
+        return None
+
+    # Matches the coefficient previously taken from value * convert_to(...)
+    factor = units.convert_to(unit, new_unit).as_coeff_Mul()[0]
+    exact = None
+    if factor.is_Rational:
+        exact = fractions.Fraction(int(factor.p), int(factor.q))
+    return float(factor), exact
+
+
 def convert_unit(value: float, unit: str, new_unit: str):
     """
     One-line unit conversion.
 
+    The conversion factor for each pair of units is computed once with
+    ``sympy`` and cached, so repeated conversions are a multiplication.
+
     Parameters
     ----------
-    value : float
+    value : float or np.ndarray
         The starting value for the conversion.
 
     unit : str
@@ -152,18 +221,20 @@ def convert_unit(value: float, unit: str, new_unit: str):
 
     Returns
     -------
-    new_value : float
+    new_value : float or np.ndarray
         The starting value, but converted to the new unit.
     """
-    unit = getattr(units, unit)
-    new_unit = getattr(units, new_unit)
-
-    if unit == new_unit:
+    conversion = _unit_conversion_factor(unit, new_unit)
+    if conversion is None:
         return value
 
-    new_value = value * units.convert_to(unit, new_unit)
-
-    return float(new_value.as_coeff_Mul()[0])
+    factor, exact = conversion
+    if isinstance(value, np.ndarray):
+        return value * factor
+    if exact is not None and isinstance(value, numbers.Integral):
+        # Exact arithmetic for integers, as sympy would have done
+        return float(int(value) * exact)
+    return float(value * factor)
 
 
 def ipm_screen(dettype, prefix, prefix_ioc):
@@ -224,6 +295,165 @@ def get_component(obj):
     return getattr(type(obj.parent), obj.attr_name, None)
 
 
+class ScheduledTask:
+    """
+    Handle for a task scheduled with :func:`schedule_task`.
+
+    The task may be cancelled at any point before it starts running.
+    """
+
+    def __init__(self, func, args, kwargs, due: float):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        #: ``time.monotonic()`` value at which the task should be dispatched
+        self.due = due
+        self._cancelled = False
+        self._scheduler = None
+
+    @property
+    def cancelled(self) -> bool:
+        """Has the task been cancelled?"""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel the task, if it has not yet started running."""
+        if self._scheduler is not None:
+            self._scheduler._cancel(self)
+        self._cancelled = True
+
+    def run(self) -> None:
+        """Run the task now, unless it has been cancelled."""
+        if not self._cancelled:
+            self.func(*self.args, **self.kwargs)
+
+    def __repr__(self):
+        func = getattr(self.func, '__qualname__', self.func)
+        return (
+            f'<ScheduledTask {func} due={self.due:.3f} '
+            f'cancelled={self._cancelled}>'
+        )
+
+
+class TaskScheduler:
+    """
+    Dispatch delayed tasks from a single shared thread.
+
+    Tasks are kept in a heap ordered by due time.  When a task is due, the
+    scheduler thread calls its dispatch function, which hands the task off
+    to one of ophyd's dispatcher queues.  The thread is started on first use.
+    """
+
+    def __init__(self, name: str = 'pcdsdevices_scheduler'):
+        self.name = name
+        self._heap = []
+        self._sequence = 0
+        self._cond = threading.Condition()
+        self._thread = None
+        self._num_cancelled_pending = 0
+        self._num_dispatched = 0
+        self._num_cancelled = 0
+        self._total_lateness = 0.0
+        self._max_lateness = 0.0
+        self._first_dispatch = None
+
+    def schedule(
+        self,
+        task: ScheduledTask,
+        dispatch: Callable[[ScheduledTask], None],
+    ) -> ScheduledTask:
+        """Call ``dispatch(task)`` from the scheduler thread at ``task.due``."""
+        with self._cond:
+            task._scheduler = self
+            self._sequence += 1
+            heapq.heappush(self._heap,
+                           (task.due, self._sequence, task, dispatch))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name=self.name, daemon=True
+                )
+                self._thread.start()
+            elif self._heap[0][2] is task:
+                # New earliest task; wake up the scheduler to re-check
+                self._cond.notify()
+        return task
+
+    def _cancel(self, task: ScheduledTask) -> None:
+        with self._cond:
+            if not task._cancelled and task._scheduler is self:
+                self._num_cancelled_pending += 1
+                self._num_cancelled += 1
+                task._scheduler = None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    delay = self._heap[0][0] - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                due, _, task, dispatch = heapq.heappop(self._heap)
+                if task._scheduler is not self:
+                    # Cancelled while waiting
+                    self._num_cancelled_pending -= 1
+                    continue
+                task._scheduler = None
+                now = time.monotonic()
+                lateness = now - due
+                self._num_dispatched += 1
+                self._total_lateness += lateness
+                self._max_lateness = max(self._max_lateness, lateness)
+                if self._first_dispatch is None:
+                    self._first_dispatch = now
+            try:
+                dispatch(task)
+            except Exception:
+                logger.exception('Failed to dispatch scheduled task %s', task)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of tasks waiting to be dispatched."""
+        with self._cond:
+            return len(self._heap) - self._num_cancelled_pending
+
+    def metrics(self) -> dict[str, float]:
+        """
+        Scheduler statistics.
+
+        Returns
+        -------
+        metrics : dict
+            ``queue_depth``, the number of pending tasks; ``dispatched``
+            and ``cancelled`` task totals; ``mean_lateness`` and
+            ``max_lateness`` in seconds between due and dispatch time; and
+            ``tasks_per_second`` dispatched since the first dispatch.
+        """
+        with self._cond:
+            dispatched = self._num_dispatched
+            elapsed = (
+                time.monotonic() - self._first_dispatch
+                if self._first_dispatch is not None else 0.0
+            )
+            return {
+                'queue_depth': len(self._heap) - self._num_cancelled_pending,
+                'dispatched': dispatched,
+                'cancelled': self._num_cancelled,
+                'mean_lateness': (
+                    self._total_lateness / dispatched if dispatched else 0.0
+                ),
+                'max_lateness': self._max_lateness,
+                'tasks_per_second': dispatched / elapsed if elapsed else 0.0,
+            }
+
+
+#: The shared scheduler used by :func:`schedule_task` for delayed tasks
+task_scheduler = TaskScheduler()
+
+
 def schedule_task(func, args=None, kwargs=None, delay=None):
     """
     Use ophyd's dispatcher to schedule a task for later.
@@ -232,6 +462,14 @@ def schedule_task(func, args=None, kwargs=None, delay=None):
     Schedules a task for the utility thread if we're in some arbitrary thread,
     schedules a task for the same thread if we're in one of ophyd's callback
     queues already.
+
+    Delayed tasks wait in the shared :data:`task_scheduler` rather than each
+    in their own thread, and are handed to the dispatcher when due.
+
+    Returns
+    -------
+    task : ScheduledTask
+        A handle that can be used to cancel the task before it runs.
     """
     if args is None:
         args = ()
@@ -241,7 +479,7 @@ def schedule_task(func, args=None, kwargs=None, delay=None):
     dispatcher = ophyd.cl.get_dispatcher()
 
     # Check if we're already in an ophyd dispatcher thread
-    current_thread = threading.currentThread()
+    current_thread = threading.current_thread()
     matched_thread = None
     for name, thread in dispatcher.threads.items():
         if thread == current_thread:
@@ -249,21 +487,120 @@ def schedule_task(func, args=None, kwargs=None, delay=None):
             context = dispatcher.get_thread_context(matched_thread)
             break
 
-    def schedule():
+    def schedule(task):
         if matched_thread is not None and context.event_thread is not None:
             # Put into same queue
-            context.event_thread.queue.put((func, args, kwargs))
+            context.event_thread.queue.put((task.run, (), {}))
         else:
             # Put into utility queue
-            dispatcher.schedule_utility_task(func, *args, **kwargs)
+            dispatcher.schedule_utility_task(task.run)
 
+    task = ScheduledTask(func, args, kwargs,
+                         due=time.monotonic() + (delay or 0))
     if delay is None:
         # Do it right away
-        schedule()
+        schedule(task)
     else:
         # Do it later
-        timer = threading.Timer(delay, schedule)
-        timer.start()
+        task_scheduler.schedule(task, schedule)
+    return task
+
+
+def map_with_timeouts(
+    func: Callable,
+    items: Iterable,
+    max_workers: int = 8,
+    timeout: Optional[float] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    thread_name_prefix: str = 'map_with_timeouts',
+) -> list[Optional[Future]]:
+    """
+    Call ``func`` on each item using a bounded thread pool.
+
+    Each call may take ``timeout`` seconds, counted from when it starts.
+    Calls that take longer are given up on, and their threads are left to
+    finish in the background. If every worker is stuck on such a call,
+    the calls that have not started yet are given up on too, since nothing
+    is free to run them in time.
+
+    Parameters
+    ----------
+    func : callable
+        Called with a single item.
+    items : iterable
+        The items to call ``func`` with.
+    max_workers : int, optional
+        The maximum number of calls to run at once.
+    timeout : float, optional
+        The number of seconds each call may take. Defaults to no limit.
+    progress : callable, optional
+        Called as ``progress(done, total)`` from the calling thread each
+        time calls finish or are given up on.
+    thread_name_prefix : str, optional
+        Name prefix for the worker threads.
+
+    Returns
+    -------
+    futures : list of Future or None
+        One entry per item, in order. `None` marks a call that timed out,
+        the others are finished futures holding a result or an exception.
+    """
+    items = list(items)
+    results = [None] * len(items)
+    if not items:
+        return results
+    started = {}
+
+    def call(index, item):
+        started[index] = time.monotonic()
+        return func(item)
+
+    pool = ThreadPoolExecutor(max_workers=max_workers,
+                              thread_name_prefix=thread_name_prefix)
+    try:
+        futures = {
+            pool.submit(call, index, item): index
+            for index, item in enumerate(items)
+        }
+        remaining = set(futures)
+        stuck = set()
+        handled = 0
+        while remaining:
+            wait_time = None
+            if timeout is not None:
+                deadlines = [
+                    started[futures[fut]] + timeout for fut in remaining
+                    if futures[fut] in started
+                ]
+                if deadlines:
+                    wait_time = max(min(deadlines) - time.monotonic(), 0)
+                else:
+                    wait_time = timeout
+            done, _ = wait(remaining, timeout=wait_time,
+                           return_when=FIRST_COMPLETED)
+            for fut in done:
+                results[futures[fut]] = fut
+            remaining -= done
+
+            if timeout is not None:
+                now = time.monotonic()
+                for fut in list(remaining):
+                    start = started.get(futures[fut])
+                    if start is not None and now - start >= timeout:
+                        remaining.discard(fut)
+                        stuck.add(fut)
+                stuck = {fut for fut in stuck if not fut.done()}
+                if len(stuck) >= max_workers:
+                    remaining.clear()
+
+            if progress is not None:
+                new_handled = len(items) - len(remaining)
+                if new_handled != handled:
+                    handled = new_handled
+                    progress(handled, len(items))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return results
 
 
 def get_status_value(status_info, *keys, default_value="N/A"):
@@ -512,6 +849,98 @@ class HelpfulIntEnum(enum.IntEnum, metaclass=HelpfulIntEnumMeta):
         return set(cls.__members__.values()) - cls.include(identifiers)
 
 
+class AllStatus(ophyd.status.Status):
+    """
+    Status that finishes once all of its child statuses have finished.
+
+    Unlike a chain of ``AndStatus`` objects, this keeps all children in one
+    flat list and counts down as each one completes, so each completion is
+    O(1) regardless of the number of children.  As with ``AndStatus``, the
+    first failing child marks this status as failed without waiting for
+    the others.
+
+    Parameters
+    ----------
+    statuses : iterable of StatusBase
+        The child statuses.
+
+    **kwargs :
+        Passed to ``Status``, e.g. ``obj``, ``timeout`` or ``settle_time``.
+    """
+
+    def __init__(self, statuses, **kwargs):
+        self.statuses = list(statuses)
+        self._remaining = len(self.statuses)
+        super().__init__(**kwargs)
+        self._trace_attributes["num_statuses"] = len(self.statuses)
+        if not self.statuses:
+            self.set_finished()
+        for status in self.statuses:
+            status.add_callback(self._child_finished)
+
+    def _child_finished(self, status: ophyd.status.StatusBase) -> None:
+        with self._lock:
+            if self._externally_initiated_completion or self.done:
+                return
+            if not status.success:
+                exc = status.exception()
+                if isinstance(exc, (ophyd.status.StatusTimeoutError,
+                                    ophyd.status.WaitTimeoutError)):
+                    # These are reserved for a status' own timeout
+                    exc = TimeoutError(f"Child status timed out: {status}")
+                elif exc is None:
+                    exc = RuntimeError(f"Child status failed: {status}")
+                self.set_exception(exc)
+                return
+            self._remaining -= 1
+            if self._remaining == 0:
+                self.set_finished()
+
+    @property
+    def remaining(self) -> int:
+        """Number of child statuses yet to finish successfully."""
+        return self._remaining
+
+    @property
+    def pending(self) -> list[ophyd.status.StatusBase]:
+        """Child statuses that have not yet finished."""
+        return [status for status in self.statuses if not status.done]
+
+    @property
+    def failed(self) -> list[ophyd.status.StatusBase]:
+        """Child statuses that finished unsuccessfully, including timeouts."""
+        return [
+            status for status in self.statuses
+            if status.done and not status.success
+        ]
+
+    @property
+    def timed_out(self) -> list[ophyd.status.StatusBase]:
+        """Child statuses that failed by timing out."""
+        return [
+            status for status in self.failed
+            if isinstance(status.exception(), ophyd.status.StatusTimeoutError)
+        ]
+
+    def __contains__(self, status: ophyd.status.StatusBase) -> bool:
+        return any(
+            child == status or (
+                isinstance(child, (AllStatus, ophyd.status.AndStatus))
+                and status in child
+            )
+            for child in self.statuses
+        )
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(statuses={len(self.statuses)}, "
+            f"remaining={self._remaining}, done={self.done}, "
+            f"success={self.success})"
+        )
+
+    __str__ = __repr__
+
+
 def set_many(
     to_set: dict[ophyd.Signal, OphydDataType],
     *,
@@ -544,7 +973,7 @@ def set_many(
     Returns
     -------
     status : ophyd.Status.StatusBase
-        One Status or AndStatus instance that reflects the completion status of
+        One Status or AllStatus instance that reflects the completion status of
         the setting all signal to the provided values.
     """
     statuses = []
@@ -572,10 +1001,10 @@ def set_many(
         st.set_finished()
         return st
 
-    status = statuses[0]
-    for st in statuses[1:]:
-        status = ophyd.status.AndStatus(status, st)
-    return status
+    if len(statuses) == 1:
+        return statuses[0]
+
+    return AllStatus(statuses, obj=owner)
 
 
 def maybe_make_method(func: Callable | None, owner: object) -> Callable | None:
@@ -612,7 +1041,95 @@ def maybe_make_method(func: Callable | None, owner: object) -> Callable | None:
     return func
 
 
-def format_ophyds_to_html(obj, allow_child=False):
+def _is_status_target(obj, allow_child):
+    """Whether ``obj`` is a device whose status should be posted."""
+    return callable(getattr(obj, "status", None)) and (
+        (
+            getattr(obj, "parent", None) is None
+            and getattr(obj, "biological_parent", None) is None
+        )
+        or allow_child
+    )
+
+
+def _collect_html_tree(obj, allow_child, devices):
+    """
+    Build the nested (obj, items, children) tree for `format_ophyds_to_html`.
+
+    Leaves are indices into ``devices``, which is filled in along the way.
+    Returns `None` for objects that are ignored.
+    """
+    if isinstance(obj, Iterable):
+        items = list(obj)
+        children = []
+        for item in items:
+            child = _collect_html_tree(item, allow_child, devices)
+            if child is not None:
+                children.append(child)
+        return (obj, items, children)
+
+    # check if parent level ophyd object
+    elif _is_status_target(obj, allow_child):
+        devices.append(obj)
+        return len(devices) - 1
+
+    # fallback base case (if ignoring obj)
+    return None
+
+
+def _render_html_tree(node, devices, statuses, parts):
+    """Append the html for ``node`` to ``parts``."""
+    if isinstance(node, tuple):
+        obj, items, children = node
+        # Placeholder for the header, which needs the content to exist
+        start = len(parts)
+        parts.append("")
+        for child in children:
+            _render_html_tree(child, devices, statuses, parts)
+        # Don't return wrapping if there's no content
+        if len(parts) == start + 1:
+            del parts[start]
+            return
+
+        # HelpfulNamespaces tend to lack names, maybe they won't some day
+        parent_default = "Ophyd status: " + ", ".join(
+            "[...]" if isinstance(o, Iterable) else o.name for o in items
+        )
+        parent_name = getattr(obj, "__name__", parent_default[:60] + " ...")
+
+        # Wrap in a parent div, should be a namespace name
+        parts[start] = (
+            f"<button class='collapsible'>{parent_name}</button>"
+            "<div class='parent'>"
+        )
+        parts.append("</div>")
+    elif statuses[node] is not None:
+        parts.append(
+            f"<button class='collapsible'>{devices[node].name}</button>"
+            f"<div class='child content'><pre>{statuses[node]}</pre></div>"
+        )
+
+
+def _get_status_text(obj):
+    try:
+        return obj.status()
+    except Exception as ex:
+        logger.info(f"skipped {str(obj)}, due to Exception: {ex}")
+        return None
+
+
+def _print_progress(done, total):
+    end = "\n" if done == total else ""
+    print(f"\rCollected {done}/{total} device statuses", end=end, flush=True)
+
+
+def format_ophyds_to_html(
+    obj,
+    allow_child=False,
+    max_workers=None,
+    timeout=None,
+    progress=False,
+):
     """
     Recursively construct html that contains the output from .status() for
     each object provided.  Base case is being passed a single ophyd object
@@ -631,62 +1148,70 @@ def format_ophyds_to_html(obj, allow_child=False):
         Whether or not to post child devices to the elog.  Defaults to False,
         to keep long lists of devices concise
 
+    max_workers : int, optional
+        If provided, gather the ``.status()`` outputs concurrently with at
+        most this many threads.  By default they are gathered one at a time.
+
+    timeout : float, optional
+        When gathering concurrently, the number of seconds each device's
+        ``.status()`` may take.  Devices that take longer are posted with
+        ``TIMEOUT`` in place of their status.  Defaults to no limit.
+
+    progress : bool or callable, optional
+        If True, print a running count of the gathered statuses.  A callable
+        is instead called as ``progress(done, total)``.
+
     Returns
     -------
     out : string
         html body containing ophyd object representations (sans styling, JS)
     """
-    if isinstance(obj, Iterable):
-        content = ""
-
-        for o in obj:
-            content += format_ophyds_to_html(o, allow_child=allow_child)
-
-        # Don't return wrapping if there's no content
-        if content == "":
-            return content
-
-        # HelpfulNamespaces tend to lack names, maybe they won't some day
-        parent_default = "Ophyd status: " + ", ".join(
-            "[...]" if isinstance(o, Iterable) else o.name for o in obj
-        )
-        parent_name = getattr(obj, "__name__", parent_default[:60] + " ...")
-
-        # Wrap in a parent div
-        out = (
-            "<button class='collapsible'>"
-            + f"{parent_name}"  # should be a namespace name
-            + "</button><div class='parent'>"
-            + content
-            + "</div>"
-        )
-        return out
+    devices = []
+    tree = _collect_html_tree(obj, allow_child, devices)
+    if tree is None:
+        return ""
 
-    # check if parent level ophyd object
-    elif callable(getattr(obj, "status", None)) and (
-        (
-            getattr(obj, "parent", None) is None
-            and getattr(obj, "biological_parent", None) is None
+    if progress is True:
+        progress = _print_progress
+    elif not progress:
+        progress = None
+
+    if max_workers:
+        futures = map_with_timeouts(
+            _get_status_text,
+            devices,
+            max_workers=max_workers,
+            timeout=timeout,
+            progress=progress,
+            thread_name_prefix='elog_status',
         )
-        or allow_child
-    ):
-        content = ""
-        try:
-            content = (
-                f"<button class='collapsible'>{obj.name}</button>"
-                + f"<div class='child content'><pre>{obj.status()}</pre></div>"
-            )
-        except Exception as ex:
-            logger.info(f"skipped {str(obj)}, due to Exception: {ex}")
-
-        return content
-
-    # fallback base case (if ignoring obj)
+        statuses = []
+        for device, future in zip(devices, futures):
+            if future is None:
+                logger.info(f"status of {device.name} timed out")
+                statuses.append("TIMEOUT")
+            else:
+                statuses.append(future.result())
     else:
-        return ""
-
-
-def post_ophyds_to_elog(objs, allow_child=False, hutch_elog=None):
+        statuses = []
+        for device in devices:
+            statuses.append(_get_status_text(device))
+            if progress is not None:
+                progress(len(statuses), len(devices))
+
+    parts = []
+    _render_html_tree(tree, devices, statuses, parts)
+    return "".join(parts)
+
+
+def post_ophyds_to_elog(
+    objs,
+    allow_child=False,
+    hutch_elog=None,
+    max_workers=8,
+    timeout=10.0,
+    progress=False,
+):
     """
     Take a list of ophyd objects and post their status representations
     to the elog.  Handles singular objects, lists of objects, and
@@ -718,6 +1243,17 @@ def post_ophyds_to_elog(objs, allow_child=False, hutch_elog=None):
     hutch_elog : HutchELog, optional
         ELog instance to post to.  If not provided, will attempt to grab
         primary registered ELog instance
+
+    max_workers : int, optional
+        Number of threads used to gather the device statuses.  Defaults to
+        8.  Pass 0 or None to gather them one at a time.
+
+    timeout : float, optional
+        Number of seconds each device's ``.status()`` may take before it is
+        posted as ``TIMEOUT``.  Defaults to 10.
+
+    progress : bool or callable, optional
+        Report progress while gathering, see `format_ophyds_to_html`.
     """
     if hutch_elog is None:
         try:
@@ -730,7 +1266,13 @@ def post_ophyds_to_elog(objs, allow_child=False, hutch_elog=None):
     else:
         logger.info("Posting to provided elog")
 
-    post = format_ophyds_to_html(objs, allow_child=allow_child)
+    post = format_ophyds_to_html(
+        objs,
+        allow_child=allow_child,
+        max_workers=max_workers,
+        timeout=timeout,
+        progress=progress,
+    )
 
     if post == "":
         logger.info("No valid devices found, no post submitted")